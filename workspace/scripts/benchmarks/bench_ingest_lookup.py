@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark: artist/album folder lookup during ingest
+Compares the canonical-key index against the previous linear scan of the
+library (one iterdir + canonical key per artist folder, per ingested file)
+on a generated library, and checks both place every file identically.
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from synthlib import (album_name, artist_name, load_normalizer, make_folder_tree,
+                      quiet, write_flac, write_mp3)
+
+mln = load_normalizer()
+
+
+class LinearLookupNormalizer(mln.MusicLibraryNormalizer):
+    """Folder lookups as they were before the canonical-key index"""
+
+    def find_artist_folder(self, artist: str) -> Optional[Path]:
+        if not artist:
+            return None
+        canonical_artist = self.get_canonical_key(artist)
+        for item in self.music_dir.iterdir():
+            if not item.is_dir() or self.should_skip_dir(item.name):
+                continue
+            if self.get_canonical_key(item.name) == canonical_artist:
+                return item
+        return None
+
+    def find_album_folder(self, artist_folder: Path, album: str) -> Optional[Path]:
+        if not album or not artist_folder.exists():
+            return None
+        canonical_album = self.get_canonical_key(album)
+        for item in artist_folder.iterdir():
+            if not item.is_dir() or self.should_skip_dir(item.name):
+                continue
+            if self.get_canonical_key(item.name) == canonical_album:
+                return item
+        return None
+
+
+def make_workspace(root: Path, args) -> Path:
+    """Library of empty artist/album folders plus an ingest dir of tagged files"""
+    rng = random.Random(args.seed)
+    make_folder_tree(root / 'music', args.artists, args.albums)
+    ingest = root / 'ingest'
+    ingest.mkdir()
+
+    for i in range(args.files):
+        # Mostly existing artists/albums, spelled differently; some brand new ones
+        if rng.random() < args.new_rate:
+            artist, album = f"New Artist {i % 97}", f"New Album {i % 7}"
+        else:
+            artist = artist_name(rng.randrange(args.artists)).upper().replace(' ', '_')
+            album = album_name(rng.randrange(args.albums)).replace(' ', '. ')
+        writer = write_flac if i % 2 else write_mp3
+        ext = '.flac' if i % 2 else '.mp3'
+        writer(ingest / f"Track {i:05d}{ext}", artist, album, f"Track {i}", mcatalogid=f"id{i}")
+    return root
+
+
+def run_ingest(normalizer_class, root: Path) -> float:
+    normalizer = normalizer_class(str(root / 'music'), None, None, 'normal',
+                                  action='ingest', ingest_dir=str(root / 'ingest'))
+    start = time.perf_counter()
+    with quiet():
+        normalizer.run_ingest()
+    elapsed = time.perf_counter() - start
+    normalizer.close()
+    return elapsed
+
+
+def tree(root: Path):
+    return sorted(str(p.relative_to(root)) for p in root.rglob('*'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--artists', type=int, default=10000, help='Artist folders (default: 10000)')
+    parser.add_argument('--albums', type=int, default=2, help='Albums per artist (default: 2)')
+    parser.add_argument('--files', type=int, default=2000, help='Files to ingest (default: 2000)')
+    parser.add_argument('--new-rate', type=float, default=0.1,
+                        help='Fraction of files for artists not yet in the library (default: 0.1)')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='mln-bench-') as tmp:
+        tmp = Path(tmp)
+        print(f"Generating {args.artists} artists x {args.albums} albums, {args.files} files to ingest...")
+        linear_root = make_workspace(tmp / 'linear', args)
+        indexed_root = make_workspace(tmp / 'indexed', args)
+
+        linear = run_ingest(LinearLookupNormalizer, linear_root)
+        indexed = run_ingest(mln.MusicLibraryNormalizer, indexed_root)
+
+        if tree(linear_root / 'music') != tree(indexed_root / 'music'):
+            print("ERROR: linear and indexed ingest produced different libraries")
+            sys.exit(1)
+
+    print(f"Linear scan:    {linear:8.2f} s  ({args.files / linear:8.0f} files/s)")
+    print(f"Canonical index:{indexed:8.2f} s  ({args.files / indexed:8.0f} files/s)")
+    print(f"Speedup:        {linear / indexed:8.1f}x  (identical results)")
+
+
+if __name__ == '__main__':
+    main()
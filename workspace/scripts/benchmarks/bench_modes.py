@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: every music-library-normalizer mode on a synthetic library
+Generates one tagged library (synthlib.make_library: MP3/FLAC/M4A, Unicode and
+duplicate folder spellings, .m3u playlists) plus an ingest directory, then
+runs observe, organize (dry run and normal), ingest and reconcile, each in a
+fresh child process on a fresh copy of the library. Reports wall clock, CPU,
+file-system calls (os module counters, plus the kernel's read/write syscall
+counts from /proc/self/io where available) and peak RSS, and writes the
+results as JSON so runs of different versions can be compared (--compare).
+"""
+
+import argparse
+import hashlib
+import json
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+from synthlib import NORMALIZER_PATH, copy_library, count_calls, make_ingest_dir, make_library, quiet
+
+MODES = ['observe', 'organize-dryrun', 'organize', 'ingest', 'reconcile']
+
+# Compared by --compare: (key, label, format)
+METRICS = [('wall_s', 'wall', '{:.2f} s'), ('fs_calls', 'fs calls', '{:,}'),
+           ('peak_rss_mb', 'peak RSS', '{:.1f} MB')]
+
+
+def proc_io() -> dict:
+    """Kernel I/O counters for this process (Linux only)"""
+    try:
+        with open('/proc/self/io') as f:
+            return {key: int(value) for key, value in (line.split(':') for line in f)}
+    except OSError:
+        return {}
+
+
+def run_worker(mode: str, workdir: Path, jobs: int, tag_cache: bool) -> dict:
+    """Run one mode in this process and measure it"""
+    from synthlib import load_normalizer
+    mln = load_normalizer()
+
+    common = dict(music_dir=str(workdir / 'music'), dry_run_limit=10 ** 9, jobs=jobs,
+                  tag_cache=str(workdir / 'tags.sqlite') if tag_cache else None)
+    if tag_cache:
+        # Warm the cache for this copy (entries are keyed by path and inode), untimed
+        warmup = mln.MusicLibraryNormalizer(playlist_input=None, playlist_output=None, mode='dryrun',
+                                            action='observe', **common)
+        with quiet():
+            warmup.run_observe()
+        warmup.close()
+
+    if mode == 'observe':
+        normalizer = mln.MusicLibraryNormalizer(playlist_input=None, playlist_output=None, mode='dryrun',
+                                                action='observe', **common)
+        action = normalizer.run_observe
+    elif mode in ('organize', 'organize-dryrun'):
+        normalizer = mln.MusicLibraryNormalizer(playlist_input=str(workdir / 'playlists'),
+                                                playlist_output=str(workdir / 'out'),
+                                                mode='dryrun' if mode == 'organize-dryrun' else 'normal',
+                                                **common)
+        action = normalizer.run
+    elif mode == 'ingest':
+        normalizer = mln.MusicLibraryNormalizer(playlist_input=None, playlist_output=None, mode='normal',
+                                                action='ingest', ingest_dir=str(workdir / 'ingest'), **common)
+        action = normalizer.run_ingest
+    else:
+        normalizer = mln.MusicLibraryNormalizer(playlist_input=str(workdir / 'playlists'), playlist_output=None,
+                                                mode='dryrun', action='reconcile', **common)
+        action = normalizer.run_reconcile
+
+    (workdir / 'out').mkdir(exist_ok=True)
+    calls = Counter()
+    io_before = proc_io()
+    cpu_before = resource.getrusage(resource.RUSAGE_SELF)
+    start = time.perf_counter()
+    with quiet(), count_calls(calls):
+        action()
+    wall = time.perf_counter() - start
+    cpu_after = resource.getrusage(resource.RUSAGE_SELF)
+    io_after = proc_io()
+    normalizer.close()
+
+    # ru_maxrss is KiB on Linux, bytes on macOS; pool workers show up as children
+    rss_unit = 1 if sys.platform == 'darwin' else 1024
+    peak_rss = max(cpu_after.ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss) * rss_unit
+    return {
+        'wall_s': round(wall, 4),
+        'cpu_s': round(cpu_after.ru_utime + cpu_after.ru_stime - cpu_before.ru_utime - cpu_before.ru_stime, 4),
+        'fs_calls': sum(calls.values()),
+        'fs_calls_by_type': dict(calls),
+        'read_syscalls': io_after.get('syscr', 0) - io_before.get('syscr', 0) if io_before else None,
+        'write_syscalls': io_after.get('syscw', 0) - io_before.get('syscw', 0) if io_before else None,
+        'peak_rss_mb': round(peak_rss / 2 ** 20, 1),
+    }
+
+
+def summarize(runs: list) -> dict:
+    """Median of each metric over repeats, plus the raw runs"""
+    summary = {key: statistics.median(run[key] for run in runs)
+               for key in runs[0] if isinstance(runs[0][key], (int, float))}
+    summary['runs'] = runs
+    return summary
+
+
+def print_table(results: dict, baseline: dict = None):
+    header = f"{'mode':<17}{'wall':>10}{'cpu':>10}{'fs calls':>12}{'read sc':>10}{'write sc':>10}{'peak RSS':>11}"
+    print(header)
+    print('-' * len(header))
+    for mode, summary in results['modes'].items():
+        read_sc = summary.get('read_syscalls', '-')
+        write_sc = summary.get('write_syscalls', '-')
+        print(f"{mode:<17}{summary['wall_s']:>9.2f}s{summary['cpu_s']:>9.2f}s{summary['fs_calls']:>12,}"
+              f"{read_sc:>10}{write_sc:>10}{summary['peak_rss_mb']:>8.1f} MB")
+
+    if not baseline:
+        return
+    print(f"\nChange against {baseline.get('normalizer_sha1', '?')[:12]} "
+          f"({baseline.get('timestamp', 'unknown time')}):")
+    for mode, summary in results['modes'].items():
+        old = baseline.get('modes', {}).get(mode)
+        if not old:
+            print(f"  {mode}: not in baseline")
+            continue
+        changes = []
+        for key, label, fmt in METRICS:
+            if old.get(key):
+                delta = (summary[key] - old[key]) / old[key] * 100
+                changes.append(f"{label} {fmt.format(old[key])} -> {fmt.format(summary[key])} ({delta:+.0f}%)")
+        print(f"  {mode}: " + ', '.join(changes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--artists', type=int, default=200, help='Artists (default: 200)')
+    parser.add_argument('--albums', type=int, default=3, help='Albums per artist (default: 3)')
+    parser.add_argument('--tracks', type=int, default=10, help='Tracks per album (default: 10)')
+    parser.add_argument('--formats', default='mp3,flac,m4a', help='Comma-separated formats (default: mp3,flac,m4a)')
+    parser.add_argument('--unicode-rate', type=float, default=0.1,
+                        help='Fraction of names with accented words (default: 0.1)')
+    parser.add_argument('--duplicate-rate', type=float, default=0.05,
+                        help='Fraction of artists with a second, differently spelled folder (default: 0.05)')
+    parser.add_argument('--playlists', type=int, default=20, help='Playlists (default: 20)')
+    parser.add_argument('--playlist-length', type=int, default=100, help='Entries per playlist (default: 100)')
+    parser.add_argument('--ingest-files', type=int, default=300, help='Files in the ingest dir (default: 300)')
+    parser.add_argument('--modes', default=','.join(MODES), help=f"Comma-separated (default: {','.join(MODES)})")
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per mode, median reported (default: 1)')
+    parser.add_argument('--jobs', type=int, default=1, help='--jobs for the normalizer (default: 1)')
+    parser.add_argument('--tag-cache', action='store_true',
+                        help='Time with a tag cache warmed by an untimed observe run')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', metavar='FILE', help='Write JSON results here (default: stdout only)')
+    parser.add_argument('--compare', metavar='FILE', help='Earlier JSON results to compare against')
+    parser.add_argument('--worker', nargs=2, metavar=('MODE', 'DIR'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        mode, workdir = args.worker
+        print(json.dumps(run_worker(mode, Path(workdir), args.jobs, args.tag_cache)))
+        return
+
+    modes = [mode for mode in args.modes.split(',') if mode]
+    unknown = set(modes) - set(MODES)
+    if unknown:
+        parser.error(f"unknown mode(s): {', '.join(sorted(unknown))}")
+
+    results = {
+        'version': 1,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'normalizer_sha1': hashlib.sha1(NORMALIZER_PATH.read_bytes()).hexdigest(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': {key: value for key, value in vars(args).items()
+                   if key not in ('worker', 'output', 'compare')},
+        'modes': {},
+    }
+
+    with tempfile.TemporaryDirectory(prefix='mln-bench-') as tmp:
+        template = Path(tmp) / 'template'
+        print(f"Generating {args.artists} artists x {args.albums} albums x {args.tracks} tracks...",
+              file=sys.stderr)
+        formats = tuple(args.formats.split(','))
+        results['library'] = make_library(template, args.artists, args.albums, args.tracks,
+                                          unicode_rate=args.unicode_rate, duplicate_rate=args.duplicate_rate,
+                                          formats=formats, playlists=args.playlists,
+                                          playlist_length=args.playlist_length, seed=args.seed)
+        make_ingest_dir(template / 'ingest', args.ingest_files, args.artists, formats=formats, seed=args.seed + 1)
+
+        worker = [sys.executable, str(Path(__file__).resolve()), '--jobs', str(args.jobs)]
+        if args.tag_cache:
+            worker.append('--tag-cache')
+
+        for mode in modes:
+            runs = []
+            for _ in range(args.repeat):
+                workdir = Path(tmp) / 'run'
+                shutil.rmtree(workdir, ignore_errors=True)
+                copy_library(template, workdir)
+                done = subprocess.run(worker + ['--worker', mode, str(workdir)],
+                                      capture_output=True, text=True)
+                if done.returncode != 0:
+                    print(f"ERROR: {mode} failed:\n{done.stderr}", file=sys.stderr)
+                    sys.exit(1)
+                runs.append(json.loads(done.stdout.strip().splitlines()[-1]))
+            results['modes'][mode] = summarize(runs)
+            print(f"  {mode}: {results['modes'][mode]['wall_s']:.2f} s", file=sys.stderr)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    print_table(results, baseline)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    else:
+        print()
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Benchmark: name normalization throughput (names/second)
+Runs normalize_name() and get_canonical_key() over a generated mix of artist,
+album and track names, the way one organize run revisits the same names in
+the rename, merge and playlist phases. Compares the previous uncompiled,
+unmemoized implementation with the precompiled pipeline (cold and warm memo)
+and checks every name normalizes identically.
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+import unicodedata
+from pathlib import Path
+from typing import Optional
+
+from synthlib import load_normalizer
+
+mln = load_normalizer()
+
+TAG_IDS = {}  # file path -> MCATALOGID "in its tags", so no file I/O is timed
+
+
+class TagStubMixin:
+    """Look MCATALOGIDs up in TAG_IDS instead of reading files"""
+
+    def get_mcatalogid(self, file_path: Path, debug: bool = False) -> Optional[str]:
+        return TAG_IDS.get(file_path)
+
+
+class PipelineNormalizer(TagStubMixin, mln.MusicLibraryNormalizer):
+    pass
+
+
+class OriginalNormalizer(TagStubMixin, mln.MusicLibraryNormalizer):
+    """Name normalization as it was before precompiled patterns and the memo"""
+
+    def get_canonical_key(self, name: str) -> str:
+        name = unicodedata.normalize('NFC', name)
+        return re.sub(r'[^a-z0-9]', '', name.lower())
+
+    def normalize_name(self, name: str, is_file: bool = False,
+                      file_path: Optional[Path] = None) -> str:
+        """normalize_name() as it was before the memoized pipeline"""
+        # Input validation
+        if not name or len(name) == 0:
+            raise ValueError("Name cannot be empty")
+
+        # Apply Unicode NFC normalization FIRST for cross-platform compatibility
+        # macOS uses NFD, Linux/Windows use NFC - normalize to NFC
+        name = unicodedata.normalize('NFC', name)
+
+        # Remove null bytes (can truncate filenames)
+        name = name.replace('\x00', '')
+
+        # Remove path separators (security: prevent directory traversal)
+        name = name.replace('/', '-').replace('\\', '-')
+
+        if is_file and file_path:
+            # Split name and extension
+            stem = name.rsplit('.', 1)[0] if '.' in name else name
+            ext = '.' + name.rsplit('.', 1)[1].lower() if '.' in name else ''
+
+            # Strip leading non-alphanumeric characters from stem
+            stem = re.sub(r'^[^a-zA-Z0-9]+', '', stem)
+
+            # Check if MCATALOGID already exists in filename
+            # Pattern matches: -[mid-value] or -[value] at end
+            mcatalogid_pattern = r'-\[(?:mid-)?([^\]]+)\]$'
+            existing_match = re.search(mcatalogid_pattern, stem)
+            existing_mcatalogid = existing_match.group(1) if existing_match else None
+
+            # Get MCATALOGID from file tags if it's an audio file
+            mcatalogid = None
+            if ext in self.audio_extensions:
+                mcatalogid = self.get_mcatalogid(file_path)
+
+            # If file already has MCATALOGID in name, check if it matches tags
+            if existing_mcatalogid:
+                if mcatalogid and existing_mcatalogid.lower() == mcatalogid.lower():
+                    # Tag matches filename - keep it, don't duplicate
+                    # Remove old format to re-add in new format
+                    stem = re.sub(mcatalogid_pattern, '', stem)
+                elif not mcatalogid:
+                    # No tag found, but filename has one - keep filename version
+                    mcatalogid = existing_mcatalogid
+                    stem = re.sub(mcatalogid_pattern, '', stem)
+                else:
+                    # Tag differs from filename - use tag (more authoritative)
+                    stem = re.sub(mcatalogid_pattern, '', stem)
+            elif existing_match:
+                # Has some bracketed suffix but not MCATALOGID - remove it
+                stem = re.sub(mcatalogid_pattern, '', stem)
+
+            # Normalize: lowercase first
+            normalized_stem = stem.lower()
+
+            # Replace underscores with hyphens
+            normalized_stem = normalized_stem.replace('_', '-')
+
+            # Remove all dots from the stem (only extension should have a dot)
+            normalized_stem = normalized_stem.replace('.', '')
+
+            # Remove parentheses by replacing with spaces (to avoid joining words)
+            normalized_stem = normalized_stem.replace('(', ' ').replace(')', ' ')
+
+            # Remove spaces around non-word characters (punctuation like , & etc.)
+            # This handles: ", " -> "," and " & " -> "&"
+            normalized_stem = re.sub(r'\s*([^\w\s-])\s*', r'\1', normalized_stem)
+
+            # Now replace remaining spaces with hyphens
+            normalized_stem = normalized_stem.replace(' ', '-')
+
+            # Collapse multiple consecutive hyphens into single hyphen and strip leading/trailing
+            normalized_stem = re.sub(r'-+', '-', normalized_stem).strip('-')
+
+            # Add MCATALOGID if available
+            if mcatalogid:
+                normalized_stem = f"{normalized_stem}-[mid-{mcatalogid}]"
+
+            final_name = f"{normalized_stem}{ext}"
+
+            # CRITICAL: Final check - ensure NO spaces in filename
+            if ' ' in final_name:
+                final_name = final_name.replace(' ', '-')
+                # Re-collapse multiple hyphens that might result
+                final_name = re.sub(r'-+', '-', final_name)
+
+            # Check for Windows reserved names
+            reserved_names = {'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3',
+                            'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+                            'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6',
+                            'LPT7', 'LPT8', 'LPT9'}
+            name_without_ext = final_name.rsplit('.', 1)[0] if '.' in final_name else final_name
+            if name_without_ext.upper() in reserved_names:
+                final_name = f"_{final_name}"  # Prefix with underscore
+
+            # Enforce filesystem length limit (255 bytes for most filesystems)
+            max_bytes = 255
+            if len(final_name.encode('utf-8')) > max_bytes:
+                # Truncate stem to fit within limit
+                available_bytes = max_bytes - len(ext.encode('utf-8')) - 10  # Leave margin
+                if available_bytes < 10:
+                    raise ValueError(f"Extension too long to create valid filename: {ext}")
+
+                # Truncate normalized_stem at UTF-8 byte boundary
+                truncated_stem = normalized_stem.encode('utf-8')[:available_bytes].decode('utf-8', errors='ignore')
+                # Remove trailing hyphen if truncation created one
+                truncated_stem = truncated_stem.rstrip('-')
+                final_name = f"{truncated_stem}{ext}"
+
+            return final_name
+        else:
+            # Directory: strip leading non-alphanumeric
+            clean_name = re.sub(r'^[^a-zA-Z0-9]+', '', name)
+
+            # Lowercase
+            clean_name = clean_name.lower()
+
+            # Replace underscores with hyphens
+            clean_name = clean_name.replace('_', '-')
+
+            # Remove all dots from directory names
+            clean_name = clean_name.replace('.', '')
+
+            # Remove parentheses by replacing with spaces (to avoid joining words)
+            clean_name = clean_name.replace('(', ' ').replace(')', ' ')
+
+            # Remove spaces around non-word characters (punctuation like , & etc.)
+            # This handles: ", " -> "," and " & " -> "&"
+            clean_name = re.sub(r'\s*([^\w\s-])\s*', r'\1', clean_name)
+
+            # Now replace remaining spaces with hyphens
+            clean_name = clean_name.replace(' ', '-')
+
+            # Collapse multiple consecutive hyphens into single hyphen and strip leading/trailing
+            clean_name = re.sub(r'-+', '-', clean_name).strip('-')
+
+            # CRITICAL: Final check - ensure NO spaces in directory name
+            if ' ' in clean_name:
+                clean_name = clean_name.replace(' ', '-')
+                # Re-collapse multiple hyphens that might result
+                clean_name = re.sub(r'-+', '-', clean_name)
+
+            # Check for Windows reserved names
+            reserved_names = {'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3',
+                            'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+                            'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6',
+                            'LPT7', 'LPT8', 'LPT9'}
+            if clean_name.upper() in reserved_names:
+                clean_name = f"_{clean_name}"  # Prefix with underscore
+
+            # Enforce filesystem length limit (255 bytes for most filesystems)
+            max_bytes = 255
+            if len(clean_name.encode('utf-8')) > max_bytes:
+                # Truncate at UTF-8 byte boundary
+                clean_name = clean_name.encode('utf-8')[:max_bytes].decode('utf-8', errors='ignore')
+                # Remove trailing hyphen if truncation created one
+                clean_name = clean_name.rstrip('-')
+
+            return clean_name
+
+
+WORDS = ['Love', 'Song', 'Night', 'Café', 'Cafe\u0301', 'Dil', 'Se', 'R. D.', 'Burman', 'The', 'Band',
+         'Live', '(1999)', '&', 'Friends,', 'feat.', 'Señor', 'Ñandú', 'Ǆemal', 'Rock_n_Roll', 'Vol.2']
+
+
+def make_names(count: int, distinct: int, seed: int):
+    """count (name, is_file, path) tuples drawn from `distinct` different names"""
+    rng = random.Random(seed)
+    pool = []
+    for i in range(distinct):
+        words = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 6)))
+        kind = rng.random()
+        if kind < 0.3:
+            pool.append((f"{rng.choice(['', '01 ', '- ', '_'])}{words}", False, None))
+            continue
+        ext = rng.choice(['.mp3', '.flac', '.M4A', '.jpg'])
+        suffix = rng.choice(['', '', f"-[mid-x{i}]", f"-[y{i}]"])
+        path = Path(f"/music/{i}{ext}")
+        if rng.random() < 0.7:
+            TAG_IDS[path] = suffix[7:-1] if suffix.startswith('-[mid-') and rng.random() < 0.5 else f"id{i}"
+        pool.append((f"{i:02d} {words}{suffix}{ext}", True, path))
+    pool.append(('CON', False, None))
+    pool.append(('x' * 300, False, None))
+    pool.append(('y' * 300 + '.mp3', True, Path('/music/long.mp3')))
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def run(normalizer, names):
+    start = time.perf_counter()
+    results = [(normalizer.normalize_name(name, is_file, path), normalizer.get_canonical_key(name))
+               for name, is_file, path in names]
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--names', type=int, default=200000, help='Names to normalize (default: 200000)')
+    parser.add_argument('--distinct', type=int, default=20000,
+                        help='Distinct names among them (default: 20000)')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    names = make_names(args.names, args.distinct, args.seed)
+    original = OriginalNormalizer('/music', None, None, 'dryrun')
+    pipeline = PipelineNormalizer('/music', None, None, 'dryrun')
+
+    expected, original_time = run(original, names)
+    mln.normalize_name_parts.cache_clear()
+    mln.name_canonical_key.cache_clear()
+    cold, cold_time = run(pipeline, names)
+    warm, warm_time = run(pipeline, names)
+
+    if cold != expected or warm != expected:
+        mismatches = [(name, want, got) for (name, _, _), want, got in zip(names, expected, cold) if want != got]
+        print(f"ERROR: {len(mismatches)} name(s) normalize differently, e.g. {mismatches[:3]}")
+        sys.exit(1)
+
+    print(f"{len(names)} names ({args.distinct} distinct), identical results\n")
+    for label, elapsed in [('Original', original_time), ('Pipeline (cold memo)', cold_time),
+                           ('Pipeline (warm memo)', warm_time)]:
+        print(f"{label:<22}{elapsed:8.3f} s  {len(names) / elapsed:>10,.0f} names/s")
+    print(f"\nMemo: {mln.normalize_name_parts.cache_info()}")
+
+
+if __name__ == '__main__':
+    main()
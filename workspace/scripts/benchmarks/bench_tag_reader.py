@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Benchmark and validation: the header-only tag reader against Mutagen
+Generates a corpus of tagged MP3/FLAC/M4A files covering the layouts the
+header reader handles itself (ID3v2.3 and v2.4 in every text encoding, Vorbis
+comments in any key case, iTunes freeform atoms, large embedded artwork) and
+some it hands to Mutagen (ID3v1 fallbacks, truncated files), or takes a real
+library with --corpus. Every file is read both ways; any record that differs
+from Mutagen's is a failure. Reports how often the fast path applied and the
+time per file of each reader.
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from mutagen.flac import FLAC, Picture
+from mutagen.id3 import APIC, ID3, TALB, TIT2, TPE1, TPE2, TXXX
+from mutagen.mp4 import MP4, MP4Cover, MP4FreeForm
+
+from synthlib import MP3_FRAME, load_normalizer, write_flac, write_m4a
+
+mln = load_normalizer()
+Normalizer = mln.MusicLibraryNormalizer
+
+AUDIO_EXTENSIONS = {'.mp3', '.flac', '.m4a', '.mp4'}
+NAMES = ['Björk', 'R. D. Burman', 'Sigur Rós', '  Padded  ', 'Ǆemal', '東京事変', 'AC/DC', 'Zoë']
+
+
+def artwork(rng: random.Random, kb: int) -> bytes:
+    return b'\xff\xd8\xff\xe0' + rng.randbytes(kb * 1024)
+
+
+def make_mp3(path: Path, rng: random.Random, i: int, artwork_kb: int):
+    path.write_bytes(MP3_FRAME * 40)
+    encoding = i % 4
+    if encoding in (2, 3):
+        version = 4  # UTF-16BE and UTF-8 are v2.4 only
+    else:
+        version = 3 if i % 8 < 4 else 4
+    names = [name for name in NAMES if encoding or max(map(ord, name)) < 256]  # Latin-1 can't hold them all
+    tags = ID3()
+    tags.add(TPE1(encoding=encoding, text=[rng.choice(names), 'Second Artist'] if i % 5 == 0 else rng.choice(names)))
+    tags.add(TIT2(encoding=encoding, text=f"Track {i}"))
+    if i % 11:
+        tags.add(TALB(encoding=encoding, text=rng.choice(names)))  # Otherwise ID3v1 or nothing fills it in
+    if i % 3 == 0:
+        tags.add(TPE2(encoding=encoding, text=rng.choice(names)))
+    if i % 4:
+        desc = rng.choice(['MCATALOGID', 'mcatalogid', 'McatalogId'])
+        tags.add(TXXX(encoding=encoding, desc=desc, text=f" mid{i} "))
+    if i % 6 == 0:
+        tags.add(TXXX(encoding=encoding, desc='REPLAYGAIN_TRACK_GAIN', text='-6.5 dB'))
+    if i % 2 == 0:
+        tags.add(APIC(encoding=encoding, mime='image/jpeg', type=3, desc='Cover', data=artwork(rng, artwork_kb)))
+    tags.save(path, v2_version=version, v1=2 if i % 7 == 0 else 0)
+
+
+def make_flac(path: Path, rng: random.Random, i: int, artwork_kb: int):
+    write_flac(path, rng.choice(NAMES), rng.choice(NAMES), f"Track {i}")
+    audio = FLAC(path)
+    if i % 9 == 0:
+        audio.delete()
+        audio.save()
+        return
+    if i % 3 == 0:
+        del audio['ARTIST']
+        audio['Artist'] = [rng.choice(NAMES), 'Second Artist']
+        audio['albumartist'] = rng.choice(NAMES)
+    key = ['MCATALOGID', 'mcatalogid', 'CUSTOM1', 'MUSICIP_PUID', None][i % 5]
+    if key:
+        audio[key] = f"mid{i}"
+    if i % 2 == 0:
+        picture = Picture()
+        picture.type, picture.mime, picture.data = 3, 'image/jpeg', artwork(rng, artwork_kb)
+        audio.add_picture(picture)
+    audio.save()
+
+
+def make_m4a(path: Path, rng: random.Random, i: int, artwork_kb: int):
+    write_m4a(path, rng.choice(NAMES), rng.choice(NAMES), f"Track {i}",
+              album_artist=rng.choice(NAMES) if i % 3 == 0 else None)
+    audio = MP4(path)
+    key = ['----:com.apple.iTunes:CUSTOM1', '----:com.apple.iTunes:CUSTOM2',
+           '----:com.apple.iTunes:MusicIP PUID', 'mcat', None][i % 5]
+    if key and key.startswith('----'):
+        audio[key] = [MP4FreeForm(f"mid{i}".encode('utf-8'))]
+    elif key:
+        audio[key] = [f"mid{i}"]
+    if i % 2 == 0:
+        audio['covr'] = [MP4Cover(artwork(rng, artwork_kb), imageformat=MP4Cover.FORMAT_JPEG)]
+    if i % 7 == 0:
+        audio['----:com.apple.iTunes:iTunNORM'] = [MP4FreeForm(b' 00000A2F 00000A2F')]
+    audio.save()
+
+
+MAKERS = {'mp3': make_mp3, 'flac': make_flac, 'm4a': make_m4a}
+
+
+def make_corpus(root: Path, files: int, artwork_kb: int, seed: int):
+    rng = random.Random(seed)
+    root.mkdir(parents=True, exist_ok=True)
+    for i in range(files):
+        fmt = list(MAKERS)[i % len(MAKERS)]
+        path = root / f"{i:04d}.{fmt}"
+        MAKERS[fmt](path, rng, i, artwork_kb)
+        if i % 29 == 0:
+            # Truncated copies: both readers have to fail (or cope) the same way
+            data = path.read_bytes()
+            (root / f"{i:04d}-truncated.{fmt}").write_bytes(data[:len(data) // 3])
+
+
+def mutagen_record(path: Path):
+    """What parse_tag_file returned before the header reader"""
+    try:
+        audio = mln.MutagenFile(path, easy=False)
+    except Exception as e:
+        return 'error', type(e).__name__
+    if audio is None:
+        return mln.EMPTY_TAG_RECORD, 'unknown'
+    return Normalizer.extract_tags(audio), type(audio).__name__
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--files', type=int, default=300, help='Generated files (default: 300)')
+    parser.add_argument('--artwork-kb', type=int, default=512,
+                        help='Size of the embedded artwork in half the files (default: 512)')
+    parser.add_argument('--corpus', metavar='DIR', help='Validate against the audio files under DIR instead')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='mln-bench-') as tmp:
+        if args.corpus:
+            root = Path(args.corpus)
+        else:
+            root = Path(tmp) / 'corpus'
+            print(f"Generating {args.files} files with {args.artwork_kb} KB artwork...")
+            make_corpus(root, args.files, args.artwork_kb, args.seed)
+        paths = sorted(p for p in root.rglob('*') if p.is_file() and p.suffix.lower() in AUDIO_EXTENSIONS)
+        if not paths:
+            print(f"ERROR: no MP3, FLAC or M4A files under {root}")
+            sys.exit(1)
+
+        start = time.perf_counter()
+        expected = [mutagen_record(path) for path in paths]
+        mutagen_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fast = [mln.HeaderTagReader.read(path) for path in paths]
+        header_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for path in paths:
+            Normalizer.parse_tag_file(path)
+        combined_time = time.perf_counter() - start
+
+    mismatches = [(path, want, got) for path, want, got in zip(paths, expected, fast)
+                  if got is not None and got != want]
+    hits = sum(result is not None for result in fast)
+
+    print(f"Files: {len(paths)}")
+    print(f"Header reader: {hits} ({hits / max(len(paths), 1):.0%}), "
+          f"Mutagen fallback: {len(paths) - hits}")
+    print(f"Mismatches: {len(mismatches)}")
+    for path, want, got in mismatches[:10]:
+        print(f"  {path.name}\n    mutagen: {want}\n    header:  {got}")
+    per_file = 1000 / max(len(paths), 1)
+    print(f"\n{'reader':<32}{'ms/file':>10}")
+    print(f"{'Mutagen':<32}{mutagen_time * per_file:>10.3f}")
+    print(f"{'HeaderTagReader.read':<32}{header_time * per_file:>10.3f}")
+    print(f"{'parse_tag_file (with fallback)':<32}{combined_time * per_file:>10.3f}")
+    if combined_time:
+        print(f"\nSpeedup over Mutagen: {mutagen_time / combined_time:.1f}x")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
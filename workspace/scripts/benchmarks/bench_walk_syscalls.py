@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: file-system calls made while collecting library items
+Compares collect_items() on the scandir walker against the previous
+os.walk() version (an lstat per folder and file, plus a resolve() per file),
+counting calls through the os module instead of tracing the process.
+Every counted call is a round trip on NFS (~1 ms each).
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import List, Tuple
+
+from synthlib import COUNTED_CALLS, album_name, artist_name, count_calls, load_normalizer, quiet
+
+mln = load_normalizer()
+
+
+class OsWalkNormalizer(mln.MusicLibraryNormalizer):
+    """collect_items() as it was before the scandir walker"""
+
+    def collect_items(self) -> List[Tuple[Path, int, str]]:
+        items = []
+        dirs_with_audio = set()
+        for root, dirs, files in os.walk(self.music_dir, followlinks=False):
+            root_path = Path(root)
+            depth = len(root_path.relative_to(self.music_dir).parts)
+            dirs[:] = [d for d in dirs if not self.should_skip_dir(d)
+                       and not (root_path / d).is_symlink()]
+            for filename in files:
+                file_path = root_path / filename
+                if file_path.is_symlink():
+                    continue
+                if not self.is_safe_path(file_path):
+                    continue
+                if self.is_audio_file(file_path):
+                    items.append((file_path, depth, 'file'))
+                    parent = file_path.parent
+                    while parent != self.music_dir:
+                        dirs_with_audio.add(parent)
+                        parent = parent.parent
+        for dir_path in dirs_with_audio:
+            items.append((dir_path, len(dir_path.relative_to(self.music_dir).parts), 'dir'))
+        items.sort(key=lambda x: (-x[1], x[2] == 'dir', str(x[0])))
+        return items
+
+
+def make_library(music_dir: Path, artists: int, albums: int, tracks: int):
+    """Empty audio files are enough: collect_items() never reads them"""
+    for a in range(artists):
+        for b in range(albums):
+            folder = music_dir / artist_name(a) / album_name(b)
+            folder.mkdir(parents=True)
+            for t in range(tracks):
+                (folder / f"{t:02d} Track {t}.{'flac' if t % 2 else 'mp3'}").touch()
+            (folder / 'cover.jpg').touch()
+
+
+def measure(normalizer_class, music_dir: Path):
+    normalizer = normalizer_class(str(music_dir), None, None, 'dryrun')
+    counter = Counter()
+    start = time.perf_counter()
+    with quiet(), count_calls(counter):
+        items = normalizer.collect_items()
+    elapsed = time.perf_counter() - start
+    normalizer.close()
+    return items, counter, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--artists', type=int, default=1000, help='Artist folders (default: 1000)')
+    parser.add_argument('--albums', type=int, default=3, help='Albums per artist (default: 3)')
+    parser.add_argument('--tracks', type=int, default=12, help='Tracks per album (default: 12)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='mln-bench-') as tmp:
+        music_dir = Path(tmp) / 'music'
+        print(f"Generating {args.artists} artists x {args.albums} albums x {args.tracks} tracks...")
+        make_library(music_dir, args.artists, args.albums, args.tracks)
+
+        old_items, old_calls, old_time = measure(OsWalkNormalizer, music_dir)
+        new_items, new_calls, new_time = measure(mln.MusicLibraryNormalizer, music_dir)
+
+    if old_items != new_items:
+        print("ERROR: os.walk and scandir walkers collected different items")
+        sys.exit(1)
+
+    print(f"Collected {len(new_items)} item(s) (identical)\n")
+    print(f"{'call':<10}{'os.walk':>12}{'scandir':>12}")
+    for name in COUNTED_CALLS:
+        print(f"{name:<10}{old_calls[name]:>12}{new_calls[name]:>12}")
+    old_total, new_total = sum(old_calls.values()), sum(new_calls.values())
+    print(f"{'total':<10}{old_total:>12}{new_total:>12}")
+    print(f"{'time (s)':<10}{old_time:>12.2f}{new_time:>12.2f}")
+    print(f"\nAt ~1 ms per call on NFS: {old_total / 1000:.1f} s -> {new_total / 1000:.1f} s")
+
+
+if __name__ == '__main__':
+    main()
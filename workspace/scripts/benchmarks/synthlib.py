@@ -0,0 +1,235 @@
+"""
+Synthetic music libraries for benchmarking music-library-normalizer.py
+Files carry real (minimal) audio headers and tags, so mutagen parses them
+exactly as it would a ripped track.
+"""
+
+import contextlib
+import importlib.util
+import io
+import os
+import random
+import shutil
+import struct
+import sys
+import unicodedata
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List
+
+from mutagen.flac import FLAC
+from mutagen.id3 import ID3, TALB, TIT2, TPE1, TPE2, TXXX
+from mutagen.mp4 import MP4, MP4FreeForm
+
+NORMALIZER_PATH = Path(__file__).resolve().parent.parent / 'music-library-normalizer.py'
+
+# One silent MPEG-1 Layer III frame: 128 kbps, 44.1 kHz, 417 bytes
+MP3_FRAME = b'\xff\xfb\x90\x64' + b'\x00' * 413
+
+
+def load_normalizer():
+    """Import music-library-normalizer.py (hyphenated, so not importable by name)"""
+    spec = importlib.util.spec_from_file_location('music_library_normalizer', NORMALIZER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    # Registered so --jobs process workers can pickle its classes by reference
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@contextlib.contextmanager
+def quiet():
+    """Swallow the normalizer's progress output while timing it"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+# File-system calls counted by count_calls(); pathlib goes through these too
+COUNTED_CALLS = ('stat', 'lstat', 'scandir', 'listdir', 'readlink')
+
+
+@contextlib.contextmanager
+def count_calls(counter: Counter):
+    """Count os.stat/lstat/scandir/listdir/readlink calls without tracing the process"""
+    originals = {name: getattr(os, name) for name in COUNTED_CALLS}
+
+    def counting(name, func):
+        def wrapper(*args, **kwargs):
+            counter[name] += 1
+            return func(*args, **kwargs)
+        return wrapper
+
+    for name, func in originals.items():
+        setattr(os, name, counting(name, func))
+    try:
+        yield counter
+    finally:
+        for name, func in originals.items():
+            setattr(os, name, func)
+
+
+def write_mp3(path: Path, artist: str, album: str, title: str, mcatalogid=None, album_artist=None):
+    path.write_bytes(MP3_FRAME * 20)
+    tags = ID3()
+    tags.add(TPE1(encoding=3, text=artist))
+    tags.add(TALB(encoding=3, text=album))
+    tags.add(TIT2(encoding=3, text=title))
+    if album_artist:
+        tags.add(TPE2(encoding=3, text=album_artist))
+    if mcatalogid:
+        tags.add(TXXX(encoding=3, desc='MCATALOGID', text=mcatalogid))
+    tags.save(path)
+
+
+def write_flac(path: Path, artist: str, album: str, title: str, mcatalogid=None, album_artist=None):
+    # STREAMINFO only: 44.1 kHz, stereo, 16 bit, one second of samples
+    streaminfo = struct.pack('>HH', 4096, 4096) + b'\x00' * 6
+    streaminfo += ((44100 << 44) | (1 << 41) | (15 << 36) | 44100).to_bytes(8, 'big')
+    path.write_bytes(b'fLaC' + bytes([0x80, 0, 0, 34]) + streaminfo + b'\x00' * 16)
+    audio = FLAC(path)
+    audio['ARTIST'], audio['ALBUM'], audio['TITLE'] = artist, album, title
+    if album_artist:
+        audio['ALBUMARTIST'] = album_artist
+    if mcatalogid:
+        audio['MCATALOGID'] = mcatalogid
+    audio.save()
+
+
+def write_m4a(path: Path, artist: str, album: str, title: str, mcatalogid=None, album_artist=None):
+    # ftyp + moov/mvhd (1 s at 1 kHz timescale) + empty mdat
+    def atom(name: bytes, payload: bytes) -> bytes:
+        return struct.pack('>I4s', 8 + len(payload), name) + payload
+
+    matrix = b'\x00\x01\x00\x00' + b'\x00' * 12 + b'\x00\x01\x00\x00' + b'\x00' * 12 + b'\x40\x00\x00\x00'
+    mvhd = (b'\x00' * 4 + struct.pack('>IIII', 0, 0, 1000, 1000) + b'\x00\x01\x00\x00\x01\x00'
+            + b'\x00' * 10 + matrix + b'\x00' * 24 + struct.pack('>I', 2))
+    path.write_bytes(atom(b'ftyp', b'M4A \x00\x00\x02\x00M4A mp42isom')
+                     + atom(b'moov', atom(b'mvhd', mvhd)) + atom(b'mdat', b''))
+    audio = MP4(path)
+    audio['\xa9ART'], audio['\xa9alb'], audio['\xa9nam'] = [artist], [album], [title]
+    if album_artist:
+        audio['aART'] = [album_artist]
+    if mcatalogid:
+        audio['----:com.apple.iTunes:CUSTOM1'] = [MP4FreeForm(mcatalogid.encode('utf-8'))]
+    audio.save()
+
+
+WRITERS = {'mp3': write_mp3, 'flac': write_flac, 'm4a': write_m4a}
+
+
+def artist_name(i: int) -> str:
+    return f"Artist {i:05d}"
+
+
+def album_name(i: int) -> str:
+    return f"Album {i:02d}"
+
+
+def make_folder_tree(music_dir: Path, artists: int, albums_per_artist: int):
+    """Artist/album folders only - enough for folder lookups, cheap to create"""
+    for a in range(artists):
+        for b in range(albums_per_artist):
+            (music_dir / artist_name(a) / album_name(b)).mkdir(parents=True, exist_ok=True)
+
+
+# Words with accents, written NFD half the time (as macOS stores them)
+UNICODE_WORDS = ['Café', 'Señor', 'Björk', 'Ñandú', 'Motörhead', 'Sigur Rós', 'Zoë', 'Ǆemal']
+
+
+def messy_spelling(name: str, rng: random.Random) -> str:
+    """Another spelling with the same canonical key ("R. D. Burman" -> "R.D._BURMAN")"""
+    variant = rng.choice([name.upper(), name.replace(' ', '_'), name.replace(' ', '  '),
+                          name.replace(' ', '.'), f"{name}."])
+    return unicodedata.normalize('NFD', variant) if rng.random() < 0.5 else variant
+
+
+def make_library(root: Path, artists: int = 100, albums: int = 3, tracks: int = 10,
+                 unicode_rate: float = 0.1, duplicate_rate: float = 0.05,
+                 formats=('mp3', 'flac', 'm4a'), mcatalogid_rate: float = 0.8,
+                 playlists: int = 10, playlist_length: int = 50, seed: int = 1) -> Dict[str, int]:
+    """
+    Tagged library under root/music with un-normalized names, plus .m3u playlists
+    under root/playlists that reference tracks by their current paths (relative or
+    absolute - copy the tree with copy_library() to keep those pointing into the
+    copy) and a few that do not exist. duplicate_rate of the artists also get a
+    second folder spelled differently, for canonical merges. Returns counts.
+    """
+    rng = random.Random(seed)
+    music = root / 'music'
+    tracks_written: List[Path] = []
+    counts = Counter()
+
+    for a in range(artists):
+        artist = artist_name(a)
+        if rng.random() < unicode_rate:
+            artist = f"{rng.choice(UNICODE_WORDS)} {artist}"
+            if rng.random() < 0.5:
+                artist = unicodedata.normalize('NFD', artist)
+        folders = [artist]
+        if rng.random() < duplicate_rate:
+            folders.append(messy_spelling(artist, rng))
+            counts['duplicate_artists'] += 1
+
+        for b in range(albums):
+            album = f"{album_name(b)} ({1970 + rng.randrange(50)})"
+            folder = music / rng.choice(folders) / album
+            folder.mkdir(parents=True, exist_ok=True)
+            for t in range(tracks):
+                fmt = formats[(a + b + t) % len(formats)]
+                title = f"Track {t} {rng.choice(UNICODE_WORDS)}" if rng.random() < unicode_rate else f"Track {t}"
+                path = folder / f"{t + 1:02d} {title}.{fmt}"
+                mcatalogid = f"id{a}x{b}x{t}" if rng.random() < mcatalogid_rate else None
+                WRITERS[fmt](path, artist, album, title, mcatalogid=mcatalogid)
+                tracks_written.append(path)
+                counts[fmt] += 1
+            (folder / 'cover.jpg').write_bytes(b'\xff\xd8\xff')
+        counts['artist_folders'] += len(folders)
+
+    (music / 'Empty Artist' / 'Nothing Here').mkdir(parents=True)
+
+    playlist_dir = root / 'playlists'
+    playlist_dir.mkdir(parents=True, exist_ok=True)
+    for p in range(playlists):
+        lines = ['#EXTM3U']
+        for _ in range(playlist_length):
+            track = rng.choice(tracks_written)
+            roll = rng.random()
+            if roll < 0.05:
+                lines.append(f"Missing Artist/Gone/{track.name}")
+            elif roll < 0.25:
+                lines.append(str(track))
+            else:
+                lines.append(str(track.relative_to(music)))
+        (playlist_dir / f"Playlist {p:03d}.m3u").write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+    counts['tracks'] = len(tracks_written)
+    counts['playlists'] = playlists
+    return dict(counts)
+
+
+def copy_library(template: Path, dest: Path):
+    """
+    Copy a make_library() tree to dest, pointing its absolute playlist entries
+    at dest/music, so they still resolve into the copy and not the template
+    """
+    shutil.copytree(template, dest, symlinks=True)
+    old_prefix, new_prefix = str(template / 'music') + os.sep, str(dest / 'music') + os.sep
+    for playlist in (dest / 'playlists').glob('*.m3u'):
+        lines = playlist.read_text(encoding='utf-8').splitlines()
+        lines = [new_prefix + line[len(old_prefix):] if line.startswith(old_prefix) else line for line in lines]
+        playlist.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+
+def make_ingest_dir(ingest: Path, files: int, artists: int, formats=('mp3', 'flac', 'm4a'),
+                    new_rate: float = 0.1, seed: int = 2):
+    """Tagged loose files for ingest: mostly artists already in the library, spelled differently"""
+    rng = random.Random(seed)
+    ingest.mkdir(parents=True, exist_ok=True)
+    for i in range(files):
+        if rng.random() < new_rate:
+            artist, album = f"New Artist {i % 97}", f"New Album {i % 7}"
+        else:
+            artist = messy_spelling(artist_name(rng.randrange(artists)), rng)
+            album = f"{album_name(rng.randrange(3))}"
+        fmt = formats[i % len(formats)]
+        WRITERS[fmt](ingest / f"Download {i:05d}.{fmt}", artist, album, f"Download {i}", mcatalogid=f"new{i}")
@@ -6,12 +6,32 @@ Renames music files/folders and updates playlists accordingly
 
 import os
 import sys
+import stat
+import time
+import errno
+import json
+import mmap
+import queue
+import select
+import signal
+import struct
+import ctypes
+import ctypes.util
+import bisect
+import hashlib
 import argparse
+import contextlib
 import re
+import shutil
+import sqlite3
+import threading
+import subprocess
 import unicodedata
 from pathlib import Path
-from collections import defaultdict
-from typing import Dict, List, Tuple, Optional
+from collections import Counter, defaultdict
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Tuple, Optional
 
 try:
     from mutagen import File as MutagenFile
@@ -19,12 +39,1574 @@ except ImportError:
     print("ERROR: mutagen not installed. Run: pip install mutagen")
     sys.exit(1)
 
+try:
+    # Mutagen's header parsers, only used by HeaderTagReader; they are not all
+    # public API, so a Mutagen without them just means every file goes to Mutagen
+    from mutagen.flac import StreamInfo as FLACStreamInfo
+    from mutagen.id3 import Frames as ID3_FRAMES
+    from mutagen.mp3 import MPEGInfo
+    from mutagen.mp4 import Atoms, MP4Info, MP4NoTrackError
+except ImportError:
+    FLACStreamInfo = MPEGInfo = Atoms = MP4Info = None
+    ID3_FRAMES = {}
+    MP4NoTrackError = Exception
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # Only needed for --fingerprint
+
+
+DEFAULT_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'music-library-normalizer'
+DEFAULT_TAG_CACHE = DEFAULT_CACHE_DIR / 'tags.sqlite'
+
+
+# Trailing "-[mid-value]" (or "-[value]") suffix on a file stem
+MCATALOGID_SUFFIX = re.compile(r'-\[(?:mid-)?([^\]]+)\]$')
+
+# Every "-[mid-value]" (or "-[value]") in a file stem, wherever it appears
+MCATALOGID_ANYWHERE = re.compile(r'-\[(?:mid-)?([^\]]+)\]')
+
+# Name normalization patterns, compiled once
+LEADING_JUNK = re.compile(r'^[^a-zA-Z0-9]+')
+SPACES_AROUND_PUNCTUATION = re.compile(r'\s*([^\w\s-])\s*')
+HYPHEN_RUNS = re.compile(r'-+')
+NON_ALPHANUMERIC = re.compile(r'[^a-z0-9]')
+WINDOWS_RESERVED_NAMES = frozenset({'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3',
+                                    'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+                                    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6',
+                                    'LPT7', 'LPT8', 'LPT9'})
+MAX_NAME_BYTES = 255  # Filesystem length limit for most filesystems
+
+# The same artist/album/track names come up in every phase; keep the most recent ones
+NAME_MEMO_SIZE = 65536
+
+# Record rename plan progress in the checkpoint after this many operations
+PLAN_CHECKPOINT_INTERVAL = 256
+
+# Watch mode: forget the artist/album folder index after this many idle seconds,
+# since other runs (or people) may have added folders meanwhile
+WATCH_INDEX_REFRESH_SECONDS = 60.0
+
+# Duplicate finder: bytes hashed from each end of the audio payload before a full hash
+PARTIAL_HASH_BYTES = 64 * 1024
+HASH_CHUNK_BYTES = 1024 * 1024
+
+# Acoustic fingerprints (--fingerprint): the first FINGERPRINT_SECONDS as mono PCM at
+# FINGERPRINT_RATE, 16 bits per FINGERPRINT_CHUNK samples (~0.37 s)
+FINGERPRINT_RATE = 5512
+FINGERPRINT_SECONDS = 120
+FINGERPRINT_CHUNK = 2048
+FINGERPRINT_MAX_BIT_ERRORS = 0.2  # Fraction of differing bits still counted as the same recording
+FINGERPRINT_MAX_SHIFT = 2  # Chunks of offset tried when comparing, for what trimming misses
+FINGERPRINT_SILENCE = 64  # Leading samples quieter than this are trimmed (encoder delay, gaps)
+FINGERPRINT_DURATION_TOLERANCE = 2.0  # Seconds; only tracks this close in length are compared
+FINGERPRINT_BATCH = 64  # Fingerprints committed to the tag cache at a time
+
+# --metrics: seconds between progress lines, and upper bounds (ms) of the tag parse
+# latency histogram buckets (plus one bucket for anything slower)
+METRICS_INTERVAL = 5.0
+TAG_LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 250, 500, 1000)
+
+# Where MCATALOGID is looked for, in order (from the create_M4A_Track / create_FLAC_Track / WMA code)
+MP4_MCATALOGID_KEYS = ('mcat', 'MCAT', '----:com.apple.iTunes:CUSTOM1', '----:com.apple.iTunes:CUSTOM2',
+                       '----:com.apple.iTunes:MusicIP PUID', 'MCATALOGID')
+VORBIS_MCATALOGID_KEYS = ('MCATALOGID', 'mcatalogid', 'CUSTOM1', 'CUSTOM2', 'MUSICIP_PUID',
+                          'MUSICIP/PUID')  # The last one is the WMA variant
+
+
+@lru_cache(maxsize=NAME_MEMO_SIZE)
+def name_canonical_key(name: str) -> str:
+    """NFC, lowercase, alphanumerics only (see MusicLibraryNormalizer.get_canonical_key)"""
+    return NON_ALPHANUMERIC.sub('', unicodedata.normalize('NFC', name).lower())
+
+
+def slugify(text: str) -> str:
+    """Lowercase, hyphenated form shared by file stems and folder names"""
+    # Lowercase, underscores to hyphens, drop all dots (only an extension keeps its dot)
+    text = text.lower().replace('_', '-').replace('.', '')
+
+    # Parentheses become spaces (to avoid joining words)
+    text = text.replace('(', ' ').replace(')', ' ')
+
+    # Remove spaces around non-word characters: ", " -> "," and " & " -> "&"
+    text = SPACES_AROUND_PUNCTUATION.sub(r'\1', text)
+
+    # Remaining spaces become hyphens; collapse runs and strip leading/trailing
+    return HYPHEN_RUNS.sub('-', text.replace(' ', '-')).strip('-')
+
+
+@lru_cache(maxsize=NAME_MEMO_SIZE)
+def normalize_name_parts(name: str, is_file: bool) -> Tuple[str, str, Optional[str]]:
+    """
+    Tag-independent part of MusicLibraryNormalizer.normalize_name(), memoized per (name, is_file).
+    Returns (normalized stem or complete folder name, lowercased extension, MCATALOGID
+    already present in the file name).
+    """
+    # NFC first: macOS uses NFD, Linux/Windows use NFC
+    name = unicodedata.normalize('NFC', name)
+
+    # Remove null bytes (can truncate filenames) and path separators (directory traversal)
+    name = name.replace('\x00', '').replace('/', '-').replace('\\', '-')
+
+    if not is_file:
+        clean_name = slugify(LEADING_JUNK.sub('', name))
+
+        if clean_name.upper() in WINDOWS_RESERVED_NAMES:
+            clean_name = f"_{clean_name}"
+
+        if len(clean_name.encode('utf-8')) > MAX_NAME_BYTES:
+            # Truncate at UTF-8 byte boundary, without a dangling hyphen
+            clean_name = clean_name.encode('utf-8')[:MAX_NAME_BYTES].decode('utf-8', errors='ignore')
+            clean_name = clean_name.rstrip('-')
+
+        return clean_name, '', None
+
+    stem, dot, ext = name.rpartition('.')
+    if not dot:
+        stem, ext = name, ''
+    else:
+        ext = '.' + ext.lower()
+
+    # An existing -[mid-value] / -[value] suffix is dropped here and re-added later
+    stem = LEADING_JUNK.sub('', stem)
+    match = MCATALOGID_SUFFIX.search(stem)
+    if match:
+        stem = stem[:match.start()]
+
+    return slugify(stem), ext, match.group(1) if match else None
+
+
+def audio_payload_range(f, size: int, ext: str) -> Tuple[int, int]:
+    """
+    Byte range of the audio data in an open file, leaving out tag blocks:
+    ID3v2/ID3v1/APEv2 around MP3 and AAC streams, FLAC metadata blocks, the
+    mdat atom of MP4 and the data chunk of WAV. Other formats (and anything that
+    doesn't parse) are taken whole, tags included.
+    """
+    start, end = 0, size
+    try:
+        if ext in ('.mp3', '.aac'):
+            f.seek(0)
+            header = f.read(10)
+            while len(header) == 10 and header[:3] == b'ID3':
+                tag_size = ((header[6] & 0x7f) << 21 | (header[7] & 0x7f) << 14
+                            | (header[8] & 0x7f) << 7 | header[9] & 0x7f)
+                start += 10 + tag_size + (10 if header[5] & 0x10 else 0)  # Footer flag
+                f.seek(start)
+                header = f.read(10)
+            if end - start >= 128:
+                f.seek(end - 128)
+                if f.read(3) == b'TAG':
+                    end -= 128
+            if end - start >= 32:
+                f.seek(end - 32)
+                footer = f.read(32)
+                if footer[:8] == b'APETAGEX':
+                    ape_size = int.from_bytes(footer[12:16], 'little')
+                    has_header = int.from_bytes(footer[20:24], 'little') & 0x80000000
+                    end -= ape_size + (32 if has_header else 0)
+
+        elif ext == '.flac':
+            f.seek(0)
+            if f.read(4) == b'fLaC':
+                start = 4
+                while True:
+                    header = f.read(4)
+                    if len(header) < 4:
+                        return 0, size
+                    start += 4 + int.from_bytes(header[1:4], 'big')
+                    if header[0] & 0x80:  # Last metadata block
+                        break
+                    f.seek(start)
+
+        elif ext in ('.m4a', '.mp4'):
+            pos = 0
+            while pos + 8 <= size:
+                f.seek(pos)
+                atom_size, atom_type = struct.unpack('>I4s', f.read(8))
+                header_size = 8
+                if atom_size == 1:
+                    atom_size = struct.unpack('>Q', f.read(8))[0]
+                    header_size = 16
+                elif atom_size == 0:
+                    atom_size = size - pos
+                if atom_size < header_size:
+                    break
+                if atom_type == b'mdat':
+                    return pos + header_size, min(pos + atom_size, size)
+                pos += atom_size
+
+        elif ext == '.wav':
+            f.seek(0)
+            if f.read(12)[8:12] == b'WAVE':
+                pos = 12
+                while pos + 8 <= size:
+                    f.seek(pos)
+                    chunk_id, chunk_size = struct.unpack('<4sI', f.read(8))
+                    if chunk_id == b'data':
+                        return pos + 8, min(pos + 8 + chunk_size, size)
+                    pos += 8 + chunk_size + (chunk_size & 1)
+    except (OSError, struct.error):
+        return 0, size
+
+    return (start, end) if start <= end <= size else (0, size)
+
+
+class TagRecord(NamedTuple):
+    """Tag fields the normalizer needs from one audio file"""
+    tag_type: Optional[str]
+    mcatalogid: Optional[str]
+    artist: Optional[str]
+    album_artist: Optional[str]
+    album: Optional[str]
+    title: Optional[str]
+    duration: Optional[float]
+
+    @property
+    def library_artist(self) -> Optional[str]:
+        """Artist the file is filed under - album artist preferred"""
+        return self.album_artist or self.artist
+
+
+EMPTY_TAG_RECORD = TagRecord(*[None] * len(TagRecord._fields))
+
+
+class HeaderTagReader:
+    """
+    Header-only tag reading for MP3 (ID3v2.3/2.4), FLAC and MP4/M4A. The file is
+    memory-mapped and only the frame, block and atom headers are walked, so embedded
+    artwork (APIC, PICTURE, covr) is never paged in; just the TXXX/Vorbis
+    comment/freeform values and the four text fields the normalizer uses are decoded.
+    Mutagen reads and parses the whole tag. Stream info still comes from Mutagen's
+    header parsers (MPEGInfo, FLAC STREAMINFO, MP4Info). Anything unusual -
+    unsynchronisation, extended headers, compressed or encrypted frames, text
+    Mutagen would repair, an ID3v1 tag to merge, duplicate blocks, chapters -
+    returns None and the caller uses Mutagen, so the record is the same either way.
+    """
+
+    ID3_FIELDS = {b'TPE1': 'artist', b'TPE2': 'album_artist', b'TALB': 'album', b'TIT2': 'title'}
+    ID3_FRAME_IDS = frozenset(name.encode('ascii') for name in ID3_FRAMES)
+    ID3_ENCODINGS = {0: ('latin-1', 1), 1: ('utf-16', 2), 2: ('utf-16-be', 2), 3: ('utf-8', 1)}
+    # Frame flags that change how the data is read: v2.3 compression/encryption/grouping,
+    # v2.4 grouping/compression/encryption/unsynchronisation/data length
+    ID3_DATA_FLAGS = {3: 0x00e0, 4: 0x004f}
+
+    VORBIS_FIELDS = {'artist': 'artist', 'albumartist': 'album_artist', 'album': 'album', 'title': 'title'}
+
+    MP4_FIELDS = {'\xa9ART': 'artist', 'aART': 'album_artist', '\xa9alb': 'album', '\xa9nam': 'title'}
+
+    @classmethod
+    def read(cls, file_path: Path) -> Optional[Tuple[TagRecord, str]]:
+        """(record, file format) as Mutagen would give them, or None to read the file with Mutagen"""
+        reader = {'.mp3': cls.read_mp3, '.flac': cls.read_flac,
+                  '.m4a': cls.read_mp4, '.mp4': cls.read_mp4}.get(file_path.suffix.lower())
+        if reader is None or Atoms is None:
+            return None
+        try:
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < 16:
+                    return None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return reader(f, data)
+        except Exception:
+            # Whatever went wrong, Mutagen reports it (or copes) the usual way
+            return None
+
+    @staticmethod
+    def first_text(values) -> Optional[str]:
+        """First value, stripped - what tag_text() makes of the same tag"""
+        if not values:
+            return None
+        value = values[0]
+        if isinstance(value, bytes):
+            value = value.decode('utf-8', errors='ignore')
+        return value.strip() or None
+
+    @staticmethod
+    def unsyncsafe(value: int) -> int:
+        """Syncsafe integer (7 bits per byte) as stored in ID3v2.4 sizes"""
+        return ((value >> 24 & 0x7f) << 21 | (value >> 16 & 0x7f) << 14
+                | (value >> 8 & 0x7f) << 7 | value & 0x7f)
+
+    @classmethod
+    def id3v24_sizes_syncsafe(cls, data, start: int, end: int) -> bool:
+        """
+        Whether v2.4 frame sizes are syncsafe - iTunes used to write plain integers.
+        Decided as Mutagen decides it: whichever reading lands on more known frame
+        IDs, with ties going to the one that ends cleanly at the padding.
+        """
+        found, overshoot = [], []
+        for syncsafe in (True, False):
+            pos, count = start, 0
+            while pos < end - 10:
+                if data[pos:pos + 10] == b'\x00' * 10:
+                    past = -((end - pos) % 10)
+                    break
+                name, size = struct.unpack_from('>4sL', data, pos)
+                pos += 10 + (cls.unsyncsafe(size) if syncsafe else size)
+                count += name in cls.ID3_FRAME_IDS
+            else:
+                past = pos - end
+            found.append(count)
+            overshoot.append(past)
+        as_int_wins = found[1] > found[0] or (found[1] == found[0] and overshoot[0] >= 1 and overshoot[1] <= 1)
+        return not as_int_wins
+
+    @classmethod
+    def id3_text(cls, body: bytes, version: int) -> List[str]:
+        """
+        Values of a text frame (encoding byte, then NUL-separated text).
+        Raises ValueError for anything Mutagen would repair or drop as junk.
+        """
+        if not body or body[0] not in cls.ID3_ENCODINGS:
+            raise ValueError("unknown text encoding")
+        codec, width = cls.ID3_ENCODINGS[body[0]]
+        data = body[1:]
+        values = []
+        while data:
+            end = data.find(b'\x00' * width)
+            while width == 2 and end >= 0 and end % 2:
+                end = data.find(b'\x00\x00', end + 1)
+            if end < 0:
+                if len(data) % width:
+                    raise ValueError("odd-length UTF-16")
+                value, data = data, b''
+            else:
+                value, data = data[:end], data[end + width:]
+            if codec == 'utf-16' and value and value[:2] not in (b'\xff\xfe', b'\xfe\xff'):
+                raise ValueError("UTF-16 without a byte order mark")
+            values.append(value.decode(codec))
+            if version < 4 and not data.strip(b'\x00'):
+                data = b''  # v2.3 zero padding, not more (empty) values
+        if not values:
+            raise ValueError("empty text frame")
+        return values
+
+    @classmethod
+    def read_mp3(cls, f, data) -> Optional[Tuple[TagRecord, str]]:
+        if data[:3] != b'ID3':
+            return None
+        version, flags, size = data[3], data[5], struct.unpack_from('>L', data, 6)[0]
+        if version not in (3, 4) or size & 0x80808080:
+            return None
+        if flags & 0xd0 or flags & (0x0f if version == 4 else 0x1f):
+            return None  # Unsynchronisation, extended header, footer or undefined flags
+        tag_end = 10 + cls.unsyncsafe(size)
+        if tag_end > len(data):
+            return None
+        syncsafe = version == 4 and cls.id3v24_sizes_syncsafe(data, 10, tag_end)
+
+        fields: Dict[str, Optional[str]] = {}
+        mcatalogid, found_mcatalogid = None, False
+        pos = 10
+        while pos + 10 <= tag_end:
+            name, size, frame_flags = struct.unpack_from('>4sLH', data, pos)
+            if not name.strip(b'\x00'):
+                break  # Padding
+            if syncsafe:
+                size = cls.unsyncsafe(size)
+            body_start, pos = pos + 10, pos + 10 + size
+            if size == 0:
+                continue
+            if name.endswith(b'\x00'):
+                return None  # v2.2 frame name in a v2.3/2.4 tag, Mutagen upgrades those
+            if name not in cls.ID3_FIELDS and name != b'TXXX':
+                continue
+            if frame_flags & cls.ID3_DATA_FLAGS[version]:
+                return None
+            values = cls.id3_text(data[body_start:min(pos, tag_end)], version)
+            if name == b'TXXX':
+                if len(values) < 2:
+                    return None  # No value after the description: Mutagen drops the frame
+                # First TXXX with the description, in any case, as extract_tags() picks it
+                if not found_mcatalogid and values[0] and values[0].upper() == 'MCATALOGID':
+                    mcatalogid, found_mcatalogid = cls.first_text(values[1:]), True
+            elif cls.ID3_FIELDS[name] not in fields:
+                # Later frames with the same ID are merged after this one's values
+                fields[cls.ID3_FIELDS[name]] = cls.first_text(values)
+
+        if not {'artist', 'album', 'title'} <= fields.keys():
+            return None  # Mutagen fills these in from an ID3v1 tag if there is one
+        duration = MPEGInfo(f, tag_end).length
+        return TagRecord('ID3', mcatalogid, fields.get('artist'), fields.get('album_artist'),
+                         fields['album'], fields['title'], duration), 'MP3'
+
+    @classmethod
+    def read_flac(cls, f, data) -> Optional[Tuple[TagRecord, str]]:
+        if data[:4] != b'fLaC':
+            return None
+        streaminfo = comments = None
+        seen = Counter()
+        pos, last = 4, False
+        while not last:
+            if pos + 4 > len(data):
+                return None
+            header, size = data[pos], int.from_bytes(data[pos + 1:pos + 4], 'big')
+            code, last = header & 0x7f, bool(header & 0x80)
+            start, pos = pos + 4, pos + 4 + size
+            if pos > len(data):
+                return None
+            seen[code] += 1
+            if code == 0 and streaminfo is None:
+                streaminfo = FLACStreamInfo(data[start:pos])
+            elif code == 4:
+                if seen[code] > 1:
+                    return None
+                comments = cls.vorbis_comments(data, start, pos)
+            elif code == 6:
+                # PICTURE: only the lengths are read, to check the block size adds up
+                mime_end = start + 8 + struct.unpack_from('>L', data, start + 4)[0]
+                desc_end = mime_end + 4 + struct.unpack_from('>L', data, mime_end)[0]
+                if desc_end + 20 + struct.unpack_from('>L', data, desc_end + 16)[0] != pos:
+                    return None
+            elif code == 5 or code == 3 and seen[code] > 1:
+                return None  # Mutagen parses cue sheets; a second seek table is an error
+        if streaminfo is None:
+            return None
+
+        duration = streaminfo.length
+        if not comments:
+            return EMPTY_TAG_RECORD._replace(duration=duration), 'FLAC'
+
+        values: Dict[str, List[str]] = defaultdict(list)
+        for key, value in comments:
+            values[key.lower()].append(value)
+        fields = {field: cls.first_text(values.get(key)) for key, field in cls.VORBIS_FIELDS.items()}
+        mcatalogid = next(filter(None, (cls.first_text(values.get(key.lower()))
+                                        for key in VORBIS_MCATALOGID_KEYS)), None)
+        return TagRecord('VCFLACDict', mcatalogid, fields['artist'], fields['album_artist'],
+                         fields['album'], fields['title'], duration), 'FLAC'
+
+    @staticmethod
+    def vorbis_comments(data, start: int, end: int) -> List[Tuple[str, str]]:
+        """(key, value) pairs of a FLAC VORBIS_COMMENT block, keeping the keys Mutagen keeps"""
+        pos = start + 4 + struct.unpack_from('<L', data, start)[0]  # Vendor string
+        count = struct.unpack_from('<L', data, pos)[0]
+        pos += 4
+        comments = []
+        for i in range(count):
+            length = struct.unpack_from('<L', data, pos)[0]
+            comment = data[pos + 4:pos + 4 + length].decode('utf-8', 'replace')
+            pos += 4 + length
+            key, sep, value = comment.partition('=')
+            if not sep:
+                key, value = f"unknown{i}", comment
+            elif not key.isascii():
+                raise ValueError("non-ASCII comment key")
+            if key and all(' ' <= c <= '}' and c != '=' for c in key):
+                comments.append((key, value))
+        if pos != end:
+            raise ValueError("comment block size doesn't match its contents")
+        return comments
+
+    @classmethod
+    def read_mp4(cls, f, data) -> Optional[Tuple[TagRecord, str]]:
+        if data[4:8] != b'ftyp':
+            return None
+        atoms = Atoms(f)  # Atom headers only
+        if b'moov.udta.chpl' in atoms:
+            return None
+        info = MP4Info()
+        try:
+            info.load(atoms, f)
+        except MP4NoTrackError:
+            pass
+        if b'moov.udta.meta.ilst' not in atoms:
+            return EMPTY_TAG_RECORD._replace(duration=info.length), 'MP4'
+
+        children = atoms.path(b'moov', b'udta', b'meta', b'ilst')[-1].children
+        if any(atom.offset + atom.length > len(data) for atom in children):
+            return None  # Mutagen gives up on a truncated item
+        items: Dict[str, list] = {}
+        skipped = False
+        for atom in children:
+            end = atom.offset + atom.length
+            if atom.name == b'----':
+                key, values = cls.mp4_freeform(atom, data[end - atom.datalength:end])
+            else:
+                key = atom.name.decode('latin-1')
+                if key not in cls.MP4_FIELDS and key not in MP4_MCATALOGID_KEYS:
+                    skipped = True  # covr and everything else: never read
+                    continue
+                values = cls.mp4_text(atom, data[end - atom.datalength:end], implicit=key in cls.MP4_FIELDS)
+            if values is not None:
+                items.setdefault(key, []).extend(values)
+        if not items:
+            if skipped:
+                return None  # Whether Mutagen finds any tags at all depends on the items not read
+            return EMPTY_TAG_RECORD._replace(duration=info.length), 'MP4'
+
+        fields = {field: cls.first_text(items.get(key)) for key, field in cls.MP4_FIELDS.items()}
+        mcatalogid = next(filter(None, (cls.first_text(items.get(key)) for key in MP4_MCATALOGID_KEYS)), None)
+        return TagRecord('MP4Tags', mcatalogid, fields['artist'], fields['album_artist'],
+                         fields['album'], fields['title'], info.length), 'MP4'
+
+    @staticmethod
+    def mp4_text(atom, payload: bytes, implicit: bool) -> Optional[List[str]]:
+        """
+        Text of an ilst item's data atoms, or None where Mutagen skips the item:
+        known text items may be implicitly typed, other items only count as UTF-8.
+        """
+        values = []
+        pos = 0
+        while pos < atom.length - 8:
+            head = payload[pos:pos + 12]
+            if len(head) != 12:
+                return None
+            length, name = struct.unpack('>I4s', head[:8])
+            chunk = payload[pos + 16:pos + length]
+            if length < 1 or name != b'data' or len(chunk) != length - 16:
+                return None
+            if int.from_bytes(head[9:12], 'big') not in ((0, 1) if implicit else (1,)):
+                return None
+            try:
+                values.append(chunk.decode('utf-8'))
+            except UnicodeDecodeError:
+                return None
+            pos += length
+        return values
+
+    @staticmethod
+    def mp4_freeform(atom, payload: bytes) -> Tuple[str, Optional[List[bytes]]]:
+        """('----:mean:name' key, raw values) of a freeform item; values None where Mutagen skips it"""
+        length = struct.unpack_from('>L', payload, 0)[0]
+        mean = payload[12:length]
+        pos = length
+        length = struct.unpack_from('>L', payload, pos)[0]
+        name = payload[pos + 12:pos + length]
+        pos += length
+        key = (b'----:' + mean + b':' + name).decode('latin-1')
+        values = []
+        while pos < atom.length - 8:
+            length, data_name = struct.unpack_from('>I4s', payload, pos)
+            if data_name != b'data' or length < 1:
+                return key, None
+            struct.unpack_from('>4B', payload, pos + 8)  # Version and flags, which Mutagen reads
+            values.append(payload[pos + 16:pos + length])
+            pos += length
+        return key, values
+
+
+class TagCache:
+    """
+    Persistent SQLite cache of tag records.
+    Rows are keyed by path and validated against (device, inode, size, mtime),
+    so a file is only parsed again when it actually changed. A renamed file keeps
+    its inode and mtime, so it is found again through the inode index.
+    The connection is shared with the watch worker thread, so every call takes
+    the cache lock.
+    """
+
+    SCHEMA_VERSION = 3
+    COMMIT_EVERY = 500
+    COLUMNS = ', '.join(TagRecord._fields)
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.lock = threading.RLock()
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+
+        # Drop rows written by an older layout instead of migrating them
+        # (version 3 only changed how fingerprints are computed)
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        if version != self.SCHEMA_VERSION:
+            if version < 2:
+                self.conn.execute('DROP TABLE IF EXISTS tags')
+            self.conn.execute('DROP TABLE IF EXISTS fingerprints')
+            self.conn.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS tags (
+                path TEXT PRIMARY KEY,
+                dev INTEGER, ino INTEGER, size INTEGER, mtime_ns INTEGER,
+                tag_type TEXT, mcatalogid TEXT, artist TEXT, album_artist TEXT,
+                album TEXT, title TEXT, duration REAL
+            )""")
+        self.conn.execute('CREATE INDEX IF NOT EXISTS tags_inode ON tags (dev, ino)')
+        # Audio payload range and hashes for the duplicate finder, per inode
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS content (
+                dev INTEGER, ino INTEGER, size INTEGER, mtime_ns INTEGER,
+                payload_start INTEGER, payload_end INTEGER, partial TEXT, full TEXT,
+                PRIMARY KEY (dev, ino)
+            )""")
+        # Acoustic fingerprints (empty for files ffmpeg could not decode), per inode
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS fingerprints (
+                dev INTEGER, ino INTEGER, size INTEGER, mtime_ns INTEGER,
+                fingerprint BLOB,
+                PRIMARY KEY (dev, ino)
+            )""")
+        self.conn.commit()
+
+        self.pending = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def stat_key(st: os.stat_result) -> Tuple[int, int, int, int]:
+        return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def get(self, file_path: Path, st: os.stat_result) -> Optional[TagRecord]:
+        """Return the cached record if the file is unchanged, None otherwise"""
+        with self.lock:
+            key = self.stat_key(st)
+            row = self.conn.execute(
+                f'SELECT dev, ino, size, mtime_ns, {self.COLUMNS} FROM tags WHERE path = ?',
+                (str(file_path),)).fetchone()
+
+            if row is None or tuple(row[:4]) != key:
+                # Not under this path (or stale) - the file may have been renamed
+                row = self.conn.execute(
+                    f'SELECT dev, ino, size, mtime_ns, {self.COLUMNS} FROM tags '
+                    'WHERE dev = ? AND ino = ? AND size = ? AND mtime_ns = ?', key).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                record = TagRecord(*row[4:])
+                self.put(file_path, st, record)
+            else:
+                record = TagRecord(*row[4:])
+
+            self.hits += 1
+            return record
+
+    def put(self, file_path: Path, st: os.stat_result, record: TagRecord):
+        """Store record for file_path, replacing rows for the same inode"""
+        with self.lock:
+            key = self.stat_key(st)
+            self.conn.execute('DELETE FROM tags WHERE dev = ? AND ino = ? AND path != ?',
+                              (key[0], key[1], str(file_path)))
+            placeholders = ', '.join('?' * (5 + len(record)))
+            self.conn.execute(f'INSERT OR REPLACE INTO tags VALUES ({placeholders})',
+                              (str(file_path), *key, *record))
+            self.pending += 1
+            if self.pending >= self.COMMIT_EVERY:
+                self.conn.commit()
+                self.pending = 0
+
+    def get_content(self, st: os.stat_result) -> Optional[List]:
+        """[payload start, payload end, partial hash, full hash] of an unchanged file, or None"""
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT size, mtime_ns, payload_start, payload_end, partial, full FROM content '
+                'WHERE dev = ? AND ino = ?', (st.st_dev, st.st_ino)).fetchone()
+            if row is None or tuple(row[:2]) != (st.st_size, st.st_mtime_ns):
+                return None
+            return list(row[2:])
+
+    def put_content(self, st: os.stat_result, content: List):
+        with self.lock:
+            self.conn.execute('INSERT OR REPLACE INTO content VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                              (*self.stat_key(st), *content))
+            self.pending += 1
+            if self.pending >= self.COMMIT_EVERY:
+                self.conn.commit()
+                self.pending = 0
+
+    def get_fingerprint(self, st: os.stat_result) -> Optional[bytes]:
+        """Fingerprint of an unchanged file (b'' if it could not be decoded), or None"""
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT size, mtime_ns, fingerprint FROM fingerprints WHERE dev = ? AND ino = ?',
+                (st.st_dev, st.st_ino)).fetchone()
+            if row is None or tuple(row[:2]) != (st.st_size, st.st_mtime_ns):
+                return None
+            return bytes(row[2])
+
+    def put_fingerprint(self, st: os.stat_result, fingerprint: bytes):
+        with self.lock:
+            self.conn.execute('INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?, ?)',
+                              (*self.stat_key(st), sqlite3.Binary(fingerprint)))
+            self.pending += 1
+
+    def commit(self):
+        with self.lock:
+            self.conn.commit()
+            self.pending = 0
+
+    def close(self):
+        with self.lock:
+            self.conn.commit()
+            self.conn.close()
+
+
+class LibraryJournal:
+    """
+    Folder state of the library after the last normal-mode run (--incremental).
+    Each folder is stored as [inode, mtime, contains audio, canonical key] under
+    its path relative to the library root. Adding, removing or renaming an entry
+    bumps the mtime of the folder holding it, so a folder whose inode and mtime
+    still match has nothing new in it and does not need to be listed again.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path, music_dir: Path):
+        self.path = path
+        self.music_dir = music_dir
+        self.dirs: Dict[str, list] = {}
+
+    @staticmethod
+    def default_path(music_dir: Path) -> Path:
+        """One journal per library, named after a hash of its root path"""
+        digest = hashlib.sha1(str(music_dir).encode('utf-8')).hexdigest()[:16]
+        return DEFAULT_CACHE_DIR / 'journals' / f'{digest}.json'
+
+    def root_key(self) -> Optional[List[int]]:
+        try:
+            st = os.stat(self.music_dir)
+        except OSError:
+            return None
+        return [st.st_dev, st.st_ino]
+
+    def load(self) -> Optional[str]:
+        """Load the journal. Returns the reason it can't be used, or None."""
+        self.dirs = {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return "no journal yet"
+        except (OSError, ValueError) as e:
+            return f"unreadable journal: {e}"
+
+        if not isinstance(data, dict) or data.get('version') != self.VERSION:
+            return "journal version mismatch"
+        if data.get('music_dir') != str(self.music_dir) or data.get('root') != self.root_key():
+            return "journal belongs to a different library"
+        if not isinstance(data.get('dirs'), dict) or '.' not in data['dirs']:
+            return "journal is incomplete"
+
+        self.dirs = data['dirs']
+        return None
+
+    def save(self, dirs: Dict[str, list]):
+        """Replace the journal atomically"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.VERSION, 'music_dir': str(self.music_dir),
+                       'root': self.root_key(), 'dirs': dirs}, f, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+        self.dirs = dirs
+
+
+class RenameMap:
+    """
+    original path -> renamed path, with the renamed side indexed too.
+    Renamed paths live in a path-component trie, so "which originals now map
+    to this path" and "everything renamed under this folder" cost O(depth +
+    matches) instead of a scan over every mapping. Parent resolution walks the
+    ancestors of a path against the forward dict, also O(depth).
+    """
+
+    ORIGINALS = '\0'  # Trie key for the originals mapped to a node; never a path component
+
+    def __init__(self):
+        self.forward: Dict[Path, Path] = {}
+        self.trie: Dict = {}
+
+    def _node(self, path: Path, create: bool = False) -> Optional[Dict]:
+        node = self.trie
+        for part in path.parts:
+            child = node.get(part)
+            if child is None:
+                if not create:
+                    return None
+                child = node[part] = {}
+            node = child
+        return node
+
+    def __setitem__(self, original: Path, renamed: Path):
+        previous = self.forward.get(original)
+        if previous is not None:
+            node = self._node(previous)
+            if node is not None:
+                node.get(self.ORIGINALS, {}).pop(original, None)
+        self.forward[original] = renamed
+        self._node(renamed, create=True).setdefault(self.ORIGINALS, {})[original] = None
+
+    def __getitem__(self, original: Path) -> Path:
+        return self.forward[original]
+
+    def __contains__(self, original: Path) -> bool:
+        return original in self.forward
+
+    def __len__(self) -> int:
+        return len(self.forward)
+
+    def get(self, original: Path, default: Optional[Path] = None) -> Optional[Path]:
+        return self.forward.get(original, default)
+
+    def items(self):
+        return self.forward.items()
+
+    def original_of(self, renamed: Path) -> Optional[Path]:
+        """First original (in mapping order) currently renamed to exactly this path"""
+        node = self._node(renamed)
+        if node is None or not node.get(self.ORIGINALS):
+            return None
+        return next(iter(node[self.ORIGINALS]))
+
+    def move_tree(self, old_parent: Path, new_parent: Path):
+        """Re-point every mapping whose renamed path is old_parent or below it"""
+        node = self._node(old_parent)
+        if node is None:
+            return
+
+        updates = []
+        stack = [(node, Path())]
+        while stack:
+            node, relative = stack.pop()
+            for original in node.get(self.ORIGINALS, ()):
+                updates.append((original, new_parent / relative))
+            for part, child in node.items():
+                if part != self.ORIGINALS:
+                    stack.append((child, relative / part))
+
+        for original, renamed in updates:
+            self[original] = renamed
+
+    def resolve(self, path: Path) -> Path:
+        """Follow renames of path or its ancestors (deepest first) until nothing applies"""
+        seen = set()
+        while path not in seen:
+            seen.add(path)
+            for ancestor in (path, *path.parents):
+                renamed = self.forward.get(ancestor)
+                if renamed is not None and renamed != ancestor:
+                    path = renamed / path.relative_to(ancestor)
+                    break
+            else:
+                break
+        return path
+
+
+class PlanNode:
+    """One folder in a RenamePlan's view of the library"""
+    __slots__ = ('origin', 'entries')
+
+    def __init__(self, origin: Path):
+        self.origin = origin  # Where the folder is on disk until the plan is applied
+        self.entries: Optional[Dict[str, object]] = None  # name -> PlanNode or file's disk Path; listed on first use
+
+
+class RenamePlan:
+    """
+    Every rename, move and folder removal of an organize run, decided up front.
+    Planning works on a view of the library in which each folder is listed once
+    and then updated as operations are added, so conflicts and merge targets are
+    judged against the tree as it will be, not as it was. The operations are
+    [op, source, target] with paths relative to the library: 'rename' within a
+    folder, 'move' into another folder (merges) and 'rmdir' of an emptied merge
+    source. The dry run prints the plan; normal mode applies it, checkpointing
+    progress to a JSON Lines file so an interrupted run can be resumed.
+    """
+
+    VERSION = 1
+
+    def __init__(self, music_dir: Path):
+        self.music_dir = music_dir
+        self.music_dir_prefix = os.path.join(str(music_dir), '')
+        self.root = PlanNode(music_dir)
+        self.operations: List[List[str]] = []
+        self.done = 0  # Operations already applied (resumed checkpoints)
+
+    @staticmethod
+    def default_checkpoint(music_dir: Path) -> Path:
+        """One checkpoint per library, named after a hash of its root path"""
+        digest = hashlib.sha1(str(music_dir).encode('utf-8')).hexdigest()[:16]
+        return DEFAULT_CACHE_DIR / 'plans' / f'{digest}.jsonl'
+
+    def entries(self, node: PlanNode) -> Dict[str, object]:
+        if node.entries is None:
+            node.entries = {}
+            try:
+                with os.scandir(node.origin) as it:
+                    for entry in it:
+                        node.entries[entry.name] = PlanNode(Path(entry.path)) if entry.is_dir() else Path(entry.path)
+            except OSError:
+                pass
+        return node.entries
+
+    def relative(self, path: Path) -> Optional[str]:
+        """path relative to the library ('' for the root), None if outside it"""
+        path_str = str(path)
+        if path_str.startswith(self.music_dir_prefix):
+            return path_str[len(self.music_dir_prefix):]
+        return '' if path_str == str(self.music_dir) else None
+
+    def lookup(self, path: Path):
+        """The PlanNode (folder) or disk path (file) planned to be at path, or None"""
+        rel = self.relative(path)
+        if rel is None:
+            return None
+        entry = self.root
+        for part in rel.split(os.sep) if rel else ():
+            if not isinstance(entry, PlanNode):
+                return None
+            entry = self.entries(entry).get(part)
+            if entry is None:
+                return None
+        return entry
+
+    def exists(self, path: Path) -> bool:
+        return self.lookup(path) is not None
+
+    def is_dir(self, path: Path) -> bool:
+        return isinstance(self.lookup(path), PlanNode)
+
+    def disk_path(self, path: Path) -> Optional[Path]:
+        """Where whatever is planned to be at path can be read before the plan is applied"""
+        entry = self.lookup(path)
+        return entry.origin if isinstance(entry, PlanNode) else entry
+
+    def children(self, folder: Path) -> List[str]:
+        node = self.lookup(folder)
+        return sorted(self.entries(node)) if isinstance(node, PlanNode) else []
+
+    def move(self, source: Path, target: Path):
+        """Plan source -> target; never onto something that will exist"""
+        target_entries = self.entries(self.lookup(target.parent))
+        if target.name in target_entries:
+            raise FileExistsError(errno.EEXIST, "Target already exists", str(target))
+        target_entries[target.name] = self.entries(self.lookup(source.parent)).pop(source.name)
+        op = 'rename' if source.parent == target.parent else 'move'
+        self.operations.append([op, self.relative(source), self.relative(target)])
+
+    def rmdir(self, folder: Path):
+        """Plan removing a folder that will be empty by then"""
+        if self.entries(self.lookup(folder)):
+            raise OSError(errno.ENOTEMPTY, "Directory not empty", str(folder))
+        del self.entries(self.lookup(folder.parent))[folder.name]
+        self.operations.append(['rmdir', self.relative(folder), ''])
+
+    def save(self, path: Path):
+        """Write the plan as a checkpoint: a header line, then one operation per line"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'version': self.VERSION, 'music_dir': str(self.music_dir),
+                                'operations': len(self.operations)}) + '\n')
+            for operation in self.operations:
+                f.write(json.dumps(operation) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def load(self, path: Path) -> Optional[str]:
+        """Load a checkpoint and how far it got. Returns the reason it can't be used, or None."""
+        try:
+            with open(path, encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return "no checkpoint"
+        except (OSError, UnicodeDecodeError) as e:
+            return f"unreadable checkpoint: {e}"
+
+        try:
+            header = json.loads(lines[0])
+        except (IndexError, ValueError):
+            return "checkpoint is incomplete"
+        if not isinstance(header, dict) or header.get('version') != self.VERSION:
+            return "checkpoint version mismatch"
+        if header.get('music_dir') != str(self.music_dir):
+            return "checkpoint belongs to a different library"
+
+        operations, done = [], 0
+        for number, line in enumerate(lines[1:], 2):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                if number == len(lines):
+                    break  # Progress line cut short by the interruption
+                return f"checkpoint is corrupt at line {number}"
+            if isinstance(record, list):
+                operations.append(record)
+            else:
+                done = max(done, record.get('done', 0))
+        if len(operations) != header.get('operations'):
+            return "checkpoint is incomplete"
+
+        self.operations, self.done = operations, min(done, len(operations))
+        return None
+
+
+class PathTrieNode:
+    """One directory in a LibraryPathIndex"""
+    __slots__ = ('children', 'files', 'canonical_dirs', 'canonical_files', 'walked')
+
+    def __init__(self):
+        self.children: Dict[str, 'PathTrieNode'] = {}  # exact dir name -> node
+        self.files = set()  # exact file names
+        self.canonical_dirs: Dict[str, str] = {}  # canonical key -> dir name
+        self.canonical_files: Dict[Tuple[str, str], str] = {}  # (canonical stem, ext) -> audio file name
+        self.walked = False  # False for skipped and symlinked folders: contents unknown
+
+
+class LibraryPathIndex:
+    """
+    Canonical-path trie of the library, built from a single walk.
+    Resolves a playlist path to the file it refers to after renames and merges
+    in O(depth) dictionary lookups instead of listing every directory on the way.
+    Matching rules are those of find_normalized_path: directories by canonical
+    key, audio files by canonical stem (MCATALOGID ignored) plus extension.
+    On canonical collisions the first name in sorted order wins.
+    """
+
+    def __init__(self, root: Path, canonical_key, should_skip_dir, audio_extensions):
+        self.root = root
+        self.canonical_key = canonical_key
+        self.audio_extensions = tuple(audio_extensions)
+        self.root_node = PathTrieNode()
+        self.file_count = 0
+        self.by_name: Optional[Dict[Tuple[str, str], List[Tuple[str, ...]]]] = None  # built by unique_by_name
+
+        nodes = {str(root): self.root_node}
+        for dirpath, dirs, files in os.walk(root, followlinks=False):
+            node = nodes[dirpath]
+            node.walked = True
+            dirs.sort()
+            for dirname in dirs:
+                child = PathTrieNode()
+                node.children[dirname] = child
+                nodes[os.path.join(dirpath, dirname)] = child
+                if not should_skip_dir(dirname):
+                    node.canonical_dirs.setdefault(canonical_key(dirname), dirname)
+            # Skipped directories are known to exist but never descended into
+            dirs[:] = [d for d in dirs if not should_skip_dir(d)]
+
+            for filename in sorted(files):
+                node.files.add(filename)
+                if '.' in filename:
+                    stem, ext = filename.rsplit('.', 1)
+                    ext = '.' + ext.lower()
+                    if ext in self.audio_extensions:
+                        key = (canonical_key(MCATALOGID_SUFFIX.sub('', stem)), ext)
+                        node.canonical_files.setdefault(key, filename)
+            self.file_count += len(files)
+
+    def exact(self, rel_parts: Tuple[str, ...]) -> Optional[str]:
+        """Return 'file' or 'dir' if the path exists exactly as written, else None"""
+        node = self.root_node
+        for i, part in enumerate(rel_parts):
+            if i == len(rel_parts) - 1 and part in node.files:
+                return 'file'
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return 'dir'
+
+    def covers(self, rel_parts: Tuple[str, ...]) -> bool:
+        """
+        True if the walk saw enough to answer exact() for this path without the
+        filesystem. Never for '.' or '..' components: the trie only holds real
+        names, and '..' may lead out of the library.
+        """
+        node = self.root_node
+        for i, part in enumerate(rel_parts):
+            if not node.walked or part in ('.', '..'):
+                return False
+            if i == len(rel_parts) - 1 and part in node.files:
+                return True
+            node = node.children.get(part)
+            if node is None:
+                return True
+        return True
+
+    def resolve(self, rel_parts: Tuple[str, ...]) -> Optional[Path]:
+        """Find the current path of an entry by canonical matching, one component at a time"""
+        node = self.root_node
+        current = self.root
+
+        for i, part in enumerate(rel_parts):
+            if part in ('.', '..'):
+                return None  # Left to the filesystem, see covers()
+            if i == len(rel_parts) - 1 and part.lower().endswith(self.audio_extensions):
+                # Audio file - match canonical stem (without MCATALOGID) and extension
+                stem = part.rsplit('.', 1)[0]
+                ext = '.' + part.rsplit('.', 1)[1].lower()
+                name = node.canonical_files.get((self.canonical_key(MCATALOGID_SUFFIX.sub('', stem)), ext))
+                return current / name if name else None
+
+            # Directory - match canonical key
+            name = node.canonical_dirs.get(self.canonical_key(part))
+            if name is None:
+                return None
+            node = node.children[name]
+            current = current / name
+
+        return current
+
+    def unique_by_name(self, name: str) -> Optional[Path]:
+        """The only audio file anywhere in the library with the canonical name of name, if there is one"""
+        if '.' not in name:
+            return None
+        if self.by_name is None:
+            # From the trie, on first use: only reconcile needs it
+            self.by_name = {}
+            pending = [((), self.root_node)]
+            while pending:
+                parts, node = pending.pop()
+                for key, filename in node.canonical_files.items():
+                    self.by_name.setdefault(key, []).append(parts + (filename,))
+                pending.extend((parts + (dirname,), child) for dirname, child in node.children.items())
+        stem, ext = name.rsplit('.', 1)
+        matches = self.by_name.get((self.canonical_key(MCATALOGID_SUFFIX.sub('', stem)), '.' + ext.lower()), [])
+        return self.root.joinpath(*matches[0]) if len(matches) == 1 else None
+
+
+class DuplicateIndex:
+    """
+    Audio files with identical audio anywhere in the library.
+    Files are narrowed down in three passes, each only over the files still
+    colliding: audio payload size, a hash of the first and last
+    PARTIAL_HASH_BYTES of the payload, and a hash of the whole payload. Tag
+    blocks are left out (audio_payload_range), so the same track tagged for two
+    albums still matches. Payload ranges and hashes are kept in the tag cache,
+    keyed by inode and checked against size and mtime.
+    """
+
+    def __init__(self, tag_cache: Optional[TagCache], jobs: int = 1):
+        self.tag_cache = tag_cache
+        self.jobs = jobs
+        self.stats = Counter()
+
+    @staticmethod
+    def payload_range(file_path: Path, size: int) -> Optional[Tuple[int, int]]:
+        try:
+            with open(file_path, 'rb') as f:
+                return audio_payload_range(f, size, file_path.suffix.lower())
+        except OSError:
+            return None
+
+    @staticmethod
+    def payload_hash(file_path: Path, start: int, end: int, partial: bool) -> Optional[str]:
+        """blake2b of the payload, or of its first and last PARTIAL_HASH_BYTES"""
+        digest = hashlib.blake2b(digest_size=16)
+        if partial and end - start > 2 * PARTIAL_HASH_BYTES:
+            spans = [(start, PARTIAL_HASH_BYTES), (end - PARTIAL_HASH_BYTES, PARTIAL_HASH_BYTES)]
+        else:
+            spans = [(start, end - start)]
+        try:
+            with open(file_path, 'rb') as f:
+                for offset, length in spans:
+                    f.seek(offset)
+                    while length > 0:
+                        chunk = f.read(min(length, HASH_CHUNK_BYTES))
+                        if not chunk:
+                            break
+                        digest.update(chunk)
+                        length -= len(chunk)
+        except OSError:
+            return None
+        return digest.hexdigest()
+
+    @staticmethod
+    def collisions(groups: Dict[tuple, List[Path]]) -> List[Path]:
+        return [path for paths in groups.values() if len(paths) > 1 for path in paths]
+
+    def find(self, files: List[Tuple[Path, os.stat_result]]) -> List[List[Path]]:
+        """Sets of files with identical audio, each sorted, largest set first"""
+        content: Dict[Path, List] = {}
+        stats: Dict[Path, os.stat_result] = {}
+        for file_path, st in files:
+            stats[file_path] = st
+            cached = self.tag_cache.get_content(st) if self.tag_cache else None
+            content[file_path] = cached or [None, None, None, None]
+            self.stats['cached' if cached else 'new'] += 1
+        changed = set()
+
+        executor = ThreadPoolExecutor(max_workers=self.jobs) if self.jobs > 1 else None
+        run = executor.map if executor else map
+        try:
+            # Pass 1: payload size (a few header reads per file)
+            pending = [path for path in content if content[path][0] is None]
+            for file_path, result in zip(pending, run(self.payload_range, pending,
+                                                      [stats[path].st_size for path in pending])):
+                if result is None:
+                    # Gone or unreadable since it was listed
+                    del content[file_path]
+                    self.stats['unreadable'] += 1
+                    continue
+                content[file_path][0:2] = result
+                changed.add(file_path)
+            by_size = defaultdict(list)
+            for file_path, (start, end, _, _) in content.items():
+                if end > start:  # Nothing but tags: no audio to compare
+                    by_size[end - start].append(file_path)
+
+            # Pass 2 and 3: partial, then full hash, of the files still colliding
+            candidates = self.collisions(by_size)
+            for field, partial in ((2, True), (3, False)):
+                pending = [path for path in candidates if content[path][field] is None]
+                self.stats['partial' if partial else 'full'] += len(pending)
+                for file_path, digest in zip(pending, run(
+                        self.payload_hash, pending, [content[path][0] for path in pending],
+                        [content[path][1] for path in pending], [partial] * len(pending))):
+                    if digest is None:
+                        self.stats['unreadable'] += 1
+                        continue
+                    content[file_path][field] = digest
+                    start, end = content[file_path][0:2]
+                    if partial and end - start <= 2 * PARTIAL_HASH_BYTES:
+                        content[file_path][3] = digest  # The partial hash covered all of it
+                    changed.add(file_path)
+                groups = defaultdict(list)
+                for file_path in candidates:
+                    if content[file_path][field] is None:
+                        continue
+                    start, end = content[file_path][0:2]
+                    groups[(end - start, content[file_path][field])].append(file_path)
+                candidates = self.collisions(groups)
+        finally:
+            if executor:
+                executor.shutdown()
+
+        if self.tag_cache:
+            for file_path in changed:
+                self.tag_cache.put_content(stats[file_path], content[file_path])
+
+        duplicates = [sorted(paths) for paths in groups.values() if len(paths) > 1]
+        duplicates.sort(key=lambda paths: (-len(paths), paths[0]))
+        return duplicates
+
+
+class AudioFingerprinter:
+    """
+    Acoustic fingerprints, for the same recording in different formats or
+    encodings where byte hashes can't help. ffmpeg decodes the first
+    FINGERPRINT_SECONDS to mono PCM at FINGERPRINT_RATE; after leading silence,
+    every FINGERPRINT_CHUNK samples give 16 bits, one per pair of neighbouring
+    frequency bands, set when the energy difference between the two rose since
+    the previous chunk.
+    Decoding runs on --jobs threads (ffmpeg does the work in its own process)
+    and results are committed to the tag cache every FINGERPRINT_BATCH files,
+    keyed by inode and checked against size and mtime, so an interrupted run
+    only decodes what is left.
+    """
+
+    BANDS = 17  # Log-spaced between 300 and 2000 Hz, 16 differences
+
+    def __init__(self, tag_cache: Optional[TagCache], jobs: int = 1):
+        self.tag_cache = tag_cache
+        self.jobs = jobs
+        self.ffmpeg = shutil.which('ffmpeg')
+        self.stats = Counter()
+
+    @staticmethod
+    def unavailable() -> Optional[str]:
+        """Why fingerprints can't be computed here, or None"""
+        if numpy is None:
+            return "NumPy is not installed (pip install numpy)"
+        if not shutil.which('ffmpeg'):
+            return "ffmpeg not found on PATH"
+        return None
+
+    def fingerprint(self, file_path: Path) -> Optional[bytes]:
+        """
+        Sub-fingerprints as little-endian uint16, b'' if ffmpeg can't decode the
+        file, None if ffmpeg could not be run or timed out (worth another try)
+        """
+        try:
+            decoded = subprocess.run(
+                [self.ffmpeg, '-nostdin', '-v', 'error', '-t', str(FINGERPRINT_SECONDS),
+                 '-i', str(file_path), '-vn', '-ac', '1', '-ar', str(FINGERPRINT_RATE),
+                 '-f', 's16le', '-'],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=600)
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        if decoded.returncode != 0:
+            return b''
+        return self.sub_fingerprints(numpy.frombuffer(decoded.stdout, dtype='<i2'))
+
+    @classmethod
+    def sub_fingerprints(cls, samples) -> bytes:
+        """
+        Sub-fingerprints of 16-bit PCM samples, b'' if too short. Leading silence
+        is trimmed first, so the chunks of two encodings start at the same point
+        of the music however much encoder delay either one added.
+        """
+        loud = numpy.flatnonzero((samples > FINGERPRINT_SILENCE) | (samples < -FINGERPRINT_SILENCE))
+        samples = samples[loud[0]:] if len(loud) else samples[:0]
+        chunks = len(samples) // FINGERPRINT_CHUNK
+        if chunks < 2:
+            return b''
+
+        frames = samples[:chunks * FINGERPRINT_CHUNK].reshape(chunks, FINGERPRINT_CHUNK).astype(numpy.float32)
+        spectrum = numpy.abs(numpy.fft.rfft(frames * numpy.hanning(FINGERPRINT_CHUNK), axis=1)) ** 2
+        bands = numpy.digitize(numpy.fft.rfftfreq(FINGERPRINT_CHUNK, 1 / FINGERPRINT_RATE),
+                               numpy.geomspace(300, 2000, cls.BANDS + 1)) - 1
+        energy = numpy.stack([spectrum[:, bands == band].sum(axis=1) for band in range(cls.BANDS)], axis=1)
+        slopes = energy[:, :-1] - energy[:, 1:]
+        bits = (slopes[1:] - slopes[:-1]) > 0
+        return (bits @ (1 << numpy.arange(cls.BANDS - 1))).astype('<u2').tobytes()
+
+    @staticmethod
+    def bit_errors(a: bytes, b: bytes) -> float:
+        """Lowest fraction of differing bits over the offsets tried"""
+        x = numpy.frombuffer(a, dtype='<u2')
+        y = numpy.frombuffer(b, dtype='<u2')
+        best = 1.0
+        for shift in range(-FINGERPRINT_MAX_SHIFT, FINGERPRINT_MAX_SHIFT + 1):
+            xs = x[shift:] if shift > 0 else x
+            ys = y[-shift:] if shift < 0 else y
+            overlap = min(len(xs), len(ys))
+            if overlap < max(len(x), len(y)) // 2:
+                continue
+            differing = numpy.unpackbits((xs[:overlap] ^ ys[:overlap]).view(numpy.uint8)).sum()
+            best = min(best, differing / (overlap * 16))
+        return best
+
+    def fingerprints(self, files: List[Tuple[Path, os.stat_result]]) -> Dict[Path, bytes]:
+        """Fingerprint of every decodable file, from the cache where possible"""
+        result: Dict[Path, bytes] = {}
+        pending = []
+        for file_path, st in files:
+            cached = self.tag_cache.get_fingerprint(st) if self.tag_cache else None
+            if cached is None:
+                pending.append((file_path, st))
+                continue
+            self.stats['cached'] += 1
+            if cached:
+                result[file_path] = cached
+        if not pending:
+            return result
+
+        print(f"Fingerprinting {len(pending)} file(s) with {self.jobs} worker(s) "
+              f"({self.stats['cached']} from cache)...")
+        executor = ThreadPoolExecutor(max_workers=self.jobs)
+        try:
+            done = 0
+            for (file_path, st), fingerprint in zip(pending, executor.map(self.fingerprint,
+                                                                          [path for path, _ in pending])):
+                done += 1
+                if fingerprint is None:
+                    # Not the file's fault, so not cached as undecodable
+                    self.stats['unfinished'] += 1
+                else:
+                    self.stats['decoded' if fingerprint else 'failed'] += 1
+                    if fingerprint:
+                        result[file_path] = fingerprint
+                    if self.tag_cache:
+                        self.tag_cache.put_fingerprint(st, fingerprint)
+                if done % FINGERPRINT_BATCH == 0 or done == len(pending):
+                    if self.tag_cache:
+                        self.tag_cache.commit()
+                    print(f"Progress: {done}/{len(pending)} file(s) fingerprinted...")
+        finally:
+            # On Ctrl-C keep what is committed and don't start the rest
+            executor.shutdown(cancel_futures=True)
+            if self.tag_cache:
+                self.tag_cache.commit()
+        return result
+
+    def find(self, files: List[Tuple[Path, os.stat_result]], durations: Dict[Path, float]) -> List[List[Path]]:
+        """Sets of files holding the same recording, each sorted, largest set first"""
+        prints = self.fingerprints(files)
+
+        # Only tracks of about the same length are compared: sort by length, slide a window
+        tracks = sorted((durations.get(path) or len(fp) * FINGERPRINT_CHUNK / FINGERPRINT_RATE, path)
+                        for path, fp in prints.items())
+        parent = {path: path for _, path in tracks}
+
+        def root(path: Path) -> Path:
+            while parent[path] != path:
+                parent[path] = parent[parent[path]]
+                path = parent[path]
+            return path
+
+        for i, (duration, path) in enumerate(tracks):
+            for other_duration, other in tracks[i + 1:]:
+                if other_duration - duration > FINGERPRINT_DURATION_TOLERANCE:
+                    break
+                self.stats['compared'] += 1
+                if root(path) != root(other) and \
+                        self.bit_errors(prints[path], prints[other]) <= FINGERPRINT_MAX_BIT_ERRORS:
+                    parent[root(other)] = root(path)
+
+        groups = defaultdict(list)
+        for _, path in tracks:
+            groups[root(path)].append(path)
+        recordings = [sorted(paths) for paths in groups.values() if len(paths) > 1]
+        recordings.sort(key=lambda paths: (-len(paths), paths[0]))
+        return recordings
+
+
+class PollingWatcher:
+    """
+    Finds files in a directory tree by rescanning it.
+    Fallback for --mode watch where inotify is unavailable (non-Linux, network mounts).
+    """
+
+    kind = 'polling'
+
+    def __init__(self, root: Path, should_skip_dir, interval: float):
+        self.root = root
+        self.should_skip_dir = should_skip_dir
+        self.interval = interval
+
+    def scan(self) -> List[Path]:
+        """Every file currently in the tree"""
+        found = []
+        for dirpath, dirs, files in os.walk(self.root):
+            dirs[:] = [d for d in dirs if not self.should_skip_dir(d)]
+            found.extend(Path(dirpath) / filename for filename in files)
+        return found
+
+    def poll(self, timeout: float) -> List[Path]:
+        time.sleep(min(timeout, self.interval))
+        return self.scan()
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher(PollingWatcher):
+    """
+    Reports files written (IN_CLOSE_WRITE) or moved (IN_MOVED_TO) into a
+    directory tree, via inotify through ctypes. New subfolders are watched as
+    they appear; on a kernel queue overflow the whole tree is rescanned.
+    """
+
+    kind = 'inotify'
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    EVENT_HEADER = struct.Struct('iIII')
+
+    def __init__(self, root: Path, should_skip_dir, interval: float):
+        super().__init__(root, should_skip_dir, interval)
+        libc_name = ctypes.util.find_library('c')
+        if not libc_name:
+            raise OSError("libc not found")
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self.libc, 'inotify_init1'):
+            raise OSError("inotify not supported on this platform")
+        self.libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.watches: Dict[int, Path] = {}
+        self.add_tree(root)
+
+    def add_tree(self, root: Path) -> List[Path]:
+        """Watch root and its subfolders; returns files already in them"""
+        found = []
+        mask = self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+        for dirpath, dirs, files in os.walk(root):
+            dirs[:] = [d for d in dirs if not self.should_skip_dir(d)]
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(dirpath), mask)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                print(f"WARNING: Cannot watch {dirpath}: {os.strerror(errno)}")
+                continue
+            self.watches[wd] = Path(dirpath)
+            found.extend(Path(dirpath) / filename for filename in files)
+        return found
+
+    def poll(self, timeout: float) -> List[Path]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+
+        found = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, name_len = self.EVENT_HEADER.unpack_from(data, offset)
+                offset += self.EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + name_len].rstrip(b'\0'))
+                offset += name_len
+
+                if mask & self.IN_Q_OVERFLOW:
+                    print("WARNING: inotify queue overflowed, rescanning ingest directory")
+                    found.extend(self.add_tree(self.root))
+                    continue
+                if mask & self.IN_IGNORED:
+                    self.watches.pop(wd, None)
+                    continue
+                parent = self.watches.get(wd)
+                if parent is None or not name:
+                    continue
+                path = parent / name
+                if mask & self.IN_ISDIR:
+                    if mask & (self.IN_CREATE | self.IN_MOVED_TO) and not self.should_skip_dir(name):
+                        # Files may land in a new folder before its watch exists
+                        found.extend(self.add_tree(path))
+                elif mask & (self.IN_CLOSE_WRITE | self.IN_MOVED_TO):
+                    found.append(path)
+        return found
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class MetricsStream:
+    """
+    Machine-readable progress of a run (--metrics), one JSON object per line:
+    a "start" line, "progress" lines at most every `interval` seconds while a
+    phase runs, a "phase" line as each phase ends and a "summary" line at the
+    end. Every line carries "t", seconds since the run started. Lines are
+    flushed as written, so the file can be tailed while the run goes on.
+    """
+
+    def __init__(self, path: Path, interval: float = METRICS_INTERVAL):
+        self.stream = open(path, 'w', encoding='utf-8', buffering=1)  # Also /dev/fd/N
+        self.interval = interval
+        self.start = time.monotonic()
+        self.last_time = self.start
+        self.last_done = 0
+
+    def emit(self, kind: str, **fields):
+        self.stream.write(json.dumps({'type': kind, 't': round(time.monotonic() - self.start, 3), **fields},
+                                     ensure_ascii=False) + '\n')
+
+    def start_phase(self):
+        self.last_time = time.monotonic()
+        self.last_done = 0
+
+    def due(self) -> bool:
+        return time.monotonic() - self.last_time >= self.interval
+
+    def progress(self, phase: Optional[str], done: int, total: Optional[int], counters: Dict):
+        """A progress line, with the rate since the previous one"""
+        now = time.monotonic()
+        rate = (done - self.last_done) / (now - self.last_time) if now > self.last_time else 0.0
+        self.last_time, self.last_done = now, done
+        self.emit('progress', phase=phase, done=done, total=total, items_per_sec=round(rate, 1), **counters)
+
+    def close(self, counters: Dict):
+        self.emit('summary', **counters)
+        self.stream.close()
+
 
 class MusicLibraryNormalizer:
     def __init__(self, music_dir: str, playlist_input: Optional[str], playlist_output: Optional[str],
-                 mode: str, dry_run_limit: int = 1000, duplicate_report: Optional[str] = None,
-                 action: str = 'organize', ingest_dir: Optional[str] = None):
+                 mode: str, dry_run_limit: Optional[int] = None, duplicate_report: Optional[str] = None,
+                 action: str = 'organize', ingest_dir: Optional[str] = None,
+                 tag_cache: Optional[str] = None, jobs: int = 1, pool: str = 'process',
+                 journal: Optional[str] = None, checkpoint: Optional[str] = None,
+                 fingerprint: bool = False, metrics: Optional[str] = None,
+                 metrics_interval: float = METRICS_INTERVAL):
         self.music_dir = Path(music_dir).resolve()
+        self.music_dir_prefix = os.path.join(str(self.music_dir), '')
         self.playlist_input = Path(playlist_input).resolve() if playlist_input else None
         self.playlist_output = Path(playlist_output).resolve() if playlist_output else None
         self.mode = mode.lower()
@@ -33,8 +1615,37 @@ class MusicLibraryNormalizer:
         self.action = action.lower()
         self.ingest_dir = Path(ingest_dir).resolve() if ingest_dir else None
 
+        # Tag cache: persistent store plus a per-run memo (path -> (stat key, record))
+        self.tag_cache: Optional[TagCache] = None
+        if tag_cache:
+            try:
+                self.tag_cache = TagCache(Path(tag_cache).expanduser().resolve())
+            except (sqlite3.Error, OSError) as e:
+                print(f"WARNING: Tag cache disabled, cannot open {tag_cache}: {e}")
+        self.tag_records: Dict[Path, Tuple[Tuple[int, int, int, int], TagRecord]] = {}
+        self.tag_parse_times: Dict[str, List] = defaultdict(lambda: [0, 0.0])
+        self.tag_parse_histogram = [0] * (len(TAG_LATENCY_BUCKETS_MS) + 1)
+
+        # Phase timers (--profile) and the optional metrics stream (--metrics)
+        self.run_start = time.perf_counter()
+        self.phase_times: Dict[str, float] = {}
+        self.current_phase: Optional[str] = None
+
+        # Parallel tag reading: worker count and pool type ('process' or 'thread')
+        self.jobs = max(1, jobs)
+        self.pool = pool
+        self.tag_executor = None  # Created on first use, shut down in close()
+
+        # Incremental mode: journal of folder state, and the folders this run had to list
+        self.journal = LibraryJournal(Path(journal).expanduser().resolve(), self.music_dir) if journal else None
+        self.changed_dirs: Optional[List[Path]] = None
+
+        # Rename plan of the current run and the checkpoint it is applied with (normal mode)
+        self.plan: Optional[RenamePlan] = None
+        self.checkpoint = Path(checkpoint).expanduser().resolve() if checkpoint else None
+
         # Track renames: old_path -> new_path
-        self.rename_map: Dict[Path, Path] = {}
+        self.rename_map = RenameMap()
         self.processed_count = 0
         self.error_count = 0
         self.conflict_count = 0
@@ -59,6 +1670,11 @@ class MusicLibraryNormalizer:
 
         # Track duplicates: (original_path, desired_name, actual_sequenced_name)
         self.duplicates: List[Tuple[Path, str, str]] = []
+        # Sets of files with identical audio across the library (see find_content_duplicates)
+        self.content_duplicates: Optional[List[List[Path]]] = None
+        # Same recording in other formats/encodings, by acoustic fingerprint (--fingerprint)
+        self.fingerprint = fingerprint
+        self.recording_duplicates: Optional[List[List[Path]]] = None
 
         # Track folder merges: (source_folder, target_folder, files_moved_count)
         self.folder_merges: List[Tuple[Path, Path, int]] = []
@@ -83,6 +1699,10 @@ class MusicLibraryNormalizer:
         self.created_artists: List[Path] = []  # Track newly created artist folders
         self.created_albums: List[Path] = []  # Track newly created album folders
 
+        # Ingest lookup indexes: canonical key -> artist folder, artist folder -> {canonical key -> album folder}
+        self.artist_index: Optional[Dict[str, Path]] = None
+        self.album_index: Dict[Path, Dict[str, Path]] = {}
+
         # Observe mode findings
         self.observe_findings = {
             'files_with_spaces': [],
@@ -96,125 +1716,51 @@ class MusicLibraryNormalizer:
             'empty_folders': [],  # Folders without any audio files
         }
 
+        # Canonical-path trie of the library for playlist resolution (see build_path_index)
+        self.path_index: Optional[LibraryPathIndex] = None
+        # Playlist entry as written -> (kind as written, current path); shared by all
+        # playlists and playlist workers, valid for as long as path_index is
+        self.playlist_cache: Dict[str, Tuple[Optional[str], Optional[Path]]] = {}
+        self.playlist_lookups = 0
+
         # Reconcile mode findings
         self.reconcile_findings = {
             'total_playlists': 0,
             'total_entries': 0,
             'broken_entries': [],  # (playlist_file, line_num, path, reason)
             'playlists_with_issues': {},  # playlist -> [broken_entries]
+            'suggested_fixes': {},  # broken path -> current path it most likely refers to
         }
 
+        self.metrics: Optional[MetricsStream] = None
+        if metrics:
+            try:
+                self.metrics = MetricsStream(Path(metrics).expanduser(), metrics_interval)
+            except OSError as e:
+                print(f"WARNING: Metrics disabled, cannot open {metrics}: {e}")
+            else:
+                self.metrics.emit('start', action=self.action, mode=self.mode, music=str(self.music_dir),
+                                  jobs=self.jobs, pool=self.pool,
+                                  tag_parse_buckets_ms=list(TAG_LATENCY_BUCKETS_MS))
+
     def get_mcatalogid(self, file_path: Path, debug: bool = False) -> Optional[str]:
         """
         Extract MCATALOGID tag from audio file using mutagen
         Supports multiple tag formats based on your tagging code
+        Debug reads always parse the file and bypass the tag cache
         """
+        if not debug:
+            record = self.get_tag_record(file_path)
+            return record.mcatalogid if record else None
+
         try:
             audio = MutagenFile(file_path, easy=False)
             if audio is None:
-                if debug:
-                    print(f"  [DEBUG] Could not read file: {file_path.name}")
+                print(f"  [DEBUG] Could not read file: {file_path.name}")
                 return None
 
-            if debug:
-                print(f"  [DEBUG] File type: {type(audio).__name__}")
-
-            # ID3 tags (MP3)
-            if hasattr(audio, 'tags') and audio.tags:
-                tag_type = type(audio.tags).__name__
-                if debug:
-                    print(f"  [DEBUG] Tag type: {tag_type}")
-
-                # For MP3 - check TXXX:mcatalogid or TXXX:MCATALOGID
-                if 'ID3' in tag_type:
-                    if debug:
-                        print(f"  [DEBUG] Checking MP3 TXXX frames...")
-
-                    # Check TXXX frames with desc='mcatalogid' or 'MCATALOGID'
-                    try:
-                        txxx_frames = audio.tags.getall('TXXX')
-                        for frame in txxx_frames:
-                            if debug:
-                                print(f"  [DEBUG] TXXX frame desc: '{frame.desc}'")
-                            if frame.desc and frame.desc.upper() == 'MCATALOGID':
-                                value = str(frame.text[0]) if frame.text else None
-                                if value and debug:
-                                    print(f"  [DEBUG] ✓ Found in TXXX:MCATALOGID = {value}")
-                                return value
-                        if debug:
-                            print(f"  [DEBUG] TXXX frames found: {[f.desc for f in txxx_frames]}")
-                    except Exception as e:
-                        if debug:
-                            print(f"  [DEBUG] Error reading TXXX: {e}")
-
-                # For M4A - check multiple freeform tags
-                elif 'MP4Tags' in tag_type or 'MP4' in tag_type:
-                    if debug:
-                        print(f"  [DEBUG] Checking M4A/MP4 tags...")
-
-                    # Check all possible M4A tag locations (from your create_M4A_Track code)
-                    possible_keys = [
-                        'mcat',  # mcatalogid1
-                        'MCAT',  # mcatalogid2
-                        '----:com.apple.iTunes:CUSTOM1',  # mcatalogid3
-                        '----:com.apple.iTunes:CUSTOM2',  # mcatalogid4
-                        '----:com.apple.iTunes:MusicIP PUID',  # mcatalogid5
-                        'MCATALOGID',
-                    ]
-
-                    for key in possible_keys:
-                        if key in audio.tags:
-                            value = audio.tags[key]
-                            if isinstance(value, list) and value:
-                                value = value[0]
-                            if isinstance(value, bytes):
-                                value = value.decode('utf-8', errors='ignore')
-                            value = str(value).strip()
-                            if value and debug:
-                                print(f"  [DEBUG] ✓ Found in M4A {key} = {value}")
-                            if value:
-                                return value
-
-                    if debug:
-                        print(f"  [DEBUG] M4A tags available: {list(audio.tags.keys())[:15]}")
-
-            # Vorbis comments (FLAC, OGG, WMA)
-            if hasattr(audio, 'tags') and audio.tags:
-                # FLAC/OGG uses Vorbis comments
-                if hasattr(audio.tags, 'get'):
-                    if debug:
-                        print(f"  [DEBUG] Checking Vorbis/ASF tags...")
-
-                    # Check all possible Vorbis/ASF tag locations (from your create_FLAC_Track/WMA code)
-                    possible_keys = [
-                        'MCATALOGID',
-                        'mcatalogid',
-                        'CUSTOM1',
-                        'CUSTOM2',
-                        'MUSICIP_PUID',
-                        'MUSICIP/PUID',  # WMA variant
-                    ]
-
-                    for key in possible_keys:
-                        try:
-                            value = audio.tags.get(key)
-                            if value:
-                                value = str(value[0]) if isinstance(value, list) else str(value)
-                                value = value.strip()
-                                if value and debug:
-                                    print(f"  [DEBUG] ✓ Found in Vorbis/ASF {key} = {value}")
-                                if value:
-                                    return value
-                        except Exception as e:
-                            if debug:
-                                print(f"  [DEBUG] Error checking {key}: {e}")
-
-                    if debug and hasattr(audio.tags, 'keys'):
-                        print(f"  [DEBUG] Vorbis/ASF tags available: {list(audio.tags.keys())[:15]}")
-
-            if debug:
-                print(f"  [DEBUG] ✗ No MCATALOGID found")
-            return None
+            print(f"  [DEBUG] File type: {type(audio).__name__}")
+            return self.extract_tags(audio, debug=True).mcatalogid
 
         except (PermissionError, OSError) as e:
             # File access errors - these are serious and should be logged
@@ -224,14 +1770,9 @@ class MusicLibraryNormalizer:
 
         except Exception as e:
             # Mutagen-specific errors (corrupt tags, unsupported formats, etc.)
-            # These are less critical - log but continue
-            if debug:
-                print(f"  [DEBUG] Error reading tags from {file_path.name}: {e}")
-                import traceback
-                traceback.print_exc()
-            else:
-                # In normal mode, just note it
-                print(f"WARNING: Could not read tags from {file_path.name}: {type(e).__name__}")
+            print(f"  [DEBUG] Error reading tags from {file_path.name}: {e}")
+            import traceback
+            traceback.print_exc()
             return None
 
     def get_canonical_key(self, name: str) -> str:
@@ -242,9 +1783,7 @@ class MusicLibraryNormalizer:
         Example: "R. D. Burman" -> "rdburman"
         Example: "café" (NFD) -> "cafe" (NFC normalized)
         """
-        # Normalize Unicode first for cross-platform compatibility
-        name = unicodedata.normalize('NFC', name)
-        return re.sub(r'[^a-z0-9]', '', name.lower())
+        return name_canonical_key(name)
 
     def get_artist_album_from_tags(self, file_path: Path) -> Tuple[Optional[str], Optional[str]]:
         """
@@ -252,101 +1791,377 @@ class MusicLibraryNormalizer:
         Prefers albumArtist over artist tag.
         Returns (artist, album) or (None, None) if no tags found.
         """
+        record = self.get_tag_record(file_path)
+        if record is None:
+            return None, None
+        return record.library_artist, record.album
+
+    @staticmethod
+    def tag_text(value) -> Optional[str]:
+        """First value of a tag (list, ID3 frame, bytes or plain value) as a stripped string"""
+        if hasattr(value, 'text'):
+            value = value.text
+        if isinstance(value, list):
+            value = value[0] if value else None
+        if isinstance(value, bytes):
+            value = value.decode('utf-8', errors='ignore')
+        value = str(value).strip() if value is not None else ''
+        return value or None
+
+    @classmethod
+    def extract_tags(cls, audio, debug: bool = False) -> TagRecord:
+        """
+        Extract every tag field the normalizer uses from an already opened mutagen file.
+        This is the only place that knows the ID3 / MP4 / Vorbis-ASF tag layouts.
+        """
+        info = getattr(audio, 'info', None)
+        duration = getattr(info, 'length', None)
+        tags = getattr(audio, 'tags', None)
+
+        if not tags:
+            if debug:
+                print(f"  [DEBUG] ✗ No MCATALOGID found")
+            return EMPTY_TAG_RECORD._replace(duration=duration)
+
+        tag_type = type(tags).__name__
+        if debug:
+            print(f"  [DEBUG] Tag type: {tag_type}")
+
+        mcatalogid = artist = album_artist = album = title = None
+
+        # ID3 tags (MP3)
+        if 'ID3' in tag_type:
+            if debug:
+                print(f"  [DEBUG] Checking MP3 TXXX frames...")
+
+            # MCATALOGID lives in TXXX frames with desc='mcatalogid' or 'MCATALOGID'
+            txxx_frames = tags.getall('TXXX')
+            for frame in txxx_frames:
+                if debug:
+                    print(f"  [DEBUG] TXXX frame desc: '{frame.desc}'")
+                if frame.desc and frame.desc.upper() == 'MCATALOGID':
+                    mcatalogid = cls.tag_text(frame)
+                    if mcatalogid and debug:
+                        print(f"  [DEBUG] ✓ Found in TXXX:MCATALOGID = {mcatalogid}")
+                    break
+            else:
+                if debug:
+                    print(f"  [DEBUG] TXXX frames found: {[f.desc for f in txxx_frames]}")
+
+            artist = cls.tag_text(tags.get('TPE1'))
+            album_artist = cls.tag_text(tags.get('TPE2'))
+            album = cls.tag_text(tags.get('TALB'))
+            title = cls.tag_text(tags.get('TIT2'))
+
+        # M4A tags
+        elif 'MP4Tags' in tag_type or 'MP4' in tag_type:
+            if debug:
+                print(f"  [DEBUG] Checking M4A/MP4 tags...")
+
+            for key in MP4_MCATALOGID_KEYS:
+                mcatalogid = cls.tag_text(tags.get(key))
+                if mcatalogid:
+                    if debug:
+                        print(f"  [DEBUG] ✓ Found in M4A {key} = {mcatalogid}")
+                    break
+            else:
+                if debug:
+                    print(f"  [DEBUG] M4A tags available: {list(tags.keys())[:15]}")
+
+            artist = cls.tag_text(tags.get('\xa9ART'))
+            album_artist = cls.tag_text(tags.get('aART'))
+            album = cls.tag_text(tags.get('\xa9alb'))
+            title = cls.tag_text(tags.get('\xa9nam'))
+
+        # Vorbis comments (FLAC, OGG) and ASF (WMA)
+        elif hasattr(tags, 'get'):
+            album_artist = cls.tag_text(tags.get('ALBUMARTIST') or tags.get('albumartist'))
+            artist = cls.tag_text(tags.get('ARTIST') or tags.get('artist'))
+            album = cls.tag_text(tags.get('ALBUM') or tags.get('album'))
+            title = cls.tag_text(tags.get('TITLE') or tags.get('title'))
+
+        # Vorbis/ASF MCATALOGID keys - also the last resort for ID3/MP4 files
+        if not mcatalogid and hasattr(tags, 'get'):
+            if debug:
+                print(f"  [DEBUG] Checking Vorbis/ASF tags...")
+
+            for key in VORBIS_MCATALOGID_KEYS:
+                try:
+                    mcatalogid = cls.tag_text(tags.get(key))
+                except Exception as e:
+                    if debug:
+                        print(f"  [DEBUG] Error checking {key}: {e}")
+                    continue
+                if mcatalogid:
+                    if debug:
+                        print(f"  [DEBUG] ✓ Found in Vorbis/ASF {key} = {mcatalogid}")
+                    break
+
+            if not mcatalogid and debug and hasattr(tags, 'keys'):
+                print(f"  [DEBUG] Vorbis/ASF tags available: {list(tags.keys())[:15]}")
+
+        if not mcatalogid and debug:
+            print(f"  [DEBUG] ✗ No MCATALOGID found")
+
+        return TagRecord(tag_type, mcatalogid, artist, album_artist, album, title, duration)
+
+    @classmethod
+    def parse_tag_file(cls, file_path: Path) -> Tuple[Optional[TagRecord], str, float, Optional[Tuple[str, str]]]:
+        """
+        Open the file once and extract every tag field the normalizer uses -
+        with HeaderTagReader where it can, Mutagen otherwise.
+        Touches no instance state, so it can run in a worker process.
+        Returns (record, file format, seconds, error) - error is (kind, message) or None.
+        """
+        start = time.perf_counter()
+        fast = HeaderTagReader.read(file_path)
+        if fast is not None:
+            return fast[0], fast[1], time.perf_counter() - start, None
         try:
             audio = MutagenFile(file_path, easy=False)
-            if audio is None:
-                return None, None
+            record = cls.extract_tags(audio) if audio is not None else EMPTY_TAG_RECORD
+            file_format = type(audio).__name__ if audio is not None else 'unknown'
+            return record, file_format, time.perf_counter() - start, None
 
-            # Check if file has any tags at all
-            if not hasattr(audio, 'tags') or not audio.tags:
-                return None, None
-
-            artist = None
-            album = None
-            tag_type = type(audio.tags).__name__
-
-            # ID3 tags (MP3)
-            if 'ID3' in tag_type:
-                # Prefer album artist (TPE2) over artist (TPE1)
-                if 'TPE2' in audio.tags and audio.tags['TPE2'].text:
-                    artist = str(audio.tags['TPE2'].text[0])
-                elif 'TPE1' in audio.tags and audio.tags['TPE1'].text:
-                    artist = str(audio.tags['TPE1'].text[0])
-
-                if 'TALB' in audio.tags and audio.tags['TALB'].text:
-                    album = str(audio.tags['TALB'].text[0])
-
-            # M4A tags
-            elif 'MP4Tags' in tag_type or 'MP4' in tag_type:
-                # Prefer album artist (aART) over artist (©ART)
-                if 'aART' in audio.tags and audio.tags['aART']:
-                    artist = str(audio.tags['aART'][0])
-                elif '\xa9ART' in audio.tags and audio.tags['\xa9ART']:
-                    artist = str(audio.tags['\xa9ART'][0])
-
-                if '\xa9alb' in audio.tags and audio.tags['\xa9alb']:
-                    album = str(audio.tags['\xa9alb'][0])
-
-            # Vorbis comments (FLAC, OGG, WMA)
-            elif hasattr(audio.tags, 'get'):
-                # Prefer ALBUMARTIST over ARTIST
-                artist_tag = audio.tags.get('ALBUMARTIST') or audio.tags.get('albumartist')
-                if not artist_tag:
-                    artist_tag = audio.tags.get('ARTIST') or audio.tags.get('artist')
-
-                if artist_tag:
-                    artist = str(artist_tag[0]) if isinstance(artist_tag, list) else str(artist_tag)
-
-                album_tag = audio.tags.get('ALBUM') or audio.tags.get('album')
-                if album_tag:
-                    album = str(album_tag[0]) if isinstance(album_tag, list) else str(album_tag)
-
-            return artist.strip() if artist else None, album.strip() if album else None
+        except (PermissionError, OSError) as e:
+            return None, 'unknown', time.perf_counter() - start, ('access', str(e))
 
         except Exception as e:
-            return None, None
+            return None, 'unknown', time.perf_counter() - start, ('tags', type(e).__name__)
 
-    def find_artist_folder(self, artist: str) -> Optional[Path]:
+    def apply_tag_result(self, file_path: Path, st: os.stat_result,
+                         result: Tuple[Optional[TagRecord], str, float, Optional[Tuple[str, str]]]
+                         ) -> Optional[TagRecord]:
         """
-        Find matching artist folder in library using canonical matching.
-        Returns artist folder path if found, None otherwise.
+        Record the outcome of parse_tag_file: report errors, count parse time,
+        store the record in the tag cache and the per-run memo.
+        Unreadable files are memoized too, so they are reported once per run.
         """
-        if not artist:
+        record, file_format, seconds, error = result
+
+        if error:
+            kind, message = error
+            if kind == 'access':
+                # File access errors - these are serious and should be logged
+                print(f"ERROR: Cannot access file {file_path}: {message}")
+                self.error_count += 1
+            else:
+                # Mutagen-specific errors (corrupt tags, unsupported formats, etc.)
+                # These are less critical - log but continue
+                print(f"WARNING: Could not read tags from {file_path.name}: {message}")
+        else:
+            # Per-format parse timing: format -> [files, seconds]
+            timing = self.tag_parse_times[file_format]
+            timing[0] += 1
+            timing[1] += seconds
+            self.tag_parse_histogram[bisect.bisect_left(TAG_LATENCY_BUCKETS_MS, seconds * 1000)] += 1
+            if self.tag_cache:
+                self.tag_cache.put(file_path, st, record)
+
+        self.tag_records[file_path] = (TagCache.stat_key(st), record)
+        return record
+
+    def lookup_tag_record(self, file_path: Path, st: os.stat_result) -> Tuple[bool, Optional[TagRecord]]:
+        """
+        Look a file up in the per-run memo, then the persistent tag cache.
+        Returns (found, record) - record may be None for a known unreadable file.
+        """
+        key = TagCache.stat_key(st)
+        memo = self.tag_records.get(file_path)
+        if memo and memo[0] == key:
+            return True, memo[1]
+
+        record = self.tag_cache.get(file_path, st) if self.tag_cache else None
+        if record is not None:
+            self.tag_records[file_path] = (key, record)
+            return True, record
+
+        return False, None
+
+    def get_tag_record(self, file_path: Path) -> Optional[TagRecord]:
+        """Get the tag record for a file, parsing it only if it changed"""
+        try:
+            st = file_path.stat()
+        except OSError as e:
+            print(f"ERROR: Cannot access file {file_path}: {e}")
+            self.error_count += 1
             return None
 
-        canonical_artist = self.get_canonical_key(artist)
+        found, record = self.lookup_tag_record(file_path, st)
+        if found:
+            return record
+        return self.apply_tag_result(file_path, st, self.parse_tag_file(file_path))
+
+    def prefetch_tags(self, file_paths: List[Path], verbose: bool = True):
+        """
+        Parse tags for every file not already in the memo or tag cache using a
+        pool of --jobs workers. Workers only parse; results are applied here in
+        input order, so the cache has a single writer and every later step
+        (renames, merges, reports) behaves exactly as in a serial run.
+        The pool is kept for later calls (watch batches, streaming observe).
+        """
+        if self.jobs <= 1:
+            return
+
+        pending = []
+        for file_path in file_paths:
+            try:
+                st = file_path.stat()
+            except OSError:
+                continue  # Reported when the file is actually processed
+            found, _ = self.lookup_tag_record(file_path, st)
+            if not found:
+                pending.append((file_path, st))
+
+        if not pending:
+            return
 
-        # Search for artist folder
-        for item in self.music_dir.iterdir():
+        if verbose:
+            print(f"Reading tags of {len(pending)} file(s) with {self.jobs} {self.pool} worker(s)...")
+        if self.tag_executor is None:
+            if self.pool == 'thread':
+                self.tag_executor = ThreadPoolExecutor(max_workers=self.jobs)
+            else:
+                self.tag_executor = ProcessPoolExecutor(max_workers=self.jobs)
+        chunksize = max(1, min(64, len(pending) // (self.jobs * 4)))
+
+        results = self.tag_executor.map(self.parse_tag_file, [path for path, _ in pending],
+                                        chunksize=chunksize)
+        for done, ((file_path, st), result) in enumerate(zip(pending, results), 1):
+            self.apply_tag_result(file_path, st, result)
+            if verbose:
+                self.tick(done, len(pending))
+
+    def print_tag_stats(self):
+        """Print per-format tag parse time and tag cache effectiveness"""
+        for file_format, (count, seconds) in sorted(self.tag_parse_times.items()):
+            print(f"  Tag parsing ({file_format}): {count} file(s), {seconds / count * 1000:.1f} ms avg")
+        if self.tag_cache:
+            print(f"  Tag cache: {self.tag_cache.hits} hit(s), {self.tag_cache.misses} miss(es)")
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """Time one phase of a run (--profile) and report it on the metrics stream"""
+        self.current_phase = name
+        if self.metrics:
+            self.metrics.start_phase()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self.phase_times[name] = self.phase_times.get(name, 0.0) + seconds
+            self.current_phase = None
+            if self.metrics:
+                self.metrics.emit('phase', phase=name, seconds=round(seconds, 3), **self.metrics_counters())
+
+    def tick(self, done: int, total: Optional[int]):
+        """Progress within the current phase; a metrics line once the interval has passed"""
+        if self.metrics and self.metrics.due():
+            self.metrics.progress(self.current_phase, done, total, self.metrics_counters())
+
+    def metrics_counters(self) -> Dict:
+        """Running totals carried by every progress, phase and summary line"""
+        counters = {
+            'renames': self.processed_count,
+            'merges': len(self.folder_merges),
+            'deleted_folders': len(self.deleted_folders),
+            'errors': self.error_count + self.ingest_stats['errors'],
+            'tags_parsed': sum(self.tag_parse_histogram),
+            'tag_parse_ms': list(self.tag_parse_histogram),
+        }
+        if self.action == 'ingest':
+            counters['ingest'] = dict(self.ingest_stats)
+        return counters
+
+    def print_profile(self):
+        """Wall time per phase (--profile), slowest first, and the tag parse latency histogram"""
+        total = time.perf_counter() - self.run_start
+        print(f"\nProfile ({total:.2f} s wall):")
+        for name, seconds in sorted(self.phase_times.items(), key=lambda item: -item[1]):
+            print(f"  {name:<14}{seconds:>9.2f} s {seconds / total * 100 if total else 0:>6.1f}%")
+        other = total - sum(self.phase_times.values())
+        print(f"  {'(other)':<14}{other:>9.2f} s {other / total * 100 if total else 0:>6.1f}%")
+        # Only --jobs > 1 reads tags up front; a serial run parses each file when a
+        # later phase first reaches it, so its "tags" phase is near zero
+        parse_seconds = sum(seconds for _, seconds in self.tag_parse_times.values())
+        if self.jobs <= 1 and parse_seconds:
+            print(f"  Tags were parsed as files were reached (--jobs 1): {parse_seconds:.2f} s "
+                  f"of the phases above, not in 'tags'")
+        if any(self.tag_parse_histogram):
+            labels = [f"≤{bound}" for bound in TAG_LATENCY_BUCKETS_MS] + [f">{TAG_LATENCY_BUCKETS_MS[-1]}"]
+            buckets = ', '.join(f"{label}: {count}" for label, count in zip(labels, self.tag_parse_histogram) if count)
+            print(f"  Tag parse latency (ms): {buckets}")
+
+    def close(self):
+        """Stop the tag worker pool, flush and close the tag cache and metrics stream"""
+        if self.metrics:
+            self.metrics.close(dict(self.metrics_counters(), phases={name: round(seconds, 3)
+                                                                     for name, seconds in self.phase_times.items()}))
+            self.metrics = None
+        if self.tag_executor:
+            self.tag_executor.shutdown()
+            self.tag_executor = None
+        if self.tag_cache:
+            self.tag_cache.close()
+            self.tag_cache = None
+
+    def index_folders(self, parent: Path) -> Dict[str, Path]:
+        """Map canonical key -> subfolder for one directory (first folder wins on collisions)"""
+        index: Dict[str, Path] = {}
+        if not parent.is_dir():
+            return index
+
+        for item in sorted(parent.iterdir()):
             if not item.is_dir() or self.should_skip_dir(item.name):
                 continue
+            index.setdefault(self.get_canonical_key(item.name), item)
+        return index
 
-            # Check canonical match
-            if self.get_canonical_key(item.name) == canonical_artist:
-                return item
+    def find_artist_folder(self, artist: str) -> Optional[Path]:
+        """
+        Find matching artist folder in library using canonical matching.
+        Returns artist folder path if found, None otherwise.
+        The artist index is built on first use and kept current by register_folder().
+        """
+        if not artist:
+            return None
 
-        return None
+        if self.artist_index is None:
+            self.artist_index = self.index_folders(self.music_dir)
+
+        return self.artist_index.get(self.get_canonical_key(artist))
 
     def find_album_folder(self, artist_folder: Path, album: str) -> Optional[Path]:
         """
         Find matching album folder within artist folder using canonical matching.
         Returns album folder path if found, None otherwise.
+        Each artist's album index is built on first use.
         """
-        if not album or not artist_folder.exists():
+        if not album:
             return None
 
-        canonical_album = self.get_canonical_key(album)
+        if artist_folder not in self.album_index:
+            self.album_index[artist_folder] = self.index_folders(artist_folder)
 
-        # Search for album folder
-        for item in artist_folder.iterdir():
-            if not item.is_dir() or self.should_skip_dir(item.name):
-                continue
+        return self.album_index[artist_folder].get(self.get_canonical_key(album))
 
-            # Check canonical match
-            if self.get_canonical_key(item.name) == canonical_album:
-                return item
+    def register_folder(self, folder: Path):
+        """Add a folder created (or planned, in dry run) during ingest to the lookup indexes"""
+        key = self.get_canonical_key(folder.name)
+        if folder.parent == self.music_dir:
+            if self.artist_index is not None:
+                self.artist_index.setdefault(key, folder)
+            self.album_index.setdefault(folder, {})
+        else:
+            self.album_index.setdefault(folder.parent, {}).setdefault(key, folder)
 
-        return None
+    def invalidate_folder_index(self, parent: Path):
+        """Forget an index after another process changed the directory under us"""
+        if parent == self.music_dir:
+            self.artist_index = None
+        else:
+            self.album_index.pop(parent, None)
 
     def normalize_name(self, name: str, is_file: bool = False,
                       file_path: Optional[Path] = None) -> str:
@@ -368,168 +2183,50 @@ class MusicLibraryNormalizer:
         if not name or len(name) == 0:
             raise ValueError("Name cannot be empty")
 
-        # Apply Unicode NFC normalization FIRST for cross-platform compatibility
-        # macOS uses NFD, Linux/Windows use NFC - normalize to NFC
-        name = unicodedata.normalize('NFC', name)
-
-        # Remove null bytes (can truncate filenames)
-        name = name.replace('\x00', '')
-
-        # Remove path separators (security: prevent directory traversal)
-        name = name.replace('/', '-').replace('\\', '-')
-
-        if is_file and file_path:
-            # Split name and extension
-            stem = name.rsplit('.', 1)[0] if '.' in name else name
-            ext = '.' + name.rsplit('.', 1)[1].lower() if '.' in name else ''
-
-            # Strip leading non-alphanumeric characters from stem
-            stem = re.sub(r'^[^a-zA-Z0-9]+', '', stem)
-
-            # Check if MCATALOGID already exists in filename
-            # Pattern matches: -[mid-value] or -[value] at end
-            mcatalogid_pattern = r'-\[(?:mid-)?([^\]]+)\]$'
-            existing_match = re.search(mcatalogid_pattern, stem)
-            existing_mcatalogid = existing_match.group(1) if existing_match else None
-
-            # Get MCATALOGID from file tags if it's an audio file
-            mcatalogid = None
-            if ext in self.audio_extensions:
-                mcatalogid = self.get_mcatalogid(file_path)
-
-            # If file already has MCATALOGID in name, check if it matches tags
-            if existing_mcatalogid:
-                if mcatalogid and existing_mcatalogid.lower() == mcatalogid.lower():
-                    # Tag matches filename - keep it, don't duplicate
-                    # Remove old format to re-add in new format
-                    stem = re.sub(mcatalogid_pattern, '', stem)
-                elif not mcatalogid:
-                    # No tag found, but filename has one - keep filename version
-                    mcatalogid = existing_mcatalogid
-                    stem = re.sub(mcatalogid_pattern, '', stem)
-                else:
-                    # Tag differs from filename - use tag (more authoritative)
-                    stem = re.sub(mcatalogid_pattern, '', stem)
-            elif existing_match:
-                # Has some bracketed suffix but not MCATALOGID - remove it
-                stem = re.sub(mcatalogid_pattern, '', stem)
-
-            # Normalize: lowercase first
-            normalized_stem = stem.lower()
-
-            # Replace underscores with hyphens
-            normalized_stem = normalized_stem.replace('_', '-')
-
-            # Remove all dots from the stem (only extension should have a dot)
-            normalized_stem = normalized_stem.replace('.', '')
-
-            # Remove parentheses by replacing with spaces (to avoid joining words)
-            normalized_stem = normalized_stem.replace('(', ' ').replace(')', ' ')
-
-            # Remove spaces around non-word characters (punctuation like , & etc.)
-            # This handles: ", " -> "," and " & " -> "&"
-            normalized_stem = re.sub(r'\s*([^\w\s-])\s*', r'\1', normalized_stem)
-
-            # Now replace remaining spaces with hyphens
-            normalized_stem = normalized_stem.replace(' ', '-')
-
-            # Collapse multiple consecutive hyphens into single hyphen and strip leading/trailing
-            normalized_stem = re.sub(r'-+', '-', normalized_stem).strip('-')
-
-            # Add MCATALOGID if available
-            if mcatalogid:
-                normalized_stem = f"{normalized_stem}-[mid-{mcatalogid}]"
-
-            final_name = f"{normalized_stem}{ext}"
-
-            # CRITICAL: Final check - ensure NO spaces in filename
-            if ' ' in final_name:
-                final_name = final_name.replace(' ', '-')
-                # Re-collapse multiple hyphens that might result
-                final_name = re.sub(r'-+', '-', final_name)
-
-            # Check for Windows reserved names
-            reserved_names = {'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3',
-                            'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-                            'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6',
-                            'LPT7', 'LPT8', 'LPT9'}
-            name_without_ext = final_name.rsplit('.', 1)[0] if '.' in final_name else final_name
-            if name_without_ext.upper() in reserved_names:
-                final_name = f"_{final_name}"  # Prefix with underscore
-
-            # Enforce filesystem length limit (255 bytes for most filesystems)
-            max_bytes = 255
-            if len(final_name.encode('utf-8')) > max_bytes:
-                # Truncate stem to fit within limit
-                available_bytes = max_bytes - len(ext.encode('utf-8')) - 10  # Leave margin
-                if available_bytes < 10:
-                    raise ValueError(f"Extension too long to create valid filename: {ext}")
-
-                # Truncate normalized_stem at UTF-8 byte boundary
-                truncated_stem = normalized_stem.encode('utf-8')[:available_bytes].decode('utf-8', errors='ignore')
-                # Remove trailing hyphen if truncation created one
-                truncated_stem = truncated_stem.rstrip('-')
-                final_name = f"{truncated_stem}{ext}"
-
-            return final_name
-        else:
-            # Directory: strip leading non-alphanumeric
-            clean_name = re.sub(r'^[^a-zA-Z0-9]+', '', name)
-
-            # Lowercase
-            clean_name = clean_name.lower()
+        # Everything that depends only on the name is memoized
+        if not (is_file and file_path):
+            return normalize_name_parts(name, False)[0]
+        stem, ext, existing_mcatalogid = normalize_name_parts(name, True)
 
-            # Replace underscores with hyphens
-            clean_name = clean_name.replace('_', '-')
+        # Tag is authoritative; without one, keep the MCATALOGID already in the file name
+        mcatalogid = self.get_mcatalogid(file_path) if ext in self.audio_extensions else None
+        mcatalogid = mcatalogid or existing_mcatalogid
 
-            # Remove all dots from directory names
-            clean_name = clean_name.replace('.', '')
+        if mcatalogid:
+            stem = f"{stem}-[mid-{mcatalogid}]"
+        final_name = f"{stem}{ext}"
 
-            # Remove parentheses by replacing with spaces (to avoid joining words)
-            clean_name = clean_name.replace('(', ' ').replace(')', ' ')
+        # CRITICAL: Final check - ensure NO spaces in filename (tag values may have them)
+        if ' ' in final_name:
+            final_name = HYPHEN_RUNS.sub('-', final_name.replace(' ', '-'))
 
-            # Remove spaces around non-word characters (punctuation like , & etc.)
-            # This handles: ", " -> "," and " & " -> "&"
-            clean_name = re.sub(r'\s*([^\w\s-])\s*', r'\1', clean_name)
+        # Check for Windows reserved names
+        name_without_ext = final_name.rsplit('.', 1)[0] if '.' in final_name else final_name
+        if name_without_ext.upper() in WINDOWS_RESERVED_NAMES:
+            final_name = f"_{final_name}"  # Prefix with underscore
 
-            # Now replace remaining spaces with hyphens
-            clean_name = clean_name.replace(' ', '-')
+        # Enforce filesystem length limit
+        if len(final_name.encode('utf-8')) > MAX_NAME_BYTES:
+            # Truncate stem to fit within limit
+            available_bytes = MAX_NAME_BYTES - len(ext.encode('utf-8')) - 10  # Leave margin
+            if available_bytes < 10:
+                raise ValueError(f"Extension too long to create valid filename: {ext}")
 
-            # Collapse multiple consecutive hyphens into single hyphen and strip leading/trailing
-            clean_name = re.sub(r'-+', '-', clean_name).strip('-')
+            # Truncate at UTF-8 byte boundary, removing a trailing hyphen truncation created
+            truncated_stem = stem.encode('utf-8')[:available_bytes].decode('utf-8', errors='ignore')
+            final_name = f"{truncated_stem.rstrip('-')}{ext}"
 
-            # CRITICAL: Final check - ensure NO spaces in directory name
-            if ' ' in clean_name:
-                clean_name = clean_name.replace(' ', '-')
-                # Re-collapse multiple hyphens that might result
-                clean_name = re.sub(r'-+', '-', clean_name)
-
-            # Check for Windows reserved names
-            reserved_names = {'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3',
-                            'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-                            'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6',
-                            'LPT7', 'LPT8', 'LPT9'}
-            if clean_name.upper() in reserved_names:
-                clean_name = f"_{clean_name}"  # Prefix with underscore
-
-            # Enforce filesystem length limit (255 bytes for most filesystems)
-            max_bytes = 255
-            if len(clean_name.encode('utf-8')) > max_bytes:
-                # Truncate at UTF-8 byte boundary
-                clean_name = clean_name.encode('utf-8')[:max_bytes].decode('utf-8', errors='ignore')
-                # Remove trailing hyphen if truncation created one
-                clean_name = clean_name.rstrip('-')
-
-            return clean_name
+        return final_name
 
     def get_unique_name(self, parent_dir: Path, desired_name: str, original_path: Path,
                         max_attempts: int = 50000) -> Tuple[str, bool]:
         """
         Generate unique name by adding sequence number if conflict exists.
-        Uses hash fallback if too many duplicates exist.
+        Uses hash fallback if too many duplicates exist. Checked against the
+        rename plan, so names planned earlier in the run count as taken.
         Returns: (unique_name, is_duplicate)
         """
-        if not (parent_dir / desired_name).exists():
+        if not self.plan.exists(parent_dir / desired_name):
             return desired_name, False
 
         # Split extension if it's a file
@@ -542,7 +2239,7 @@ class MusicLibraryNormalizer:
         # Try sequence numbers
         for i in range(1, max_attempts):
             candidate = f"{stem}-{i}{ext}"
-            if not (parent_dir / candidate).exists():
+            if not self.plan.exists(parent_dir / candidate):
                 self.conflict_count += 1
                 # Track this duplicate
                 self.duplicates.append((original_path, desired_name, candidate))
@@ -553,7 +2250,7 @@ class MusicLibraryNormalizer:
         path_hash = hashlib.md5(str(original_path).encode()).hexdigest()[:8]
         candidate = f"{stem}-dup-{path_hash}{ext}"
 
-        if not (parent_dir / candidate).exists():
+        if not self.plan.exists(parent_dir / candidate):
             self.conflict_count += 1
             self.duplicates.append((original_path, desired_name, candidate))
             print(f"WARNING: Using hash-based name after {max_attempts} attempts: {candidate}")
@@ -612,6 +2309,61 @@ class MusicLibraryNormalizer:
         """Check if file is an audio file"""
         return file_path.suffix.lower() in self.audio_extensions
 
+    def walk_library(self, top: Optional[Path] = None, topdown: bool = True):
+        """
+        os.walk() replacement built on os.scandir(), yielding (dir_path, subdirs, files)
+        with os.DirEntry lists. Symlinks and skipped folders are filtered using the type
+        cached on each entry, so no extra lstat() per entry. Symlinks are never followed,
+        so everything yielded lies inside top. With topdown, subdirs may be pruned in place.
+        """
+        top = top or self.music_dir
+        try:
+            with os.scandir(top) as it:
+                entries = list(it)
+        except OSError as e:
+            print(f"WARNING: Cannot list {top}: {e}")
+            return
+
+        subdirs, files = [], []
+        for entry in entries:
+            try:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if not self.should_skip_dir(entry.name):
+                        subdirs.append(entry)
+                else:
+                    files.append(entry)
+            except OSError:
+                continue
+
+        if topdown:
+            yield top, subdirs, files
+        for entry in subdirs:
+            yield from self.walk_library(Path(entry.path), topdown)
+        if not topdown:
+            yield top, subdirs, files
+
+    def is_inside_library(self, path: str) -> bool:
+        """
+        Cheap string-prefix check for paths produced by walk_library().
+        Equivalent to is_safe_path() there, since the walker never follows symlinks.
+        """
+        return path.startswith(self.music_dir_prefix)
+
+    def audio_presence(self, walk_entries: List[Tuple[Path, list, list]]) -> Dict[Path, bool]:
+        """
+        Whether each walked folder contains audio files, directly or in any subfolder.
+        walk_entries come from walk_library() in top-down order, so going through them
+        in reverse sees every folder after all of its subfolders - one pass, linear in
+        the number of entries instead of a subtree walk per folder.
+        """
+        presence: Dict[Path, bool] = {}
+        for root_path, subdirs, files in reversed(walk_entries):
+            presence[root_path] = (any(presence.get(Path(entry.path), False) for entry in subdirs)
+                                   or any(self.is_audio_file(Path(entry.name)) for entry in files))
+        return presence
+
     def has_audio_files(self, dir_path: Path) -> bool:
         """Check if directory or any subdirectory contains audio files"""
         try:
@@ -627,40 +2379,40 @@ class MusicLibraryNormalizer:
         except Exception:
             return False
 
-    def delete_empty_folders(self):
+    def delete_empty_folders(self, candidates: Optional[List[Path]] = None):
         """
         Delete folders that don't contain any audio files (after renaming).
         Uses safe rmdir() which only works on empty directories - atomic operation.
+        With candidates (incremental mode) only those folders are checked.
         """
         print("\nScanning for empty folders...")
 
         # Collect all directories, deepest first (don't follow symlinks)
         dirs_to_check = []
-        for root, dirs, files in os.walk(self.music_dir, topdown=False, followlinks=False):
-            root_path = Path(root)
-
-            # Skip unwanted directories and symlinks
-            dirs[:] = [d for d in dirs if not self.should_skip_dir(d)
-                      and not (root_path / d).is_symlink()]
-
-            for dirname in dirs:
-                dir_path = root_path / dirname
-
-                # Skip symlinks - never delete symlinks
-                if dir_path.is_symlink():
-                    continue
-
-                dirs_to_check.append(dir_path)
+        presence: Dict[Path, bool] = {}
+        if candidates is not None:
+            # Folders may have been renamed or merged since they were listed
+            resolved = {self.rename_map.resolve(path) if self.mode == 'normal' else path for path in candidates}
+            dirs_to_check = sorted((path for path in resolved if path != self.music_dir and path.is_dir()),
+                                   key=lambda path: (-len(path.parts), str(path)))
+        else:
+            # Children before their parents (symlinks never listed)
+            walk_entries = list(self.walk_library())
+            presence = self.audio_presence(walk_entries)
+            for _, subdirs, _ in reversed(walk_entries):
+                dirs_to_check.extend(Path(entry.path) for entry in subdirs)
 
         # Check and delete empty folders (deepest first so parents become empty after children deleted)
-        for dir_path in dirs_to_check:
+        for checked, dir_path in enumerate(dirs_to_check):
+            self.tick(checked, len(dirs_to_check))
             # Skip symlinks (paranoid double-check)
             if dir_path.is_symlink():
                 continue
 
             if self.mode == 'dryrun':
                 # Double-check before reporting in dry run
-                if not self.has_audio_files(dir_path):
+                has_audio = presence[dir_path] if dir_path in presence else self.has_audio_files(dir_path)
+                if not has_audio:
                     self.deleted_folders.append(dir_path)
                     rel_path = dir_path.relative_to(self.music_dir)
                     print(f"  [DELETE] {rel_path}/ (no audio files)")
@@ -690,43 +2442,28 @@ class MusicLibraryNormalizer:
         Skips symlinks for safety.
         """
         items = []
-        dirs_with_audio = set()
 
-        # Don't follow symlinks - critical for safety
-        for root, dirs, files in os.walk(self.music_dir, followlinks=False):
-            root_path = Path(root)
+        # Don't follow symlinks - critical for safety (walk_library never does)
+        walk_entries = list(self.walk_library())
+        for root_path, _, files in walk_entries:
             depth = len(root_path.relative_to(self.music_dir).parts)
 
-            # Skip unwanted directories and symlinks
-            dirs[:] = [d for d in dirs if not self.should_skip_dir(d)
-                      and not (root_path / d).is_symlink()]
-
-            # Collect audio files only (skip symlinks)
-            for filename in files:
-                file_path = root_path / filename
-
-                # Skip symlinks for safety
-                if file_path.is_symlink():
-                    continue
-
+            # Collect audio files only (symlinks already filtered out)
+            for entry in files:
                 # Skip files outside music library (paranoid check)
-                if not self.is_safe_path(file_path):
-                    print(f"WARNING: Skipping unsafe path: {file_path}")
+                if not self.is_inside_library(entry.path):
+                    print(f"WARNING: Skipping unsafe path: {entry.path}")
                     continue
 
+                file_path = Path(entry.path)
                 if self.is_audio_file(file_path):
                     items.append((file_path, depth, 'file'))
 
-                    # Mark all parent directories as containing audio
-                    parent = file_path.parent
-                    while parent != self.music_dir:
-                        dirs_with_audio.add(parent)
-                        parent = parent.parent
-
         # Add only directories that contain audio files (directly or in subdirectories)
-        for dir_path in dirs_with_audio:
-            depth = len(dir_path.relative_to(self.music_dir).parts)
-            items.append((dir_path, depth, 'dir'))
+        for dir_path, has_audio in self.audio_presence(walk_entries).items():
+            if has_audio and dir_path != self.music_dir:
+                depth = len(dir_path.relative_to(self.music_dir).parts)
+                items.append((dir_path, depth, 'dir'))
 
         # Sort by depth (deepest first), then by type (FILES before DIRS), then by path
         # Files must be processed before their parent directories are renamed
@@ -734,91 +2471,178 @@ class MusicLibraryNormalizer:
 
         return items
 
-    def update_rename_map_for_moved_dir(self, old_parent: Path, new_parent: Path):
-        """Update all rename_map entries when a directory is moved/merged"""
-        # Find all mappings that were under the old parent
-        updated_mappings = {}
+    def scan_library_changes(self, journal_dirs: Dict[str, list]) -> Tuple[Dict[str, list], List[str], List[Path]]:
+        """
+        Compare the library with journaled folder state.
+        Folders whose inode and mtime still match are carried over without listing
+        them; every other folder (changed or not journaled) is listed, descending
+        into subfolders that are not carried over.
+        Returns (folder state to journal, changed folders, audio files directly in them).
+        """
+        states: Dict[str, list] = {}
+        for rel, state in journal_dirs.items():
+            try:
+                st = os.stat(self.music_dir / rel, follow_symlinks=False)
+            except OSError:
+                continue
+            if stat.S_ISDIR(st.st_mode) and [st.st_ino, st.st_mtime_ns] == state[:2]:
+                states[rel] = state
+
+        changed: List[str] = []
+        audio_files: List[Path] = []
+
+        def scan(dir_path: Path, rel: str, st: os.stat_result) -> bool:
+            changed.append(rel)
+            has_audio = False
+            try:
+                entries = sorted(os.scandir(dir_path), key=lambda entry: entry.name)
+            except OSError as e:
+                print(f"WARNING: Cannot list {dir_path}: {e}")
+                entries = []
 
-        for original_path, renamed_path in self.rename_map.items():
+            for entry in entries:
+                if entry.is_symlink():
+                    continue
+                entry_path = Path(entry.path)
+                if entry.is_dir():
+                    if self.should_skip_dir(entry.name):
+                        continue
+                    child_rel = entry.name if rel == '.' else f"{rel}/{entry.name}"
+                    if child_rel in states:
+                        has_audio = states[child_rel][2] or has_audio
+                    else:
+                        has_audio = scan(entry_path, child_rel, entry.stat(follow_symlinks=False)) or has_audio
+                elif self.is_audio_file(entry_path):
+                    audio_files.append(entry_path)
+                    has_audio = True
+
+            states[rel] = [st.st_ino, st.st_mtime_ns, has_audio, self.get_canonical_key(dir_path.name)]
+            return has_audio
+
+        # Parents first, so a changed folder's new subfolders are found through it
+        for rel in sorted(set(journal_dirs) | {'.'}, key=lambda rel: (rel != '.', rel.count('/'), rel)):
+            if rel in states:
+                continue
+            dir_path = self.music_dir / rel
             try:
-                # Check if the renamed path is under the old parent
-                if renamed_path.is_relative_to(old_parent):
-                    # Calculate new path under new parent
-                    relative_part = renamed_path.relative_to(old_parent)
-                    new_renamed_path = new_parent / relative_part
-                    updated_mappings[original_path] = new_renamed_path
-            except (ValueError, AttributeError):
-                # Path not related to this parent
+                st = os.stat(dir_path, follow_symlinks=False)
+            except OSError:
                 continue
+            if stat.S_ISDIR(st.st_mode):
+                scan(dir_path, rel, st)
+
+        return states, changed, audio_files
+
+    def collect_changed_items(self) -> Optional[List[Tuple[Path, int, str]]]:
+        """
+        Incremental counterpart of collect_items(): audio files and folders inside
+        folders that changed since the journal was written. Unchanged folders next
+        to them seed the canonical folder map, so new arrivals still merge into them.
+        Returns None when the journal can't be used and a full scan is needed.
+        """
+        reason = self.journal.load()
+        if reason:
+            print(f"Incremental: full scan ({reason})")
+            return None
+
+        states, changed, audio_files = self.scan_library_changes(self.journal.dirs)
+        changed_set = set(changed)
+        self.changed_dirs = [self.music_dir / rel for rel in changed]
+        print(f"Incremental: {len(changed)} of {len(states)} folder(s) changed since the last run")
+
+        items = []
+        for file_path in audio_files:
+            # Skip files outside music library (paranoid check)
+            if not self.is_safe_path(file_path):
+                print(f"WARNING: Skipping unsafe path: {file_path}")
+                continue
+            depth = len(file_path.parent.relative_to(self.music_dir).parts)
+            items.append((file_path, depth, 'file'))
+
+        for rel, (_, _, has_audio, canonical_key) in states.items():
+            if rel == '.' or not has_audio:
+                continue
+            dir_path = self.music_dir / rel
+            if rel in changed_set:
+                items.append((dir_path, len(dir_path.relative_to(self.music_dir).parts), 'dir'))
+            elif (os.path.dirname(rel) or '.') in changed_set:
+                # Unchanged folder next to changed ones - already normalized
+                self.canonical_folder_map.setdefault(dir_path.parent, {})[canonical_key] = dir_path.name
+
+        # Same order as collect_items()
+        items.sort(key=lambda x: (-x[1], x[2] == 'dir', str(x[0])))
+
+        return items
 
-        # Apply updates
-        self.rename_map.update(updated_mappings)
+    def save_journal(self):
+        """Record folder state after a normal-mode run for the next --incremental run"""
+        if self.error_count:
+            print("Incremental: journal not updated because of errors; the next run re-checks the same folders")
+            return
+
+        states, _, _ = self.scan_library_changes(self.journal.dirs)
+        try:
+            self.journal.save(states)
+            print(f"Incremental: journal updated ({len(states)} folder(s))")
+        except OSError as e:
+            print(f"WARNING: Could not write journal {self.journal.path}: {e}")
+
+    def update_rename_map_for_moved_dir(self, old_parent: Path, new_parent: Path):
+        """Update all rename_map entries when a directory is moved/merged"""
+        self.rename_map.move_tree(old_parent, new_parent)
 
     def merge_directory(self, source_dir: Path, target_dir: Path) -> int:
         """
-        Merge contents of source_dir into target_dir
+        Plan merging contents of source_dir into target_dir
         Returns number of items moved
         """
         try:
-            import shutil
             files_moved = 0
 
             # Move all contents from source to target
-            for item in source_dir.iterdir():
-                source_item = source_dir / item.name
-                target_item = target_dir / item.name
+            for name in self.plan.children(source_dir):
+                source_item = source_dir / name
+                target_item = target_dir / name
 
-                if target_item.exists():
-                    if target_item.is_dir() and source_item.is_dir():
+                if self.plan.exists(target_item):
+                    if self.plan.is_dir(target_item) and self.plan.is_dir(source_item):
                         # Recursive merge for subdirectories
                         count = self.merge_directory(source_item, target_item)
                         files_moved += count
                         # Update rename_map for all children
                         self.update_rename_map_for_moved_dir(source_item, target_item)
-                    elif target_item.is_file() and source_item.is_file():
+                    elif not self.plan.is_dir(target_item) and not self.plan.is_dir(source_item):
                         # File conflict - add sequence number
-                        base_name = item.name
-                        if '.' in base_name:
-                            stem, ext = base_name.rsplit('.', 1)
+                        if '.' in name:
+                            stem, ext = name.rsplit('.', 1)
                             ext = '.' + ext
                         else:
-                            stem, ext = base_name, ''
+                            stem, ext = name, ''
 
                         # Find unique name
                         for i in range(1, 10000):
                             candidate = target_dir / f"{stem}-{i}{ext}"
-                            if not candidate.exists():
-                                if self.mode == 'normal':
-                                    shutil.move(str(source_item), str(candidate))
+                            if not self.plan.exists(candidate):
+                                self.plan.move(source_item, candidate)
 
                                 # Update rename map (may need to update existing mapping)
-                                for orig, renamed in list(self.rename_map.items()):
-                                    if renamed == source_item:
-                                        self.rename_map[orig] = candidate
-                                        break
-                                else:
-                                    self.rename_map[source_item] = candidate
+                                orig = self.rename_map.original_of(source_item)
+                                self.rename_map[orig if orig is not None else source_item] = candidate
 
                                 files_moved += 1
                                 break
                 else:
                     # No conflict, move directly
-                    if self.mode == 'normal':
-                        shutil.move(str(source_item), str(target_item))
+                    self.plan.move(source_item, target_item)
 
                     # Update rename map (may need to update existing mapping)
-                    for orig, renamed in list(self.rename_map.items()):
-                        if renamed == source_item:
-                            self.rename_map[orig] = target_item
-                            break
-                    else:
-                        self.rename_map[source_item] = target_item
+                    orig = self.rename_map.original_of(source_item)
+                    self.rename_map[orig if orig is not None else source_item] = target_item
 
                     files_moved += 1
 
             # Remove empty source directory
-            if self.mode == 'normal' and source_dir.exists():
-                source_dir.rmdir()
+            self.plan.rmdir(source_dir)
 
             return files_moved
 
@@ -829,22 +2653,18 @@ class MusicLibraryNormalizer:
             return 0
 
     def rename_item(self, old_path: Path, item_type: str) -> Optional[Path]:
-        """Rename a single file or directory"""
+        """
+        Plan the rename of a single file or directory.
+        Nothing is touched here: the rename, or the moves of a merge, go into
+        self.plan, which normal mode applies once every item has been planned.
+        """
         try:
             # Check if the path still exists (parent might have been renamed already)
-            if not old_path.exists():
+            if not self.plan.exists(old_path):
                 # Try to find the new path through parent renames
-                resolved_path = old_path
-                for old, new in self.rename_map.items():
-                    try:
-                        if resolved_path.is_relative_to(old):
-                            # Replace the renamed parent in the path
-                            relative_part = resolved_path.relative_to(old)
-                            resolved_path = new / relative_part
-                    except (ValueError, AttributeError):
-                        continue
+                resolved_path = self.rename_map.resolve(old_path)
 
-                if resolved_path.exists():
+                if self.plan.exists(resolved_path):
                     old_path = resolved_path
                 else:
                     # Path doesn't exist and can't be resolved - skip
@@ -852,15 +2672,17 @@ class MusicLibraryNormalizer:
 
             old_name = old_path.name
             parent = old_path.parent
+            # Still at its original location on disk until the plan is applied
+            disk_path = self.plan.disk_path(old_path)
 
             # Normalize the name
             is_file = item_type == 'file'
-            new_name = self.normalize_name(old_name, is_file, old_path if is_file else None)
+            new_name = self.normalize_name(old_name, is_file, disk_path if is_file else None)
 
             # Track statistics
             if is_file and self.is_audio_file(old_path):
                 self.stats['audio_files'] += 1
-                mcatalogid = self.get_mcatalogid(old_path)
+                mcatalogid = self.get_mcatalogid(disk_path)
                 if mcatalogid:
                     self.stats['audio_with_mcatalogid'] += 1
                 else:
@@ -896,20 +2718,16 @@ class MusicLibraryNormalizer:
                         existing_normalized_name = self.canonical_folder_map[parent][canonical_key]
                         new_path = parent / existing_normalized_name
 
-                        if self.mode == 'dryrun':
-                            print(f"  [CANONICAL MERGE] {old_path.relative_to(self.music_dir)}/ -> {new_path.relative_to(self.music_dir)}/ (canonical: {canonical_key})")
-
-                        # Perform merge
-                        items_moved = 0
-                        if self.mode == 'normal':
-                            items_moved = self.merge_directory(old_path, new_path)
-
+                        # Plan the merge
+                        items_moved = self.merge_directory(old_path, new_path)
                         self.folder_merges.append((old_path, new_path, items_moved))
 
+                        if self.mode == 'dryrun':
+                            print(f"  [CANONICAL MERGE] {old_path.relative_to(self.music_dir)}/ -> {new_path.relative_to(self.music_dir)}/ (canonical: {canonical_key}, {items_moved} items)")
+
                         # Map old directory to target directory
                         self.rename_map[old_path] = new_path
-                        if self.mode == 'normal':
-                            self.update_rename_map_for_moved_dir(old_path, new_path)
+                        self.update_rename_map_for_moved_dir(old_path, new_path)
 
                         self.processed_count += 1
                         return new_path
@@ -922,38 +2740,30 @@ class MusicLibraryNormalizer:
             new_path = parent / new_name
 
             # Handle directory vs file conflicts differently
-            if not is_file and new_path.exists() and new_path.is_dir():
+            if not is_file and self.plan.is_dir(new_path):
                 # Directory conflict: MERGE instead of renaming
-                if self.mode == 'dryrun':
-                    print(f"  [MERGE] {old_path.relative_to(self.music_dir)}/ -> {new_path.relative_to(self.music_dir)}/")
-
-                # Perform merge and get count of items moved
-                items_moved = 0
-                if self.mode == 'normal':
-                    items_moved = self.merge_directory(old_path, new_path)
-
+                items_moved = self.merge_directory(old_path, new_path)
                 self.folder_merges.append((old_path, new_path, items_moved))
 
+                if self.mode == 'dryrun':
+                    print(f"  [MERGE] {old_path.relative_to(self.music_dir)}/ -> {new_path.relative_to(self.music_dir)}/ ({items_moved} items)")
+
                 # Map old directory to target directory and update all child mappings
                 self.rename_map[old_path] = new_path
-                if self.mode == 'normal':
-                    self.update_rename_map_for_moved_dir(old_path, new_path)
+                self.update_rename_map_for_moved_dir(old_path, new_path)
 
                 self.processed_count += 1
                 return new_path
 
-            elif is_file and new_path.exists():
+            elif is_file and self.plan.exists(new_path):
                 # File conflict: add sequence number
                 unique_name, is_duplicate = self.get_unique_name(parent, new_name, old_path)
                 new_path = parent / unique_name
 
-            # Store the rename mapping
+            # Plan the rename and store the mapping
+            self.plan.move(old_path, new_path)
             self.rename_map[old_path] = new_path
 
-            # Perform rename in normal mode
-            if self.mode == 'normal':
-                old_path.rename(new_path)
-
             self.processed_count += 1
             return new_path
 
@@ -962,9 +2772,236 @@ class MusicLibraryNormalizer:
             print(f"ERROR renaming {old_path}: {e}")
             return None
 
+    def apply_operation(self, op: str, source: str, target: str, dir_fds: Dict[str, int]):
+        """
+        Apply one plan operation. Paths are opened relative to their folder's
+        descriptor when the batch has one. An operation whose source is gone but
+        whose target exists was applied before an interruption and is skipped.
+        """
+        def locate(rel: str) -> Tuple[str, Optional[int]]:
+            folder = os.path.dirname(rel)
+            if folder in dir_fds:
+                return os.path.basename(rel), dir_fds[folder]
+            return str(self.music_dir / rel), None
+
+        def lexists(rel: str) -> bool:
+            name, fd = locate(rel)
+            try:
+                os.stat(name, dir_fd=fd, follow_symlinks=False)
+                return True
+            except FileNotFoundError:
+                return False
+
+        try:
+            if op == 'rmdir':
+                name, fd = locate(source)
+                try:
+                    os.rmdir(name, dir_fd=fd)
+                except FileNotFoundError:
+                    pass  # Removed before an interruption
+                return
+
+            # Never overwrite: the library may have changed since it was planned
+            if lexists(target):
+                if not lexists(source):
+                    return
+                raise FileExistsError(errno.EEXIST, "Target already exists", target)
+
+            source_name, source_fd = locate(source)
+            target_name, target_fd = locate(target)
+            try:
+                os.rename(source_name, target_name, src_dir_fd=source_fd, dst_dir_fd=target_fd)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # Folder on another file system (mount point inside the library)
+                import shutil
+                shutil.move(str(self.music_dir / source), str(self.music_dir / target))
+
+        except Exception as e:
+            self.error_count += 1
+            print(f"ERROR applying {op} {source} -> {target}: {e}" if target else f"ERROR applying {op} {source}: {e}")
+
+    def execute_plan(self, plan: RenamePlan):
+        """
+        Apply a rename plan from where it got to, in order. Consecutive operations
+        between the same two folders form a batch that runs against descriptors of
+        those folders, so each rename resolves a name rather than a full path.
+        Progress is appended to the checkpoint every PLAN_CHECKPOINT_INTERVAL
+        operations; anything applied since the last mark is recognised on resume.
+        A folder rename is marked before it is applied if operations since the
+        last mark reach into that folder, as those could not be replayed after it.
+        """
+        operations = plan.operations
+        total = len(operations)
+        use_fds = {os.rename, os.rmdir, os.stat} <= os.supports_dir_fd
+
+        def folders(operation: List[str]) -> Tuple[str, str]:
+            op, source, target = operation
+            return os.path.dirname(source), os.path.dirname(target if op != 'rmdir' else source)
+
+        progress = None
+        if self.checkpoint:
+            try:
+                progress = open(self.checkpoint, 'a', encoding='utf-8')
+            except OSError as e:
+                print(f"WARNING: Cannot record progress in checkpoint {self.checkpoint}: {e}")
+
+        print(f"Applying {total - plan.done} operation(s)...")
+        index = marked = plan.done
+        batches = 0
+        unmarked_folders = set()  # Folders holding paths of operations since the last mark
+
+        def mark(done: int):
+            nonlocal marked
+            progress.write(json.dumps({'done': done}) + '\n')
+            progress.flush()
+            os.fsync(progress.fileno())
+            marked = done
+            unmarked_folders.clear()
+
+        try:
+            while index < total:
+                batch_folders = folders(operations[index])
+                end = index + 1
+                while end < total and folders(operations[end]) == batch_folders:
+                    end += 1
+
+                dir_fds: Dict[str, int] = {}
+                if use_fds:
+                    for folder in set(batch_folders):
+                        try:
+                            dir_fds[folder] = os.open(self.music_dir / folder, os.O_RDONLY | os.O_DIRECTORY)
+                        except OSError:
+                            pass  # Full paths then; apply_operation reports the real error
+                try:
+                    for position in range(index, end):
+                        op, source, target = operations[position]
+                        if progress:
+                            if op != 'rmdir' and source in unmarked_folders:
+                                mark(position)
+                            for path in (source, target):
+                                folder = os.path.dirname(path)
+                                while folder and folder not in unmarked_folders:
+                                    unmarked_folders.add(folder)
+                                    folder = os.path.dirname(folder)
+                        self.apply_operation(op, source, target, dir_fds)
+                finally:
+                    for fd in dir_fds.values():
+                        os.close(fd)
+
+                batches += 1
+                if index // 1000 != end // 1000:
+                    print(f"Progress: {end}/{total} operations applied...")
+                self.tick(end, total)
+                index = end
+                if progress and (index - marked >= PLAN_CHECKPOINT_INTERVAL or index == total):
+                    mark(index)
+        finally:
+            if progress:
+                progress.close()
+
+        print(f"Applied {total - plan.done} operation(s) in {batches} folder batch(es)")
+
+    def apply_plan(self):
+        """Checkpoint the plan, apply it, and drop the checkpoint once it is done"""
+        if self.checkpoint:
+            try:
+                self.plan.save(self.checkpoint)
+            except OSError as e:
+                print(f"WARNING: Cannot write checkpoint {self.checkpoint}, an interrupted run can't be resumed: {e}")
+                self.checkpoint = None
+
+        self.execute_plan(self.plan)
+
+        if self.checkpoint:
+            self.checkpoint.unlink(missing_ok=True)
+
+    def resume_checkpoint(self):
+        """Finish the plan of an interrupted normal-mode run before scanning again"""
+        plan = RenamePlan(self.music_dir)
+        reason = plan.load(self.checkpoint)
+        if reason == "no checkpoint":
+            return
+        if reason:
+            print(f"WARNING: Ignoring checkpoint {self.checkpoint} ({reason})")
+            self.checkpoint.unlink(missing_ok=True)
+            return
+
+        print(f"Resuming interrupted run: {len(plan.operations) - plan.done} of "
+              f"{len(plan.operations)} planned operation(s) left")
+        self.execute_plan(plan)
+        self.checkpoint.unlink(missing_ok=True)
+        print()
+
+    def list_audio_files(self) -> List[Tuple[Path, os.stat_result]]:
+        """Every audio file in the library with its stat, in walk order"""
+        files = []
+        for _, _, file_entries in self.walk_library():
+            for entry in file_entries:
+                file_path = Path(entry.path)
+                if self.is_audio_file(file_path):
+                    try:
+                        files.append((file_path, entry.stat()))
+                    except OSError:
+                        continue
+        return files
+
+    def find_content_duplicates(self) -> List[List[Path]]:
+        """Index every audio file in the library by content (DuplicateIndex)"""
+        files = self.list_audio_files()
+        print(f"\nLooking for identical audio in {len(files)} file(s)...")
+        index = DuplicateIndex(self.tag_cache, self.jobs)
+        self.content_duplicates = index.find(files)
+        print(f"  {len(self.content_duplicates)} set(s) found; hashed {index.stats['partial']} partial, "
+              f"{index.stats['full']} full ({index.stats['cached']} file(s) from cache)")
+        return self.content_duplicates
+
+    def find_recording_duplicates(self) -> List[List[Path]]:
+        """
+        Sets of files holding the same recording (AudioFingerprinter), leaving out
+        sets that are byte-identical audio already listed by find_content_duplicates
+        """
+        self.recording_duplicates = []
+        reason = AudioFingerprinter.unavailable()
+        if reason:
+            print(f"WARNING: Skipping acoustic fingerprints: {reason}")
+            return self.recording_duplicates
+
+        files = self.list_audio_files()
+        print(f"\nComparing acoustic fingerprints of {len(files)} file(s)...")
+        # Track lengths come from the tags, so only similar lengths get compared
+        self.prefetch_tags([path for path, _ in files], verbose=False)
+        durations = {}
+        for path, _ in files:
+            record = self.get_tag_record(path)
+            if record and record.duration:
+                durations[path] = record.duration
+
+        fingerprinter = AudioFingerprinter(self.tag_cache, self.jobs)
+        same_content = {path: i for i, paths in enumerate(self.content_duplicates or []) for path in paths}
+        for paths in fingerprinter.find(files, durations):
+            if len({same_content.get(path, path) for path in paths}) > 1:
+                self.recording_duplicates.append(paths)
+
+        stats = fingerprinter.stats
+        print(f"  {len(self.recording_duplicates)} set(s) found; decoded {stats['decoded']}, "
+              f"{stats['failed']} undecodable, {stats['cached']} from cache, {stats['compared']} comparison(s)")
+        if stats['unfinished']:
+            print(f"  WARNING: ffmpeg could not run or timed out on {stats['unfinished']} file(s); "
+                  "they will be tried again next time")
+        return self.recording_duplicates
+
     def write_duplicate_report(self, output_path: Path):
-        """Write a report of files that got sequence numbers due to duplicates"""
-        if not self.duplicates:
+        """
+        Write a report of files that got sequence numbers due to duplicates,
+        and of files anywhere in the library with identical audio
+        """
+        if self.content_duplicates is None:
+            self.find_content_duplicates()
+        if self.fingerprint and self.recording_duplicates is None:
+            self.find_recording_duplicates()
+        if not self.duplicates and not self.content_duplicates and not self.recording_duplicates:
             return
 
         try:
@@ -972,6 +3009,9 @@ class MusicLibraryNormalizer:
                 f.write("# Duplicate Files Report\n")
                 f.write(f"# Generated: {Path.cwd()}\n")
                 f.write(f"# Total duplicates found: {len(self.duplicates)}\n")
+                f.write(f"# Sets of files with identical audio: {len(self.content_duplicates)}\n")
+                if self.recording_duplicates is not None:
+                    f.write(f"# Sets of files with the same recording: {len(self.recording_duplicates)}\n")
                 f.write("#\n")
                 f.write("# Format: Original Path | Desired Name | Actual Name (with sequence)\n")
                 f.write("# These files likely have duplicate content and may need cleanup\n")
@@ -985,15 +3025,47 @@ class MusicLibraryNormalizer:
                     f.write(f"  Actual:   {parent}/{sequenced_name}\n")
                     f.write("\n")
 
+                if self.content_duplicates:
+                    f.write("#\n")
+                    f.write("# Identical audio (tags ignored), anywhere in the library\n")
+                    f.write("# Format: First Path | Same Audio ...\n")
+                    f.write("#\n\n")
+                    for paths in self.content_duplicates:
+                        f.write(f"{paths[0].relative_to(self.music_dir)}\n")
+                        for path in paths[1:]:
+                            f.write(f"  Same audio: {path.relative_to(self.music_dir)}\n")
+                        f.write("\n")
+
+                if self.recording_duplicates:
+                    f.write("#\n")
+                    f.write("# Same recording (acoustic fingerprint), e.g. one track as MP3 and FLAC\n")
+                    f.write("# Format: First Path | Same Recording ...\n")
+                    f.write("#\n\n")
+                    for paths in self.recording_duplicates:
+                        f.write(f"{paths[0].relative_to(self.music_dir)}\n")
+                        for path in paths[1:]:
+                            f.write(f"  Same recording: {path.relative_to(self.music_dir)}\n")
+                        f.write("\n")
+
             print(f"\nDuplicate report written to: {output_path}")
 
         except Exception as e:
             print(f"ERROR writing duplicate report: {e}")
 
+    def build_path_index(self):
+        """(Re)build the canonical-path trie from the library as it is now"""
+        self.path_index = LibraryPathIndex(self.music_dir, self.get_canonical_key,
+                                           self.should_skip_dir, self.audio_extensions)
+        self.playlist_cache = {}
+        self.playlist_lookups = 0
+
     def find_normalized_path(self, original_path_str: str) -> Optional[Path]:
         """
         Find the normalized version of a playlist path by canonical matching.
         Returns the actual path after all renames and merges.
+        Resolved in memory against the path index; the filesystem is only
+        consulted for paths the index cannot answer (outside the library,
+        inside skipped folders or behind symlinks).
         """
         # Parse original path (could be absolute or relative)
         if Path(original_path_str).is_absolute():
@@ -1001,72 +3073,78 @@ class MusicLibraryNormalizer:
         else:
             original_path = self.music_dir / original_path_str
 
+        # Get path relative to music_dir
+        depth = len(self.music_dir.parts)
+        if original_path.parts[:depth] != self.music_dir.parts:
+            # Path is outside music_dir, can't help
+            return original_path if original_path.exists() else None
+        rel_parts = original_path.parts[depth:]
+
+        if self.path_index is None:
+            self.build_path_index()
+
         # If original path still exists unchanged, use it
-        if original_path.exists():
+        if self.path_index.exact(rel_parts):
             return original_path
 
         # Try to find normalized path by canonical matching
-        try:
-            # Get path relative to music_dir
-            if original_path.is_relative_to(self.music_dir):
-                rel_parts = original_path.relative_to(self.music_dir).parts
-            else:
-                # Path is outside music_dir, can't help
-                return None
-        except (ValueError, AttributeError):
-            return None
-
-        # Walk through directory structure finding canonical matches
-        current = self.music_dir
-
-        for i, part in enumerate(rel_parts):
-            is_last = (i == len(rel_parts) - 1)
-
-            # Check if this is a file (last part with audio extension)
-            is_file = is_last and any(part.lower().endswith(ext) for ext in self.audio_extensions)
-
-            if is_file:
-                # This is a file - look for canonical match
-                if not current.exists() or not current.is_dir():
-                    return None
-
-                # Get canonical stem (without extension and MCATALOGID)
-                stem = part.rsplit('.', 1)[0] if '.' in part else part
-                ext = '.' + part.rsplit('.', 1)[1].lower() if '.' in part else ''
-
-                # Remove any existing MCATALOGID from original stem for comparison
-                stem_clean = re.sub(r'-\[(?:mid-)?[^\]]+\]$', '', stem)
-                canonical_stem = self.get_canonical_key(stem_clean)
-
-                # Search for matching file
-                for item in current.iterdir():
-                    if item.is_file() and item.suffix.lower() == ext:
-                        # Get item's stem without MCATALOGID
-                        item_stem = item.name.rsplit('.', 1)[0] if '.' in item.name else item.name
-                        item_stem_clean = re.sub(r'-\[(?:mid-)?[^\]]+\]$', '', item_stem)
-
-                        if self.get_canonical_key(item_stem_clean) == canonical_stem:
-                            return item
-
-                # File not found
-                return None
-            else:
-                # This is a directory - look for canonical match
-                canonical_key = self.get_canonical_key(part)
-
-                found = False
-                if current.exists() and current.is_dir():
-                    for item in current.iterdir():
-                        if item.is_dir() and not self.should_skip_dir(item.name):
-                            if self.get_canonical_key(item.name) == canonical_key:
-                                current = item
-                                found = True
-                                break
+        resolved = self.path_index.resolve(rel_parts)
+        if resolved:
+            return resolved
 
-                if not found:
-                    return None
+        # The walk already proved it missing unless it runs through a skipped folder or symlink
+        if self.path_index.covers(rel_parts):
+            return None
+        return original_path if original_path.exists() else None
 
-        return current if current.exists() else None
+    def resolve_playlist_entry(self, entry: str) -> Tuple[Optional[str], Optional[Path]]:
+        """
+        Resolve a playlist entry once per run, however many playlists list it.
+        Returns what the entry points to as written ('file', 'dir' or None) and
+        its current path (find_normalized_path). Safe to call from playlist
+        worker threads: the index is read-only and a racing duplicate lookup
+        just stores the same result twice.
+        """
+        cached = self.playlist_cache.get(entry)
+        if cached is not None:
+            return cached
+
+        original_path = self.music_dir / entry  # Absolute entries replace music_dir
+        kind = None
+        depth = len(self.music_dir.parts)
+        if original_path.parts[:depth] == self.music_dir.parts:
+            kind = self.path_index.exact(original_path.parts[depth:])
+        resolved = original_path if kind else self.find_normalized_path(entry)
+        if kind is None and resolved == original_path:
+            # Exists outside the index (other mount, skipped folder, symlink)
+            kind = 'file' if original_path.is_file() else 'dir'
+
+        cached = (kind, resolved)
+        self.playlist_cache[entry] = cached
+        return cached
+
+    def suggest_playlist_fix(self, entry: str) -> Optional[Path]:
+        """
+        Where a broken playlist entry most likely went: its canonical match
+        (renamed or merged folders), else the only audio file in the library
+        with the same canonical name (moved to another artist or album).
+        Only audio entries get a suggestion; a folder would still not play.
+        """
+        original_path = self.music_dir / entry
+        if not self.is_audio_file(original_path):
+            return None
+        resolved = self.resolve_playlist_entry(entry)[1]
+        if resolved is not None and resolved != original_path:
+            return resolved
+        return self.path_index.unique_by_name(original_path.name)
+
+    def playlist_cache_stats(self) -> str:
+        """One-line summary of the playlist resolution cache"""
+        unique = len(self.playlist_cache)
+        hits = max(0, self.playlist_lookups - unique)
+        rate = hits / self.playlist_lookups * 100 if self.playlist_lookups else 0.0
+        return (f"{self.playlist_lookups} entr(ies), {unique} unique path(s) resolved, "
+                f"{rate:.1f}% cache hits")
 
     def strip_mcatalogid_from_path(self, path_str: str) -> str:
         """
@@ -1084,11 +3162,11 @@ class MusicLibraryNormalizer:
                 ext = '.' + filename.rsplit('.', 1)[1]
 
                 # Remove MCATALOGID pattern from stem
-                stem_clean = re.sub(r'-\[(?:mid-)?[^\]]+\]$', '', stem)
+                stem_clean = MCATALOGID_SUFFIX.sub('', stem)
                 parts[-1] = stem_clean + ext
             else:
                 # No extension, just clean the filename
-                parts[-1] = re.sub(r'-\[(?:mid-)?[^\]]+\]$', '', filename)
+                parts[-1] = MCATALOGID_SUFFIX.sub('', filename)
 
         # Reconstruct path
         return str(Path(*parts)) if parts else path_str
@@ -1099,6 +3177,9 @@ class MusicLibraryNormalizer:
         This runs AFTER all file renaming and folder merging is complete.
         Uses canonical path resolution to find renamed files.
         Ignores MCATALOGID when comparing paths (only updates if path structure changed).
+        Playlists are rewritten by a thread pool of --jobs workers (threads whatever
+        --pool says: they share the in-memory index and resolution cache), and
+        reported here in playlist order.
         """
         if not self.playlist_input:
             return  # Playlist update not needed (e.g., ingest mode)
@@ -1115,12 +3196,36 @@ class MusicLibraryNormalizer:
         print(f"\n{'[DRY RUN] ' if self.mode == 'dryrun' else ''}Updating {len(playlist_files)} playlist(s)...")
         print("Resolving paths using canonical matching (ignoring MCATALOGID differences)...")
 
-        for playlist_file in playlist_files:
-            try:
-                self.update_single_playlist(playlist_file)
-            except Exception as e:
-                self.error_count += 1
-                print(f"ERROR updating playlist {playlist_file.name}: {e}")
+        if self.path_index is None:
+            self.build_path_index()
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            futures = [executor.submit(self.update_single_playlist, playlist_file)
+                       for playlist_file in playlist_files]
+            for done, (playlist_file, future) in enumerate(zip(playlist_files, futures), 1):
+                self.tick(done - 1, len(playlist_files))
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.error_count += 1
+                    print(f"ERROR updating playlist {playlist_file.name}: {e}")
+                    continue
+                if result is None:
+                    self.error_count += 1
+                    continue
+
+                entries, updates_count, not_found_count = result
+                self.playlist_lookups += entries
+                if updates_count > 0 or not_found_count > 0:
+                    msg = f"  {playlist_file.name}:"
+                    if updates_count > 0:
+                        msg += f" {updates_count} path(s) {'would be ' if self.mode == 'dryrun' else ''}updated"
+                    if not_found_count > 0:
+                        msg += f", {not_found_count} not found"
+                    print(msg)
+
+        if playlist_files:
+            print(f"Playlist paths: {self.playlist_cache_stats()}")
 
     def read_playlist_safe(self, playlist_file: Path) -> Optional[List[str]]:
         """
@@ -1148,7 +3253,7 @@ class MusicLibraryNormalizer:
             print(f"ERROR: Cannot read playlist {playlist_file.name} even in binary mode: {e}")
             return None
 
-    def update_single_playlist(self, playlist_file: Path):
+    def update_single_playlist(self, playlist_file: Path) -> Optional[Tuple[int, int, int]]:
         """
         Update a single .m3u playlist file using canonical path resolution.
 
@@ -1158,13 +3263,16 @@ class MusicLibraryNormalizer:
         3. If exists AND different from original → replace with new path
         4. If exists AND same as original → keep as-is (already processed)
         5. If not exists → keep original (broken reference)
+
+        Runs on a playlist worker thread: returns (entries, updated, not found)
+        for update_playlists to report, or None if the playlist is unreadable.
         """
         lines = self.read_playlist_safe(playlist_file)
         if lines is None:
-            self.error_count += 1
-            return
+            return None
 
         updated_lines = []
+        entries = 0
         updates_count = 0
         not_found_count = 0
 
@@ -1177,12 +3285,13 @@ class MusicLibraryNormalizer:
                 continue
 
             # This is a file path - convert to canonical format
+            entries += 1
             was_absolute = Path(stripped).is_absolute()
 
-            # Find the normalized/canonical path
-            normalized_path = self.find_normalized_path(stripped)
+            # Find the normalized/canonical path (once per run for each distinct entry)
+            normalized_path = self.resolve_playlist_entry(stripped)[1]
 
-            if normalized_path and normalized_path.exists():
+            if normalized_path:
                 # Path exists - check if it changed
                 # Convert normalized path to same format as original (absolute or relative)
                 if was_absolute:
@@ -1210,26 +3319,11 @@ class MusicLibraryNormalizer:
                 not_found_count += 1
 
         # Write updated playlist
-        output_file = self.playlist_output / playlist_file.name
-
-        if self.mode == 'dryrun':
-            if updates_count > 0 or not_found_count > 0:
-                msg = f"  {playlist_file.name}:"
-                if updates_count > 0:
-                    msg += f" {updates_count} path(s) would be updated"
-                if not_found_count > 0:
-                    msg += f", {not_found_count} not found"
-                print(msg)
-        else:
-            with open(output_file, 'w', encoding='utf-8') as f:
+        if self.mode != 'dryrun':
+            with open(self.playlist_output / playlist_file.name, 'w', encoding='utf-8') as f:
                 f.writelines(updated_lines)
-            if updates_count > 0 or not_found_count > 0:
-                msg = f"  {playlist_file.name}:"
-                if updates_count > 0:
-                    msg += f" {updates_count} path(s) updated"
-                if not_found_count > 0:
-                    msg += f", {not_found_count} not found"
-                print(msg)
+
+        return entries, updates_count, not_found_count
 
     def test_mcatalogid_extraction(self, num_files: int = 10):
         """Test MCATALOGID extraction on sample files"""
@@ -1325,7 +3419,8 @@ class MusicLibraryNormalizer:
                         self.created_artists.append(artist_folder)
                         print(f"  👤 CREATED: {artist_folder.relative_to(self.music_dir)}/")
                     except FileExistsError:
-                        # Another process created it - re-check canonical match
+                        # Another process created it - rescan and re-check canonical match
+                        self.invalidate_folder_index(self.music_dir)
                         artist_folder = self.find_artist_folder(artist)
                         if not artist_folder:
                             # Still can't find it, use the path we tried to create
@@ -1334,6 +3429,8 @@ class MusicLibraryNormalizer:
                                 # Very rare race condition - create with exist_ok
                                 artist_folder.mkdir(parents=True, exist_ok=True)
 
+                self.register_folder(artist_folder)
+
             # Determine target folder (artist root or album subfolder)
             target_folder = artist_folder
 
@@ -1361,7 +3458,8 @@ class MusicLibraryNormalizer:
                             self.created_albums.append(album_folder)
                             print(f"  📁 CREATED: {album_folder.relative_to(self.music_dir)}/")
                         except FileExistsError:
-                            # Another process created it - re-check canonical match
+                            # Another process created it - rescan and re-check canonical match
+                            self.invalidate_folder_index(artist_folder)
                             album_folder = self.find_album_folder(artist_folder, album)
                             if not album_folder:
                                 # Still can't find it, use the path we tried to create
@@ -1370,6 +3468,8 @@ class MusicLibraryNormalizer:
                                     # Very rare race condition - create with exist_ok
                                     album_folder.mkdir(parents=True, exist_ok=True)
 
+                    self.register_folder(album_folder)
+
                     target_folder = album_folder
 
             # Normalize the filename
@@ -1410,6 +3510,149 @@ class MusicLibraryNormalizer:
             traceback.print_exc()
             return False
 
+    def observe_file(self, file_path: Path) -> List[Tuple[str, object]]:
+        """
+        Findings for one file as (observe_findings key, finding) pairs.
+        Shared by the observe report and the JSON Lines stream.
+        """
+        filename = file_path.name
+
+        # Check if audio file
+        if not self.is_audio_file(file_path):
+            return [('non_audio_files', file_path)]
+
+        findings = []
+
+        # Check for spaces in filename
+        if ' ' in filename:
+            findings.append(('files_with_spaces', file_path))
+
+        # Check MCATALOGID
+        mcatalogid_from_tag = self.get_mcatalogid(file_path)
+
+        # Extract MCATALOGID from filename
+        stem = filename.rsplit('.', 1)[0] if '.' in filename else filename
+
+        # Find ALL matches (to detect duplicates)
+        all_matches = MCATALOGID_ANYWHERE.findall(stem)
+
+        # Check for multiple MCATALOGID in filename
+        if len(all_matches) > 1:
+            findings.append(('files_multiple_mcatalogid', (file_path, all_matches)))
+
+        # Get the last match (most recent/authoritative)
+        match = MCATALOGID_SUFFIX.search(stem)
+        mcatalogid_from_filename = match.group(1) if match else None
+
+        if not mcatalogid_from_tag and not mcatalogid_from_filename:
+            findings.append(('files_without_mcatalogid', file_path))
+        elif mcatalogid_from_tag and mcatalogid_from_filename:
+            if mcatalogid_from_tag.lower() != mcatalogid_from_filename.lower():
+                findings.append(('files_mcatalogid_mismatch',
+                                 (file_path, mcatalogid_from_filename, mcatalogid_from_tag)))
+
+        return findings
+
+    def run_observe_stream(self, output: str):
+        """
+        Observe as JSON Lines: one object per finding, written as soon as the folder
+        holding it has been scanned, then a summary line. Folders are walked bottom-up
+        and only per-folder state is kept (canonical groups and normalized names of one
+        folder, audio presence of subfolders whose parent is still open), so memory
+        follows tree depth and the widest folder instead of library size.
+        output is a file path, or '-' for stdout (progress then goes to stderr).
+        """
+        try:
+            stream = sys.stdout if output == '-' else open(output, 'w', encoding='utf-8')
+        except OSError as e:
+            print(f"ERROR: cannot write {output}: {e}")
+            sys.exit(1)
+        counts = Counter()
+        totals = Counter()
+        presence: Dict[Path, bool] = {}  # finished folders whose parent is not finished yet
+
+        def rel(path: Path) -> str:
+            return str(path.relative_to(self.music_dir))
+
+        def emit(kind: str, **fields):
+            counts[kind] += 1
+            stream.write(json.dumps({'type': kind, **fields}, ensure_ascii=False) + '\n')
+
+        def emit_file_finding(kind: str, finding):
+            if kind == 'files_multiple_mcatalogid':
+                emit(kind, path=rel(finding[0]), mcatalogids=finding[1])
+            elif kind == 'files_mcatalogid_mismatch':
+                emit(kind, path=rel(finding[0]), filename_id=finding[1], tag_id=finding[2])
+            else:
+                emit(kind, path=rel(finding))
+
+        progress = contextlib.redirect_stdout(sys.stderr) if stream is sys.stdout else contextlib.nullcontext()
+        try:
+            with progress:
+                print(f"Music Library Observer (streaming)")
+                print(f"Analyzing: {self.music_dir}")
+
+                if not self.music_dir.exists():
+                    print(f"ERROR: Music library not found: {self.music_dir}")
+                    return
+
+                with self.phase('analyze'):
+                    for root_path, subdirs, files in self.walk_library(topdown=False):
+                        file_paths = [Path(entry.path) for entry in files]
+                        self.tick(totals['files'], None)
+                        self.prefetch_tags([path for path in file_paths if self.is_audio_file(path)], verbose=False)
+
+                        has_audio = False
+                        normalized_names = defaultdict(list)
+                        for file_path in file_paths:
+                            totals['files'] += 1
+                            for kind, finding in self.observe_file(file_path):
+                                emit_file_finding(kind, finding)
+                            if self.is_audio_file(file_path):
+                                has_audio = True
+                                totals['audio_files'] += 1
+                                normalized = self.normalize_name(file_path.name, is_file=True, file_path=file_path)
+                                normalized_names[normalized].append(file_path.name)
+                            # Tags are not needed once the folder is done
+                            self.tag_records.pop(file_path, None)
+
+                        canonical_groups = defaultdict(list)
+                        for entry in subdirs:
+                            totals['directories'] += 1
+                            dir_path = Path(entry.path)
+                            # Never yielded by the walk: listing it failed (warned about already)
+                            readable = dir_path in presence
+                            child_has_audio = presence.pop(dir_path, False)
+                            has_audio = has_audio or child_has_audio
+                            if ' ' in entry.name:
+                                emit('folders_with_spaces', path=rel(dir_path))
+                            if not readable:
+                                emit('unreadable_folders', path=rel(dir_path))
+                            elif not child_has_audio:
+                                emit('empty_folders', path=rel(dir_path))
+                            canonical_groups[self.get_canonical_key(entry.name)].append(entry.name)
+                        presence[root_path] = has_audio
+
+                        for canonical_key, names in canonical_groups.items():
+                            if len(names) > 1:
+                                emit('canonical_folder_groups', parent=rel(root_path), canonical=canonical_key,
+                                     folders=names)
+                        for normalized, names in normalized_names.items():
+                            if len(names) > 1:
+                                emit('potential_duplicates', parent=rel(root_path), normalized=normalized, files=names)
+                        stream.flush()
+
+                stream.write(json.dumps({'type': 'summary', 'directories': totals['directories'],
+                                         'files': totals['files'], 'audio_files': totals['audio_files'],
+                                         'findings': dict(counts)}) + '\n')
+                stream.flush()
+                print(f"Wrote {sum(counts.values())} finding(s) for {totals['files']} file(s) "
+                      f"in {totals['directories']} folder(s) to {'stdout' if output == '-' else output}")
+                self.print_tag_stats()
+        finally:
+            if stream is not sys.stdout:
+                stream.close()
+
     def run_observe(self):
         """Observe library and report potential issues"""
         print(f"Music Library Observer")
@@ -1429,93 +3672,72 @@ class MusicLibraryNormalizer:
         total_files = 0
         total_dirs = 0
 
-        for root, dirs, files in os.walk(self.music_dir):
-            root_path = Path(root)
-
-            # Skip unwanted directories
-            dirs[:] = [d for d in dirs if not self.should_skip_dir(d)]
-
-            # Check directories
-            for dirname in dirs:
-                total_dirs += 1
-                dir_path = root_path / dirname
-
-                # Check for spaces
-                if ' ' in dirname:
-                    self.observe_findings['folders_with_spaces'].append(dir_path)
-
-                # Check if folder is empty (no audio files)
-                if not self.has_audio_files(dir_path):
-                    self.observe_findings['empty_folders'].append(dir_path)
-
-                # Track canonical groups
-                canonical_key = self.get_canonical_key(dirname)
-                if root_path not in canonical_groups_by_parent:
-                    canonical_groups_by_parent[root_path] = {}
-
-                if canonical_key not in canonical_groups_by_parent[root_path]:
-                    canonical_groups_by_parent[root_path][canonical_key] = []
-                canonical_groups_by_parent[root_path][canonical_key].append(dirname)
-
-            # Check files
-            for filename in files:
-                file_path = root_path / filename
-                total_files += 1
-
-                # Check if audio file
-                if not self.is_audio_file(file_path):
-                    self.observe_findings['non_audio_files'].append(file_path)
-                    continue
-
-                # Check for spaces in filename
-                if ' ' in filename:
-                    self.observe_findings['files_with_spaces'].append(file_path)
-
-                # Check MCATALOGID
-                mcatalogid_from_tag = self.get_mcatalogid(file_path)
-
-                # Extract MCATALOGID from filename
-                stem = filename.rsplit('.', 1)[0] if '.' in filename else filename
-                mcatalogid_pattern = r'-\[(?:mid-)?([^\]]+)\]'
-
-                # Find ALL matches (to detect duplicates)
-                all_matches = re.findall(mcatalogid_pattern, stem)
-
-                # Check for multiple MCATALOGID in filename
-                if len(all_matches) > 1:
-                    self.observe_findings['files_multiple_mcatalogid'].append((file_path, all_matches))
-
-                # Get the last match (most recent/authoritative)
-                match = re.search(mcatalogid_pattern + r'$', stem)
-                mcatalogid_from_filename = match.group(1) if match else None
-
-                if not mcatalogid_from_tag and not mcatalogid_from_filename:
-                    self.observe_findings['files_without_mcatalogid'].append(file_path)
-                elif mcatalogid_from_tag and mcatalogid_from_filename:
-                    if mcatalogid_from_tag.lower() != mcatalogid_from_filename.lower():
-                        self.observe_findings['files_mcatalogid_mismatch'].append(
-                            (file_path, mcatalogid_from_filename, mcatalogid_from_tag)
-                        )
-
-                # Check for potential duplicates (same normalized name in same folder)
-                normalized = self.normalize_name(filename, is_file=True, file_path=file_path)
-                key = (root_path, normalized)
-                if key not in normalized_file_names:
-                    normalized_file_names[key] = []
-                normalized_file_names[key].append(filename)
-
-        # Find canonical folder groups (multiple folders with same canonical key)
-        for parent, groups in canonical_groups_by_parent.items():
-            for canonical_key, folder_names in groups.items():
-                if len(folder_names) > 1:
-                    # Multiple folders with same canonical key
-                    full_paths = [parent / name for name in folder_names]
-                    self.observe_findings['canonical_folder_groups'][canonical_key] = full_paths
-
-        # Find potential duplicate files
-        for (parent, normalized), originals in normalized_file_names.items():
-            if len(originals) > 1:
-                self.observe_findings['potential_duplicates'].append((parent, normalized, originals))
+        # Walk first so tag reads can be handed to the worker pool in one batch,
+        # and so "contains audio" is worked out for every folder in one pass
+        with self.phase('collect'):
+            walk_entries = list(self.walk_library())
+            presence = self.audio_presence(walk_entries)
+
+        with self.phase('tags'):
+            self.prefetch_tags([Path(entry.path) for _, _, files in walk_entries
+                                for entry in files if self.is_audio_file(Path(entry.name))])
+
+        with self.phase('analyze'):
+            for folders_done, (root_path, subdirs, file_entries) in enumerate(walk_entries):
+                self.tick(folders_done, len(walk_entries))
+                dirs = [entry.name for entry in subdirs]
+                files = [entry.name for entry in file_entries]
+
+                # Check directories
+                for dirname in dirs:
+                    total_dirs += 1
+                    dir_path = root_path / dirname
+
+                    # Check for spaces
+                    if ' ' in dirname:
+                        self.observe_findings['folders_with_spaces'].append(dir_path)
+
+                    # Check if folder is empty (no audio files, or it could not be listed)
+                    if not presence.get(dir_path, False):
+                        self.observe_findings['empty_folders'].append(dir_path)
+
+                    # Track canonical groups
+                    canonical_key = self.get_canonical_key(dirname)
+                    if root_path not in canonical_groups_by_parent:
+                        canonical_groups_by_parent[root_path] = {}
+
+                    if canonical_key not in canonical_groups_by_parent[root_path]:
+                        canonical_groups_by_parent[root_path][canonical_key] = []
+                    canonical_groups_by_parent[root_path][canonical_key].append(dirname)
+
+                # Check files
+                for filename in files:
+                    file_path = root_path / filename
+                    total_files += 1
+
+                    for key, finding in self.observe_file(file_path):
+                        self.observe_findings[key].append(finding)
+
+                    # Check for potential duplicates (same normalized name in same folder)
+                    if self.is_audio_file(file_path):
+                        normalized = self.normalize_name(filename, is_file=True, file_path=file_path)
+                        key = (root_path, normalized)
+                        if key not in normalized_file_names:
+                            normalized_file_names[key] = []
+                        normalized_file_names[key].append(filename)
+
+            # Find canonical folder groups (multiple folders with same canonical key)
+            for parent, groups in canonical_groups_by_parent.items():
+                for canonical_key, folder_names in groups.items():
+                    if len(folder_names) > 1:
+                        # Multiple folders with same canonical key
+                        full_paths = [parent / name for name in folder_names]
+                        self.observe_findings['canonical_folder_groups'][canonical_key] = full_paths
+
+            # Find potential duplicate files
+            for (parent, normalized), originals in normalized_file_names.items():
+                if len(originals) > 1:
+                    self.observe_findings['potential_duplicates'].append((parent, normalized, originals))
 
         # Print report
         print(f"\n{'='*70}")
@@ -1527,6 +3749,7 @@ class MusicLibraryNormalizer:
         print(f"  Total files: {total_files}")
         print(f"  Audio files: {total_files - len(self.observe_findings['non_audio_files'])}")
         print(f"  Non-audio files: {len(self.observe_findings['non_audio_files'])}")
+        self.print_tag_stats()
 
         # Empty folders (will be deleted)
         if self.observe_findings['empty_folders']:
@@ -1668,54 +3891,57 @@ class MusicLibraryNormalizer:
         self.reconcile_findings['total_playlists'] = len(playlist_files)
         print(f"Found {len(playlist_files)} playlist(s)\n")
 
-        print("Checking playlist entries...")
+        print("Indexing library...")
+        with self.phase('index'):
+            self.build_path_index()
+        print(f"Indexed {self.path_index.file_count} file(s)\n")
 
-        for playlist_file in playlist_files:
-            try:
-                # Use safe playlist reading
-                lines = self.read_playlist_safe(playlist_file)
-                if lines is None:
-                    continue
+        print("Checking playlist entries...")
 
-                playlist_issues = []
+        with self.phase('playlists'):
+            for done, playlist_file in enumerate(playlist_files):
+                self.tick(done, len(playlist_files))
+                try:
+                    # Use safe playlist reading
+                    lines = self.read_playlist_safe(playlist_file)
+                    if lines is None:
+                        continue
 
-                for line_num, line in enumerate(lines, 1):
-                    stripped = line.strip()
+                    playlist_issues = []
 
-                    # Skip comments and empty lines
-                    if not stripped or stripped.startswith('#'):
-                        continue
+                    for line_num, line in enumerate(lines, 1):
+                        stripped = line.strip()
 
-                    self.reconcile_findings['total_entries'] += 1
+                        # Skip comments and empty lines
+                        if not stripped or stripped.startswith('#'):
+                            continue
 
-                    # This is a file path
-                    file_path = None
-                    reason = None
+                        self.reconcile_findings['total_entries'] += 1
+                        self.playlist_lookups += 1
 
-                    # Determine if absolute or relative path
-                    if Path(stripped).is_absolute():
-                        file_path = Path(stripped)
-                    else:
-                        # Relative to music directory
-                        file_path = self.music_dir / stripped
+                        # Check if file exists - in memory for library paths, once per distinct entry
+                        reason = None
+                        kind = self.resolve_playlist_entry(stripped)[0]
 
-                    # Check if file exists
-                    if not file_path.exists():
-                        reason = "File not found"
-                    elif not file_path.is_file():
-                        reason = "Path is not a file"
+                        if kind is None:
+                            reason = "File not found"
+                        elif kind != 'file':
+                            reason = "Path is not a file"
 
-                    if reason:
-                        entry = (playlist_file.name, line_num, stripped, reason)
-                        self.reconcile_findings['broken_entries'].append(entry)
-                        playlist_issues.append(entry)
+                        if reason:
+                            entry = (playlist_file.name, line_num, stripped, reason)
+                            self.reconcile_findings['broken_entries'].append(entry)
+                            playlist_issues.append(entry)
+                            fixes = self.reconcile_findings['suggested_fixes']
+                            if reason == "File not found" and stripped not in fixes:
+                                fixes[stripped] = self.suggest_playlist_fix(stripped)
 
-                # Track playlists with issues
-                if playlist_issues:
-                    self.reconcile_findings['playlists_with_issues'][playlist_file.name] = playlist_issues
+                    # Track playlists with issues
+                    if playlist_issues:
+                        self.reconcile_findings['playlists_with_issues'][playlist_file.name] = playlist_issues
 
-            except Exception as e:
-                print(f"ERROR reading playlist {playlist_file.name}: {e}")
+                except Exception as e:
+                    print(f"ERROR reading playlist {playlist_file.name}: {e}")
 
         # Print report
         print(f"\n{'='*70}")
@@ -1732,6 +3958,18 @@ class MusicLibraryNormalizer:
         print(f"  Working entries: {total_working}")
         print(f"  Broken entries: {total_broken} ({broken_percentage:.1f}%)")
         print(f"  Playlists with issues: {len(self.reconcile_findings['playlists_with_issues'])}")
+        print(f"  Path lookups: {self.playlist_cache_stats()}")
+
+        fixes = self.reconcile_findings['suggested_fixes']
+        fixable = sum(1 for _, _, path, _ in self.reconcile_findings['broken_entries'] if fixes.get(path))
+        if total_broken:
+            print(f"  Broken entries with a suggested fix: {fixable}")
+
+        def show_fix(path: str, indent: str):
+            fix = fixes.get(path)
+            if fix:
+                shown = fix.relative_to(self.music_dir) if fix.is_relative_to(self.music_dir) else fix
+                print(f"{indent}→ {shown}")
 
         if self.reconcile_findings['broken_entries']:
             print(f"\n🚨 Broken References:")
@@ -1742,6 +3980,7 @@ class MusicLibraryNormalizer:
                 for _, line_num, path, reason in issues[:5]:  # Show first 5 per playlist
                     print(f"    Line {line_num}: {reason}")
                     print(f"      {path}")
+                    show_fix(path, '      ')
                 if len(issues) > 5:
                     print(f"    ... and {len(issues) - 5} more broken entries")
 
@@ -1764,6 +4003,7 @@ class MusicLibraryNormalizer:
             for playlist_name, line_num, path, reason in self.reconcile_findings['broken_entries'][:10]:
                 print(f"  [{playlist_name}:{line_num}] {reason}")
                 print(f"    {path}")
+                show_fix(path, '    ')
 
         else:
             print(f"\n✅ All playlist entries are valid!")
@@ -1774,6 +4014,8 @@ class MusicLibraryNormalizer:
 
         if self.reconcile_findings['broken_entries']:
             print(f"⚠️  {total_broken} broken playlist entries need attention")
+            if fixable:
+                print(f"   → {fixable} of them can be fixed as suggested (shown with →)")
             print(f"   1. If you recently ran 'organize', re-run with playlist updates")
             print(f"   2. Check if files were moved/deleted manually")
             print(f"   3. Consider regenerating affected playlists")
@@ -1817,14 +4059,15 @@ class MusicLibraryNormalizer:
         print("Scanning ingest directory...")
         audio_files = []
 
-        for root, dirs, files in os.walk(self.ingest_dir):
-            # Skip unwanted directories
-            dirs[:] = [d for d in dirs if not self.should_skip_dir(d)]
+        with self.phase('collect'):
+            for root, dirs, files in os.walk(self.ingest_dir):
+                # Skip unwanted directories
+                dirs[:] = [d for d in dirs if not self.should_skip_dir(d)]
 
-            for filename in files:
-                file_path = Path(root) / filename
-                if self.is_audio_file(file_path):
-                    audio_files.append(file_path)
+                for filename in files:
+                    file_path = Path(root) / filename
+                    if self.is_audio_file(file_path):
+                        audio_files.append(file_path)
 
         print(f"Found {len(audio_files)} audio file(s) to ingest\n")
 
@@ -1832,11 +4075,19 @@ class MusicLibraryNormalizer:
             print("No audio files found to ingest.")
             return
 
+        with self.phase('tags'):
+            self.prefetch_tags(audio_files)
+
         print("Processing files...")
-        for file_path in audio_files:
-            self.ingest_file(file_path)
+        with self.phase('ingest'):
+            for done, file_path in enumerate(audio_files):
+                self.tick(done, len(audio_files))
+                self.ingest_file(file_path)
 
-        # Summary
+        self.print_ingest_summary()
+
+    def print_ingest_summary(self):
+        """Summary of an ingest run (batch or watch)"""
         print(f"\n{'='*60}")
         print(f"Ingest Summary:")
         print(f"  Mode: {self.mode.upper()}")
@@ -1846,6 +4097,7 @@ class MusicLibraryNormalizer:
         print(f"  Album folders created: {self.ingest_stats['albums_created']}")
         print(f"  Files skipped: {self.ingest_stats['skipped']} (kept in ingest dir)")
         print(f"  Errors: {self.ingest_stats['errors']}")
+        self.print_tag_stats()
         print(f"{'='*60}")
 
         if self.created_artists:
@@ -1882,6 +4134,161 @@ class MusicLibraryNormalizer:
             if self.ingest_stats['skipped'] > 0:
                 print(f"⚠️  {self.ingest_stats['skipped']} file(s) remain in ingest directory (review reasons above)")
 
+    def run_watch(self, debounce: float = 2.0, queue_size: int = 64, stats_interval: float = 60.0):
+        """
+        Keep running and ingest files as they arrive in the ingest directory.
+
+        - inotify reports written/moved-in files, or the tree is polled when it is unavailable
+        - A file is queued once its size and mtime have been stable for `debounce` seconds
+        - A single worker runs ingest_file() from a bounded queue, so the canonical
+          artist/album index stays consistent; when the queue is full the watcher
+          waits (back-pressure) instead of piling up events; the index is rebuilt
+          after WATCH_INDEX_REFRESH_SECONDS without new files
+        - Throughput and queue depth are reported every `stats_interval` seconds
+        - SIGINT/SIGTERM finish the queued files and print the usual summary
+        """
+        print(f"Music Library Ingest (watch)")
+        print(f"Ingest directory: {self.ingest_dir}")
+        print(f"Music library: {self.music_dir}")
+        print(f"⚠️  Files will be MOVED (permanently removed from ingest dir) when successfully placed")
+        print()
+
+        if not self.ingest_dir.exists():
+            print(f"ERROR: Ingest directory not found: {self.ingest_dir}")
+            return
+
+        if not self.music_dir.exists():
+            print(f"ERROR: Music library not found: {self.music_dir}")
+            return
+
+        try:
+            watcher = InotifyWatcher(self.ingest_dir, self.should_skip_dir, debounce)
+        except (OSError, AttributeError) as e:
+            print(f"WARNING: inotify unavailable ({e}), polling every {debounce:g}s")
+            watcher = PollingWatcher(self.ingest_dir, self.should_skip_dir, debounce)
+
+        work: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        stop = threading.Event()
+        in_flight = set()  # queued or being ingested
+        settled: Dict[Path, Tuple[int, int]] = {}  # left in place (skipped) -> (size, mtime) when seen
+        watch_stats = {'queued': 0, 'done': 0, 'backpressure_waits': 0}
+
+        def stat_key(path: Path) -> Optional[Tuple[int, int]]:
+            try:
+                st = path.stat()
+            except OSError:
+                return None
+            return (st.st_size, st.st_mtime_ns)
+
+        def worker():
+            last_batch = time.monotonic()
+            while True:
+                batch = [work.get()]
+                # Take whatever else is waiting, so tags can be read in parallel
+                while len(batch) < max(self.jobs * 4, 1):
+                    try:
+                        batch.append(work.get_nowait())
+                    except queue.Empty:
+                        break
+
+                # Folders may have been created by other runs while idle
+                if time.monotonic() - last_batch > WATCH_INDEX_REFRESH_SECONDS:
+                    self.artist_index = None
+                    self.album_index.clear()
+
+                files = [path for path in batch if path is not None]
+                self.prefetch_tags([path for path in files if path.exists()])
+                for path in files:
+                    if path.exists():
+                        self.ingest_file(path)
+                    key = stat_key(path)
+                    if key:
+                        settled[path] = key
+                    in_flight.discard(path)
+                    watch_stats['done'] += 1
+                for _ in batch:
+                    work.task_done()
+                last_batch = time.monotonic()
+                if None in batch:
+                    return
+
+        def request_stop(signum, frame):
+            stop.set()
+
+        previous_handlers = {sig: signal.signal(sig, request_stop) for sig in (signal.SIGINT, signal.SIGTERM)}
+        thread = threading.Thread(target=worker, name='ingest-worker', daemon=True)
+        thread.start()
+
+        print(f"👀 Watching {self.ingest_dir} ({watcher.kind}, debounce {debounce:g}s, queue {work.maxsize})")
+        print("Press Ctrl+C to stop\n")
+
+        pending: Dict[Path, Tuple[Optional[Tuple[int, int]], float]] = {}  # path -> (stat key, since)
+        started = last_report = time.monotonic()
+        done_at_report = 0
+
+        def note(paths: List[Path]):
+            now = time.monotonic()
+            for path in paths:
+                if path in in_flight or not self.is_audio_file(path):
+                    continue
+                key = stat_key(path)
+                if key is None or settled.get(path) == key:
+                    continue
+                if path not in pending or pending[path][0] != key:
+                    pending[path] = (key, now)
+
+        try:
+            note(watcher.scan())
+            while not stop.is_set():
+                note(watcher.poll(min(debounce, 1.0)))
+
+                # Queue files that stopped changing
+                now = time.monotonic()
+                for path, (key, since) in list(pending.items()):
+                    if now - since < debounce:
+                        continue
+                    current = stat_key(path)
+                    if current is None:
+                        del pending[path]
+                    elif current != key:
+                        pending[path] = (current, now)
+                    else:
+                        del pending[path]
+                        in_flight.add(path)
+                        while not stop.is_set():
+                            try:
+                                work.put(path, timeout=1.0)
+                                watch_stats['queued'] += 1
+                                break
+                            except queue.Full:
+                                watch_stats['backpressure_waits'] += 1
+
+                now = time.monotonic()
+                if now - last_report >= stats_interval:
+                    done = watch_stats['done']
+                    rate = (done - done_at_report) / (now - last_report)
+                    print(f"📊 watch: {done} file(s) handled in {now - started:.0f}s, "
+                          f"{rate:.2f} file(s)/s | queue {work.qsize()}/{work.maxsize}, "
+                          f"{len(pending)} settling, {watch_stats['backpressure_waits']} back-pressure wait(s) | "
+                          f"moved {self.ingest_stats['moved']}, skipped {self.ingest_stats['skipped']}, "
+                          f"errors {self.ingest_stats['errors']}")
+                    last_report, done_at_report = now, done
+        finally:
+            print("\nStopping watch, finishing queued files...")
+            # A worker that died would never drain a full queue, so don't block on it
+            while thread.is_alive():
+                try:
+                    work.put(None, timeout=1.0)
+                    break
+                except queue.Full:
+                    continue
+            thread.join()
+            watcher.close()
+            for sig, handler in previous_handlers.items():
+                signal.signal(sig, handler)
+
+        self.print_ingest_summary()
+
     def run(self):
         """Main execution"""
         print(f"Music Library Normalizer")
@@ -1896,10 +4303,18 @@ class MusicLibraryNormalizer:
             print(f"ERROR: Music directory not found: {self.music_dir}")
             sys.exit(1)
 
+        # Finish an interrupted run first; the scan below then sees its result
+        if self.mode == 'normal' and self.checkpoint:
+            with self.phase('resume'):
+                self.resume_checkpoint()
+
         # Collect all items
         print("Scanning directory tree...")
         print("(Skipping: .movpkg, @eaDir, system folders)")
-        items = self.collect_items()
+        with self.phase('collect'):
+            items = self.collect_changed_items() if self.journal else None
+            if items is None:
+                items = self.collect_items()
         total_items = len(items)
 
         # Count file types
@@ -1908,44 +4323,71 @@ class MusicLibraryNormalizer:
 
         print(f"Found {total_items} item(s): {audio_count} audio files, {dir_count} directories")
 
-        if self.mode == 'dryrun':
-            print(f"Dry run limited to {self.dry_run_limit} items\n")
-            items = items[:self.dry_run_limit]
-        else:
-            print()
-
-        # STEP 1: Rename files and folders (including canonical merges)
-        print("Processing items...")
-        for i, (item_path, depth, item_type) in enumerate(items, 1):
-            # Show progress every 50 items
-            if i % 50 == 0:
-                print(f"Progress: {i}/{len(items)} items processed...")
-
-            new_path = self.rename_item(item_path, item_type)
-
-            if new_path and self.mode == 'dryrun':
-                rel_old = item_path.relative_to(self.music_dir)
-                rel_new = new_path.relative_to(self.music_dir)
+        print()
 
-                # Show MCATALOGID info for audio files
-                if item_type == 'file':
-                    mcatalogid = self.get_mcatalogid(item_path)
-                    if mcatalogid:
-                        print(f"  {rel_old} -> {rel_new} [MCATALOGID: {mcatalogid}]")
+        # Read tags up front in parallel (no-op with --jobs 1); renames stay serial
+        with self.phase('tags'):
+            self.prefetch_tags([item_path for item_path, _, item_type in items if item_type == 'file'])
+
+        # STEP 1: Plan every rename and merge (including canonical merges), then apply the plan
+        print("Planning renames...")
+        self.plan = RenamePlan(self.music_dir)
+        shown = 0
+        with self.phase('plan'):
+            for i, (item_path, depth, item_type) in enumerate(items, 1):
+                # Show progress every 50 items
+                if i % 50 == 0:
+                    print(f"Progress: {i}/{len(items)} items processed...")
+                self.tick(i, total_items)
+
+                new_path = self.rename_item(item_path, item_type)
+
+                if new_path and self.mode == 'dryrun':
+                    shown += 1
+                    if self.dry_run_limit is not None and shown > self.dry_run_limit:
+                        continue
+                    rel_old = item_path.relative_to(self.music_dir)
+                    rel_new = new_path.relative_to(self.music_dir)
+
+                    # Show MCATALOGID info for audio files
+                    if item_type == 'file':
+                        mcatalogid = self.get_mcatalogid(item_path)
+                        if mcatalogid:
+                            print(f"  {rel_old} -> {rel_new} [MCATALOGID: {mcatalogid}]")
+                        else:
+                            print(f"  {rel_old} -> {rel_new}")
                     else:
-                        print(f"  {rel_old} -> {rel_new}")
-                else:
-                    print(f"  {rel_old}/ -> {rel_new}/")
+                        print(f"  {rel_old}/ -> {rel_new}/")
+
+        if self.dry_run_limit is not None and shown > self.dry_run_limit:
+            print(f"  ... and {shown - self.dry_run_limit} more (--dry-run-limit)")
+        print(f"Plan: {len(self.plan.operations)} operation(s) for {self.processed_count} item(s)")
+        if self.mode == 'normal':
+            with self.phase('apply'):
+                self.apply_plan()
 
         # STEP 2: Delete empty folders (after all renaming is complete)
-        self.delete_empty_folders()
+        with self.phase('delete-empty'):
+            self.delete_empty_folders(self.changed_dirs)
+
+        # Index the final library once so playlist paths resolve in memory
+        if self.playlist_input:
+            with self.phase('index'):
+                self.build_path_index()
 
         # STEP 3: Update playlists (after renaming and cleanup, using canonical path resolution)
-        self.update_playlists()
+        with self.phase('playlists'):
+            self.update_playlists()
+
+        # Write duplicate report if requested (also indexes the library by audio content)
+        if self.duplicate_report:
+            with self.phase('duplicates'):
+                self.write_duplicate_report(self.duplicate_report)
 
-        # Write duplicate report if requested
-        if self.duplicate_report and self.duplicates:
-            self.write_duplicate_report(self.duplicate_report)
+        # Remember what the library looks like now for the next --incremental run
+        if self.journal and self.mode == 'normal':
+            with self.phase('journal'):
+                self.save_journal()
 
         # Summary
         print(f"\n{'='*60}")
@@ -1959,7 +4401,12 @@ class MusicLibraryNormalizer:
         print(f"  Folder merges: {len(self.folder_merges)}")
         print(f"  Empty folders deleted: {len(self.deleted_folders)}")
         print(f"  File duplicates: {len(self.duplicates)}")
+        if self.content_duplicates is not None:
+            print(f"  Identical audio: {len(self.content_duplicates)} set(s)")
+        if self.recording_duplicates is not None:
+            print(f"  Same recording: {len(self.recording_duplicates)} set(s)")
         print(f"  Errors: {self.error_count}")
+        self.print_tag_stats()
         print(f"{'='*60}")
 
         # Show folder merges if any
@@ -2016,7 +4463,9 @@ ACTIONS
    ├─ Renames folders: "R. D. Burman" → "r-d-burman"
    ├─ Merges duplicate folders (canonical matching)
    ├─ Deletes empty folders
-   └─ Updates playlists automatically
+   ├─ Updates playlists automatically
+   └─ Plans everything first: dry run prints the plan, an interrupted
+      normal run is finished from its checkpoint on the next run
 
 2. INGEST - Add new music to library
    ├─ Reads artist/album tags from files
@@ -2047,6 +4496,9 @@ EXAMPLES
 → OBSERVE: Analyze library for issues (always run this first!)
   %(prog)s --action observe --music ~/Music
 
+→ OBSERVE a very large library as a stream of JSON Lines
+  %(prog)s --action observe --music ~/Music --jsonl - | jq -c 'select(.type == "empty_folders")'
+
 → ORGANIZE: Normalize library (dry run first, then normal)
   %(prog)s --action organize --music ~/Music \\
            --playlist-input ~/.config/mpd/playlists \\
@@ -2057,6 +4509,24 @@ EXAMPLES
            --playlist-output ~/.config/mpd/playlists --mode normal \\
            --duplicate-report duplicates.txt
 
+→ ORGANIZE nightly: only folders changed since the last run
+  %(prog)s --action organize --music ~/Music \\
+           --playlist-input ~/.config/mpd/playlists \\
+           --playlist-output ~/.config/mpd/playlists --mode normal --incremental
+
+→ ORGANIZE preview plus a report of duplicates, including the same track as MP3 and FLAC
+  %(prog)s --action organize --music ~/Music \\
+           --playlist-input ~/.config/mpd/playlists \\
+           --playlist-output /tmp/playlists --mode dryrun \\
+           --duplicate-report duplicates.txt --fingerprint --jobs 8
+
+→ ORGANIZE a large library, watching where the time goes
+  %(prog)s --action organize --music ~/Music \\
+           --playlist-input ~/.config/mpd/playlists \\
+           --playlist-output ~/.config/mpd/playlists --mode normal \\
+           --profile --metrics /tmp/normalizer-metrics.jsonl
+  tail -f /tmp/normalizer-metrics.jsonl | jq -c '{phase, done, total, items_per_sec}'
+
 → INGEST: Auto-organize new downloads
   # Dry run first to preview
   %(prog)s --action ingest --music ~/Music \\
@@ -2066,6 +4536,10 @@ EXAMPLES
   %(prog)s --action ingest --music ~/Music \\
            --ingest-dir ~/Downloads/new-music --mode normal
 
+  # Keep running and ingest downloads as they finish
+  %(prog)s --action ingest --music ~/Music \\
+           --ingest-dir ~/Downloads/new-music --mode watch
+
 → RECONCILE: Find broken playlist entries
   %(prog)s --action reconcile --music ~/Music \\
            --playlist-input ~/.config/mpd/playlists
@@ -2130,24 +4604,35 @@ NAMING RULES
 
     parser.add_argument('--mode',
                        required=False,
-                       choices=['dryrun', 'normal', 'test'],
+                       choices=['dryrun', 'normal', 'test', 'watch'],
                        metavar='MODE',
                        help='Execution mode (not required for observe/reconcile)\n'
                             'dryrun - Preview changes without making them\n'
                             'normal - Apply changes to files\n'
-                            'test   - Test MCATALOGID extraction')
+                            'test   - Test MCATALOGID extraction\n'
+                            'watch  - Keep running, ingest files as they arrive (ingest only)')
 
     parser.add_argument('--dry-run-limit',
                        type=int,
-                       default=1000,
+                       default=None,
                        metavar='N',
-                       help='Number of items to process in dry run mode (default: 1000)')
+                       help='Print at most N planned renames in dry run mode (default: all)\n'
+                            'The whole library is always planned')
 
     parser.add_argument('--duplicate-report',
                        type=str,
                        default=None,
                        metavar='FILE',
-                       help='Write duplicate files report to this path (organize only)')
+                       help='Write duplicate files report to this path (organize only):\n'
+                            'name collisions, plus files with identical audio anywhere\n'
+                            'in the library (hashes kept in the tag cache)')
+
+    parser.add_argument('--fingerprint',
+                       action='store_true',
+                       help='With --duplicate-report: also find the same recording in\n'
+                            'other formats/encodings by acoustic fingerprint. Needs ffmpeg\n'
+                            'and NumPy; decodes every track once (--jobs in parallel),\n'
+                            'kept in the tag cache so an interrupted run resumes')
 
     parser.add_argument('--test-files',
                        type=int,
@@ -2155,12 +4640,112 @@ NAMING RULES
                        metavar='N',
                        help='Number of files to test MCATALOGID extraction (default: 10)')
 
+    parser.add_argument('--jsonl',
+                       metavar='FILE',
+                       help='Observe: stream findings as JSON Lines to FILE (\'-\' for stdout)\n'
+                            'instead of the report; memory stays flat on huge libraries')
+
+    parser.add_argument('--tag-cache',
+                       type=str,
+                       default=str(DEFAULT_TAG_CACHE),
+                       metavar='FILE',
+                       help='SQLite cache of parsed tags, reused across runs\n'
+                            f'(default: {DEFAULT_TAG_CACHE})')
+
+    parser.add_argument('--no-tag-cache',
+                       action='store_true',
+                       help='Parse every file instead of using the tag cache')
+
+    parser.add_argument('--watch-debounce',
+                       type=float,
+                       default=2.0,
+                       metavar='SECONDS',
+                       help='Watch mode: ingest a file once it has not changed for this long\n'
+                            '(also the polling interval without inotify, default: 2)')
+
+    parser.add_argument('--watch-queue',
+                       type=int,
+                       default=64,
+                       metavar='N',
+                       help='Watch mode: files waiting to be ingested before the watcher\n'
+                            'stops taking new ones (default: 64)')
+
+    parser.add_argument('--watch-stats',
+                       type=float,
+                       default=60.0,
+                       metavar='SECONDS',
+                       help='Watch mode: report throughput and queue depth this often (default: 60)')
+
+    parser.add_argument('--incremental',
+                       action='store_true',
+                       help='Organize only folders that changed since the last normal run,\n'
+                            'using a journal of folder inode/mtime (full scan if the\n'
+                            'journal is missing or belongs to another library)')
+
+    parser.add_argument('--journal',
+                       type=str,
+                       default=None,
+                       metavar='FILE',
+                       help='Journal file for --incremental\n'
+                            f'(default: one per library under {DEFAULT_CACHE_DIR / "journals"})')
+
+    parser.add_argument('--checkpoint',
+                       type=str,
+                       default=None,
+                       metavar='FILE',
+                       help='Organize: where normal mode records the rename plan and its\n'
+                            'progress; an interrupted run is finished from it next time\n'
+                            f'(default: one per library under {DEFAULT_CACHE_DIR / "plans"})')
+
+    parser.add_argument('--jobs',
+                       type=int,
+                       default=1,
+                       metavar='N',
+                       help='Read tags with N parallel workers (default: 1)\n'
+                            'Renames and merges always run in a single process')
+
+    parser.add_argument('--pool',
+                       default='process',
+                       choices=['process', 'thread'],
+                       help='Worker type for --jobs: process for CPU-bound parsing,\n'
+                            'thread for I/O-bound network mounts (default: process)')
+
+    parser.add_argument('--metrics',
+                       metavar='FILE',
+                       help='Write progress and counters as JSON Lines to FILE while running\n'
+                            '(items/sec, renames, merges, errors, tag parse latency histogram;\n'
+                            'use /dev/fd/N to write to an inherited descriptor)')
+
+    parser.add_argument('--metrics-interval',
+                       type=float,
+                       default=METRICS_INTERVAL,
+                       metavar='SECONDS',
+                       help=f'Seconds between --metrics progress lines (default: {METRICS_INTERVAL:g})')
+
+    parser.add_argument('--profile',
+                       action='store_true',
+                       help='Time each phase of the run (scan, tags, renames, empty folders,\n'
+                            'playlists, ...) and print where the time went at the end')
+
     args = parser.parse_args()
+    tag_cache = None if args.no_tag_cache else args.tag_cache
 
     # Validate mode is provided for actions that need it (observe and reconcile are read-only)
     if args.action not in ['observe', 'reconcile'] and not args.mode:
         parser.error(f"--mode is required for '{args.action}' action")
 
+    if args.mode == 'watch' and args.action != 'ingest':
+        parser.error("--mode watch is only supported for the ingest action")
+
+    if args.fingerprint and not args.duplicate_report:
+        parser.error("--fingerprint needs --duplicate-report")
+
+    if args.jsonl and args.action != 'observe':
+        parser.error("--jsonl is only supported for --action observe")
+
+    if (args.incremental or args.journal) and args.action != 'organize':
+        parser.error("--incremental and --journal are only supported for --action organize")
+
     # Test mode only needs music directory
     if args.mode == 'test':
         normalizer = MusicLibraryNormalizer(
@@ -2183,13 +4768,27 @@ NAMING RULES
             music_dir=args.music,
             playlist_input=None,
             playlist_output=None,
-            mode=args.mode,
+            mode='normal' if args.mode == 'watch' else args.mode,  # Watch always moves files
             dry_run_limit=args.dry_run_limit,
             duplicate_report=None,
             action=args.action,
-            ingest_dir=args.ingest_dir
+            ingest_dir=args.ingest_dir,
+            tag_cache=tag_cache,
+            jobs=args.jobs,
+            pool=args.pool,
+            metrics=args.metrics,
+            metrics_interval=args.metrics_interval
         )
-        normalizer.run_ingest()
+        try:
+            if args.mode == 'watch':
+                normalizer.run_watch(debounce=args.watch_debounce, queue_size=args.watch_queue,
+                                     stats_interval=args.watch_stats)
+            else:
+                normalizer.run_ingest()
+            if args.profile:
+                normalizer.print_profile()
+        finally:
+            normalizer.close()
 
     elif args.action == 'observe':
         # Observe mode only needs music directory
@@ -2200,9 +4799,25 @@ NAMING RULES
             mode='dryrun',  # Observe is always read-only
             dry_run_limit=args.dry_run_limit,
             duplicate_report=None,
-            action=args.action
+            action=args.action,
+            tag_cache=tag_cache,
+            jobs=args.jobs,
+            pool=args.pool,
+            metrics=args.metrics,
+            metrics_interval=args.metrics_interval
         )
-        normalizer.run_observe()
+        try:
+            if args.jsonl:
+                normalizer.run_observe_stream(args.jsonl)
+            else:
+                normalizer.run_observe()
+            if args.profile and args.jsonl == '-':
+                with contextlib.redirect_stdout(sys.stderr):  # Keep the JSON Lines on stdout parseable
+                    normalizer.print_profile()
+            elif args.profile:
+                normalizer.print_profile()
+        finally:
+            normalizer.close()
 
     elif args.action == 'reconcile':
         # Reconcile mode requires playlist directory
@@ -2216,15 +4831,30 @@ NAMING RULES
             mode='dryrun',  # Reconcile is always read-only
             dry_run_limit=args.dry_run_limit,
             duplicate_report=None,
-            action=args.action
+            action=args.action,
+            tag_cache=tag_cache,
+            jobs=args.jobs,
+            pool=args.pool,
+            metrics=args.metrics,
+            metrics_interval=args.metrics_interval
         )
-        normalizer.run_reconcile()
+        try:
+            normalizer.run_reconcile()
+            if args.profile:
+                normalizer.print_profile()
+        finally:
+            normalizer.close()
 
     elif args.action == 'organize':
         # Organize mode requires playlist directories
         if not args.playlist_input or not args.playlist_output:
             parser.error("--playlist-input and --playlist-output are required for organize action")
 
+        journal = None
+        if args.incremental:
+            journal = args.journal or str(LibraryJournal.default_path(Path(args.music).resolve()))
+        checkpoint = args.checkpoint or str(RenamePlan.default_checkpoint(Path(args.music).resolve()))
+
         normalizer = MusicLibraryNormalizer(
             music_dir=args.music,
             playlist_input=args.playlist_input,
@@ -2232,9 +4862,22 @@ NAMING RULES
             mode=args.mode,
             dry_run_limit=args.dry_run_limit,
             duplicate_report=args.duplicate_report,
-            action=args.action
+            action=args.action,
+            tag_cache=tag_cache,
+            jobs=args.jobs,
+            pool=args.pool,
+            journal=journal,
+            checkpoint=checkpoint,
+            fingerprint=args.fingerprint,
+            metrics=args.metrics,
+            metrics_interval=args.metrics_interval
         )
-        normalizer.run()
+        try:
+            normalizer.run()
+            if args.profile:
+                normalizer.print_profile()
+        finally:
+            normalizer.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,526 @@
+#!/usr/bin/env bats
+#
+# music-library-normalizer.py against a synthetic, really-tagged library.
+#
+# The fixture is generated with mutagen rather than checked in: a few MP3 and
+# FLAC files with MCATALOGID/artist/album tags, folder names that collide
+# canonically ("R. D. Burman" vs "R.D. Burman"), an empty folder and a playlist.
+# Cases skip when mutagen is not installed, since the script refuses to start
+# without it.
+
+load 'test_helper/bats-support/load'
+load 'test_helper/bats-assert/load'
+
+SCRIPT_PATH="${BATS_TEST_DIRNAME}/../scripts/music-library-normalizer.py"
+
+make_library() {
+  python3 - "$1" <<'PY'
+import struct
+import sys
+from pathlib import Path
+
+from mutagen.flac import FLAC
+from mutagen.id3 import ID3, TALB, TIT2, TPE1, TXXX
+
+
+def write_mp3(path, artist, album, title, mid):
+    # 20 silent MPEG-1 Layer III frames (128 kbps, 44.1 kHz) so mutagen can sync
+    path.write_bytes((b'\xff\xfb\x90\x64' + b'\x00' * 413) * 20)
+    tags = ID3()
+    tags.add(TPE1(encoding=3, text=artist))
+    tags.add(TALB(encoding=3, text=album))
+    tags.add(TIT2(encoding=3, text=title))
+    if mid:
+        tags.add(TXXX(encoding=3, desc='MCATALOGID', text=mid))
+    tags.save(path)
+
+
+def write_flac(path, artist, album, title, mid):
+    # Bare STREAMINFO block: 44.1 kHz, stereo, 16 bit, one second of samples
+    streaminfo = struct.pack('>HH', 4096, 4096) + b'\x00' * 6
+    streaminfo += ((44100 << 44) | (1 << 41) | (15 << 36) | 44100).to_bytes(8, 'big')
+    path.write_bytes(b'fLaC' + bytes([0x80, 0, 0, 34]) + streaminfo + b'\x00' * 16)
+    audio = FLAC(path)
+    audio['ARTIST'], audio['ALBUM'], audio['TITLE'] = artist, album, title
+    if mid:
+        audio['MCATALOGID'] = mid
+    audio.save()
+
+
+root = Path(sys.argv[1])
+music = root / 'music'
+count = 0
+for artist in ['R. D. Burman', 'R.D. Burman', 'Café Tacvba', 'The Band']:
+    for album in ['Best Of', 'Live (1999)']:
+        folder = music / artist / album
+        folder.mkdir(parents=True)
+        for track in range(4):
+            count += 1
+            mid = f'id{count}' if count % 5 else None
+            if track % 2:
+                write_flac(folder / f'0{track} Song {track}.flac', artist, album, f'Song {track}', mid)
+            else:
+                write_mp3(folder / f'0{track} Song {track}.mp3', artist, album, f'Song {track}', mid)
+
+(music / 'Empty Artist' / 'nothing').mkdir(parents=True)
+(music / 'The Band' / 'cover.jpg').write_bytes(b'jpg')
+
+playlists = root / 'playlists'
+playlists.mkdir()
+(playlists / 'mix.m3u').write_text(
+    '#EXTM3U\n'
+    'R. D. Burman/Best Of/00 Song 0.mp3\n'
+    'The Band/Live (1999)/01 Song 1.flac\n'
+    'missing/track.mp3\n')
+PY
+}
+
+# Everything except the lines that legitimately differ between runs: timings
+# and the banner announcing the worker pool.
+stable_output() {
+  grep -v -e 'Tag parsing' -e 'Reading tags of'
+}
+
+# Organize root with a checkpoint, stopping as if killed after the first $2
+# planned operations were applied
+interrupt_organize() {
+  python3 - "$SCRIPT_PATH" "$1" "$2" <<'PY'
+import importlib.util
+import sys
+
+spec = importlib.util.spec_from_file_location('normalizer', sys.argv[1])
+mln = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(mln)
+
+applied = 0
+apply_operation = mln.MusicLibraryNormalizer.apply_operation
+
+
+def interrupted(self, *args):
+    global applied
+    if applied == int(sys.argv[3]):
+        raise KeyboardInterrupt
+    applied += 1
+    apply_operation(self, *args)
+
+
+mln.MusicLibraryNormalizer.apply_operation = interrupted
+root = sys.argv[2]
+normalizer = mln.MusicLibraryNormalizer(f'{root}/music', f'{root}/playlists', f'{root}/out', 'normal',
+                                        checkpoint=f'{root}/plan.jsonl')
+try:
+    normalizer.run()
+except KeyboardInterrupt:
+    sys.exit(0)
+sys.exit(1)
+PY
+}
+
+# Run ingest --mode watch on $TMPDIR/inbox (extra options in "$@"), drop one
+# known track into it, wait until it is moved and stop the watcher with SIGTERM.
+# Output goes to $TMPDIR/watch.log.
+watch_one_file() {
+  mkdir -p "$TMPDIR/inbox"
+  python3 "$SCRIPT_PATH" --action ingest --music "$TMPDIR/serial/music" \
+    --ingest-dir "$TMPDIR/inbox" --mode watch --watch-debounce 0.2 --watch-stats 1 \
+    "$@" > "$TMPDIR/watch.log" 2>&1 &
+  local watch_pid=$!
+
+  sleep 1
+  cp "$TMPDIR/parallel/music/The Band/Best Of/00 Song 0.mp3" "$TMPDIR/inbox/new.mp3.part"
+  mv "$TMPDIR/inbox/new.mp3.part" "$TMPDIR/inbox/new.mp3"
+
+  for _ in $(seq 50); do
+    [ -e "$TMPDIR/inbox/new.mp3" ] || break
+    sleep 0.2
+  done
+  # Outlast one --watch-stats interval so the stats line is always printed
+  sleep 1.2
+  kill -TERM "$watch_pid"
+  wait "$watch_pid"
+}
+
+# Run the script with the arguments after $1, as if the folder $1 could not be
+# listed (os.scandir raises PermissionError for it). chmod is no use when the
+# suite runs as root.
+run_with_unreadable_folder() {
+  python3 - "$SCRIPT_PATH" "$@" <<'PY'
+import os
+import runpy
+import sys
+
+script, locked = sys.argv[1], os.path.realpath(sys.argv[2])
+scandir = os.scandir
+
+
+def guarded(path='.'):
+    if isinstance(path, (str, os.PathLike)) and os.path.realpath(path) == locked:
+        raise PermissionError(13, 'Permission denied', str(path))
+    return scandir(path)
+
+
+os.scandir = guarded
+sys.argv = [script] + sys.argv[3:]
+runpy.run_path(script, run_name='__main__')
+PY
+}
+
+setup() {
+  python3 -c 'import mutagen' 2>/dev/null || skip "mutagen not installed"
+  TMPDIR=$(mktemp -d)
+  make_library "$TMPDIR/serial"
+  cp -a "$TMPDIR/serial" "$TMPDIR/parallel"
+}
+
+teardown() {
+  rm -rf "$TMPDIR"
+}
+
+@test "observe with --jobs reports exactly what a serial run reports" {
+  run python3 "$SCRIPT_PATH" --action observe --music "$TMPDIR/serial/music" --no-tag-cache
+  assert_success
+  serial=$(printf '%s\n' "$output" | sed "s#$TMPDIR/serial#LIB#g" | stable_output)
+
+  run python3 "$SCRIPT_PATH" --action observe --music "$TMPDIR/parallel/music" --no-tag-cache --jobs 4
+  assert_success
+  assert_output --partial "with 4 process worker(s)"
+  parallel=$(printf '%s\n' "$output" | sed "s#$TMPDIR/parallel#LIB#g" | stable_output)
+
+  assert_equal "$parallel" "$serial"
+}
+
+@test "organize with --jobs produces the same tree and playlists as a serial run" {
+  for variant in serial parallel; do
+    jobs=1
+    [ "$variant" = parallel ] && jobs=4
+    run python3 "$SCRIPT_PATH" --music "$TMPDIR/$variant/music" \
+      --playlist-input "$TMPDIR/$variant/playlists" --playlist-output "$TMPDIR/$variant/out" \
+      --mode normal --no-tag-cache --jobs "$jobs"
+    assert_success
+  done
+
+  serial_tree=$(cd "$TMPDIR/serial" && find music out | sort)
+  parallel_tree=$(cd "$TMPDIR/parallel" && find music out | sort)
+  assert_equal "$parallel_tree" "$serial_tree"
+  assert_equal "$(cat "$TMPDIR/parallel/out/mix.m3u")" "$(cat "$TMPDIR/serial/out/mix.m3u")"
+
+  # Sanity: the run actually renamed, merged and tagged something
+  run cat "$TMPDIR/parallel/out/mix.m3u"
+  assert_output --partial "r-d-burman/best-of/00-song-0-[mid-id1].mp3"
+}
+
+@test "a thread pool gives the same organize plan as a serial dry run" {
+  args=(--playlist-input "$TMPDIR/serial/playlists" --playlist-output "$TMPDIR/serial/out"
+        --mode dryrun --no-tag-cache)
+
+  run python3 "$SCRIPT_PATH" --music "$TMPDIR/serial/music" "${args[@]}"
+  assert_success
+  serial=$(printf '%s\n' "$output" | stable_output)
+
+  run python3 "$SCRIPT_PATH" --music "$TMPDIR/serial/music" "${args[@]}" --jobs 3 --pool thread
+  assert_success
+  parallel=$(printf '%s\n' "$output" | stable_output)
+
+  assert_equal "$parallel" "$serial"
+}
+
+@test "incremental organize after adding music matches a full run" {
+  organize() {
+    python3 "$SCRIPT_PATH" --music "$TMPDIR/$1/music" \
+      --playlist-input "$TMPDIR/$1/playlists" --playlist-output "$TMPDIR/$1/out" \
+      --mode normal --no-tag-cache "${@:2}"
+  }
+
+  run organize serial --incremental --journal "$TMPDIR/journal.json"
+  assert_success
+  assert_output --partial "Incremental: full scan (no journal yet)"
+  rm -rf "$TMPDIR/parallel"
+  cp -a "$TMPDIR/serial" "$TMPDIR/parallel"
+
+  # New album under a normalized artist, plus an artist spelled another way
+  make_library "$TMPDIR/new"
+  for variant in serial parallel; do
+    cp -a "$TMPDIR/new/music/The Band/Best Of" "$TMPDIR/$variant/music/the-band/New Album"
+    cp -a "$TMPDIR/new/music/R.D. Burman" "$TMPDIR/$variant/music/r.d. burman"
+  done
+
+  run organize serial --incremental --journal "$TMPDIR/journal.json"
+  assert_success
+  assert_output --regexp "Incremental: [0-9]+ of [0-9]+ folder\(s\) changed"
+  run organize parallel
+  assert_success
+
+  assert_equal "$(cd "$TMPDIR/serial" && find music | sort)" "$(cd "$TMPDIR/parallel" && find music | sort)"
+  assert_equal "$(cat "$TMPDIR/serial/out/mix.m3u")" "$(cat "$TMPDIR/parallel/out/mix.m3u")"
+
+  run organize serial --incremental --journal "$TMPDIR/journal.json"
+  assert_success
+  assert_output --partial "Incremental: 0 of"
+
+  run python3 "$SCRIPT_PATH" --action observe --music "$TMPDIR/serial/music" --incremental
+  assert_failure
+  assert_output --partial "--incremental and --journal are only supported for --action organize"
+}
+
+@test "watch mode ingests files dropped into the ingest directory" {
+  watch_one_file --no-tag-cache
+
+  run cat "$TMPDIR/watch.log"
+  assert_output --partial "MOVED: new.mp3 → The Band/Best Of/new.mp3"
+  assert_output --partial "📊 watch:"
+  assert_output --partial "Files moved to library: 1"
+  [ ! -e "$TMPDIR/inbox/new.mp3" ]
+}
+
+@test "watch mode reads tags through the tag cache on its worker thread" {
+  watch_one_file --tag-cache "$TMPDIR/tags.db"
+
+  run cat "$TMPDIR/watch.log"
+  refute_output --partial "ProgrammingError"
+  assert_output --partial "MOVED: new.mp3 → The Band/Best Of/new.mp3"
+  assert_output --partial "Files moved to library: 1"
+  [ ! -e "$TMPDIR/inbox/new.mp3" ]
+}
+
+@test "observe reports a folder it cannot list instead of crashing" {
+  mkdir -p "$TMPDIR/serial/music/Locked/Album"
+
+  run run_with_unreadable_folder "$TMPDIR/serial/music/Locked" \
+    --action observe --music "$TMPDIR/serial/music" --no-tag-cache
+  assert_success
+  assert_output --partial "WARNING: Cannot list $TMPDIR/serial/music/Locked"
+  assert_output --partial "Audio files: 32"
+}
+
+@test "observe --jsonl streams the same findings the report counts" {
+  run python3 "$SCRIPT_PATH" --action observe --music "$TMPDIR/serial/music" --no-tag-cache
+  assert_success
+  report="$output"
+
+  python3 "$SCRIPT_PATH" --action observe --music "$TMPDIR/parallel/music" --no-tag-cache \
+    --jsonl "$TMPDIR/findings.jsonl"
+  summary=$(tail -n 1 "$TMPDIR/findings.jsonl")
+  run python3 -c 'import json, sys; print(json.loads(sys.argv[1])["type"])' "$summary"
+  assert_output "summary"
+
+  # Every finding line is valid JSON and the per-type counts add up
+  python3 - "$TMPDIR/findings.jsonl" "$report" <<'PY'
+import json
+import re
+import sys
+from collections import Counter
+
+lines = [json.loads(line) for line in open(sys.argv[1], encoding='utf-8')]
+summary = lines.pop()
+counted = Counter(line['type'] for line in lines)
+assert dict(counted) == {k: v for k, v in summary['findings'].items() if v}, (counted, summary)
+assert f"Total files: {summary['files']}" in sys.argv[2]
+assert f"Audio files: {summary['audio_files']}" in sys.argv[2]
+empty = re.search(r'Empty folders \(will be DELETED\) \((\d+)\)', sys.argv[2])
+assert int(empty.group(1)) == summary['findings']['empty_folders'], summary
+PY
+
+  run python3 "$SCRIPT_PATH" --action organize --music "$TMPDIR/serial/music" --mode dryrun \
+    --playlist-input "$TMPDIR/serial/playlists" --playlist-output "$TMPDIR/serial/out" \
+    --no-tag-cache --jsonl "$TMPDIR/ignored.jsonl"
+  assert_failure
+  assert_output --partial "--jsonl is only supported for --action observe"
+}
+
+@test "observe --jsonl reports unreadable folders and unwritable output" {
+  mkdir -p "$TMPDIR/serial/music/Locked/Album" "$TMPDIR/serial/music/Empty Too"
+
+  run_with_unreadable_folder "$TMPDIR/serial/music/Locked" --action observe \
+    --music "$TMPDIR/serial/music" --no-tag-cache --jsonl "$TMPDIR/findings.jsonl"
+  run grep -c '"type": "unreadable_folders", "path": "Locked"' "$TMPDIR/findings.jsonl"
+  assert_output "1"
+  run grep -c '"type": "empty_folders", "path": "Locked"' "$TMPDIR/findings.jsonl"
+  assert_output "0"
+  run grep -c '"type": "empty_folders", "path": "Empty Too"' "$TMPDIR/findings.jsonl"
+  assert_output "1"
+
+  run python3 "$SCRIPT_PATH" --action observe --music "$TMPDIR/serial/music" --no-tag-cache \
+    --jsonl "$TMPDIR/missing/dir/findings.jsonl"
+  assert_failure
+  assert_output --partial "ERROR: cannot write $TMPDIR/missing/dir/findings.jsonl"
+  refute_output --partial "Traceback"
+}
+
+@test "an interrupted organize run is finished from its checkpoint" {
+  interrupt_organize "$TMPDIR/serial" 10
+  [ -e "$TMPDIR/serial/plan.jsonl" ]
+
+  for variant in serial parallel; do
+    run python3 "$SCRIPT_PATH" --music "$TMPDIR/$variant/music" \
+      --playlist-input "$TMPDIR/$variant/playlists" --playlist-output "$TMPDIR/$variant/out" \
+      --mode normal --no-tag-cache --checkpoint "$TMPDIR/$variant/plan.jsonl"
+    assert_success
+    [ "$variant" = serial ] && assert_output --partial "Resuming interrupted run:"
+    refute_output --partial "ERROR"
+  done
+
+  [ ! -e "$TMPDIR/serial/plan.jsonl" ]
+  assert_equal "$(cd "$TMPDIR/serial" && find music | sort)" "$(cd "$TMPDIR/parallel" && find music | sort)"
+  assert_equal "$(cat "$TMPDIR/serial/out/mix.m3u")" "$(cat "$TMPDIR/parallel/out/mix.m3u")"
+}
+
+@test "a run interrupted right after a folder rename resumes without errors" {
+  # The first 34 operations rename every track, then the first two album folders
+  interrupt_organize "$TMPDIR/serial" 34
+  [ -e "$TMPDIR/serial/plan.jsonl" ]
+
+  run python3 "$SCRIPT_PATH" --music "$TMPDIR/serial/music" \
+    --playlist-input "$TMPDIR/serial/playlists" --playlist-output "$TMPDIR/serial/out" \
+    --mode normal --no-tag-cache --checkpoint "$TMPDIR/serial/plan.jsonl"
+  assert_success
+  assert_output --partial "Resuming interrupted run:"
+  refute_output --partial "ERROR"
+
+  run python3 "$SCRIPT_PATH" --music "$TMPDIR/parallel/music" \
+    --playlist-input "$TMPDIR/parallel/playlists" --playlist-output "$TMPDIR/parallel/out" \
+    --mode normal --no-tag-cache
+  assert_success
+  assert_equal "$(cd "$TMPDIR/serial" && find music | sort)" "$(cd "$TMPDIR/parallel" && find music | sort)"
+}
+
+@test "duplicate report lists identical audio across albums, ignoring tags" {
+  # Every fixture MP3 carries the same silent frames; FLACs have no audio at all
+  run python3 "$SCRIPT_PATH" --music "$TMPDIR/serial/music" \
+    --playlist-input "$TMPDIR/serial/playlists" --playlist-output "$TMPDIR/serial/out" \
+    --mode dryrun --tag-cache "$TMPDIR/tags.sqlite" --duplicate-report "$TMPDIR/dups.txt"
+  assert_success
+  assert_output --partial "Identical audio: 1 set(s)"
+
+  run grep -c "Same audio:" "$TMPDIR/dups.txt"
+  assert_output "15"
+  run grep -c "Same audio: .*Live (1999)/.*\.mp3" "$TMPDIR/dups.txt"
+  assert_output "8"
+
+  # Hashes come from the tag cache the second time
+  run python3 "$SCRIPT_PATH" --music "$TMPDIR/serial/music" \
+    --playlist-input "$TMPDIR/serial/playlists" --playlist-output "$TMPDIR/serial/out" \
+    --mode dryrun --tag-cache "$TMPDIR/tags.sqlite" --duplicate-report "$TMPDIR/dups.txt"
+  assert_success
+  assert_output --partial "hashed 0 partial, 0 full (32 file(s) from cache)"
+}
+
+@test "fingerprints group the same recording across formats" {
+  command -v ffmpeg >/dev/null || skip "ffmpeg not installed"
+  python3 -c 'import numpy' 2>/dev/null || skip "numpy not installed"
+
+  mkdir -p "$TMPDIR/fp/music/Artist A/Album" "$TMPDIR/fp/music/Artist B/Other" \
+    "$TMPDIR/fp/playlists" "$TMPDIR/fp/out"
+  # Same sweep encoded lossy and lossless, the lossless one ~600 samples late at the
+  # fingerprint rate (not a whole chunk), plus an unrelated sweep of the same length
+  tone='aevalsrc=0.4*sin(2*PI*(300+200*sin(2*PI*0.5*t))*t)*(0.5+0.5*sin(2*PI*2*t))+0.2*sin(2*PI*800*t)*lt(t\,10):s=44100:d=20'
+  other='aevalsrc=0.4*sin(2*PI*(500+300*sin(2*PI*0.3*t))*t)*(0.5+0.5*sin(2*PI*3*t)):s=44100:d=20'
+  ffmpeg -loglevel error -f lavfi -i "$tone" "$TMPDIR/fp/music/Artist A/Album/01 Song.mp3"
+  ffmpeg -loglevel error -f lavfi -i "$tone" -af adelay=110 "$TMPDIR/fp/music/Artist B/Other/05 Song (Remaster).flac"
+  ffmpeg -loglevel error -f lavfi -i "$other" "$TMPDIR/fp/music/Artist B/Other/02 Different.mp3"
+
+  run python3 "$SCRIPT_PATH" --music "$TMPDIR/fp/music" \
+    --playlist-input "$TMPDIR/fp/playlists" --playlist-output "$TMPDIR/fp/out" \
+    --mode dryrun --tag-cache "$TMPDIR/fp.sqlite" --duplicate-report "$TMPDIR/dups.txt" --fingerprint
+  assert_success
+  assert_output --partial "Same recording: 1 set(s)"
+
+  run grep -c "Same recording: " "$TMPDIR/dups.txt"
+  assert_output "1"
+  run grep "Same recording: " "$TMPDIR/dups.txt"
+  assert_output --partial "Song (Remaster).flac"
+  refute_output --partial "Different"
+}
+
+@test "reconcile suggests where renamed playlist entries went" {
+  mv "$TMPDIR/serial/music/The Band" "$TMPDIR/serial/music/THE_BAND"
+
+  run python3 "$SCRIPT_PATH" --action reconcile --music "$TMPDIR/serial/music" \
+    --playlist-input "$TMPDIR/serial/playlists"
+  assert_success
+  assert_output --partial "Broken entries: 2 (66.7%)"
+  assert_output --partial "Broken entries with a suggested fix: 1"
+  assert_output --regexp "The Band/Live \(1999\)/01 Song 1.flac
+      → THE_BAND/Live \(1999\)/01 Song 1.flac"
+
+  run bash -c "python3 '$SCRIPT_PATH' --action reconcile --music '$TMPDIR/serial/music' \
+    --playlist-input '$TMPDIR/serial/playlists' | grep -A1 'missing/track.mp3'"
+  refute_output --partial "→"
+}
+
+@test "reconcile follows '..' in playlist entries to files outside the library" {
+  mkdir "$TMPDIR/serial/other"
+  cp "$TMPDIR/serial/music/The Band/Best Of/00 Song 0.mp3" "$TMPDIR/serial/other/kept.mp3"
+  printf '%s\n' '#EXTM3U' '../other/kept.mp3' 'The Band/../../other/kept.mp3' \
+    "$TMPDIR/serial/music/../other/kept.mp3" '../other/gone.mp3' > "$TMPDIR/serial/playlists/mix.m3u"
+
+  run python3 "$SCRIPT_PATH" --action reconcile --music "$TMPDIR/serial/music" \
+    --playlist-input "$TMPDIR/serial/playlists" --no-tag-cache
+  assert_success
+  assert_output --partial "Broken entries: 1 (25.0%)"
+  assert_output --partial "../other/gone.mp3"
+}
+
+@test "organize --metrics writes JSON Lines progress and --profile times each phase" {
+  run python3 "$SCRIPT_PATH" --music "$TMPDIR/serial/music" \
+    --playlist-input "$TMPDIR/serial/playlists" --playlist-output "$TMPDIR/serial/out" \
+    --mode dryrun --no-tag-cache --metrics "$TMPDIR/metrics.jsonl" --metrics-interval 0 --profile
+  assert_success
+  assert_output --regexp "Profile \([0-9.]+ s wall\):"
+  assert_output --regexp "  plan +[0-9.]+ s"
+  assert_output --regexp "Tags were parsed as files were reached \(--jobs 1\): [0-9.]+ s of the phases above"
+  assert_output --partial "Tag parse latency (ms):"
+
+  run python3 - "$TMPDIR/metrics.jsonl" <<'PY'
+import json
+import sys
+
+lines = [json.loads(line) for line in open(sys.argv[1], encoding='utf-8')]
+print(lines[0]['type'], lines[-1]['type'])
+print(' '.join(line['phase'] for line in lines if line['type'] == 'phase'))
+print(sum(1 for line in lines if line['type'] == 'progress' and line['phase'] == 'plan'))  # 32 files, 12 folders
+summary = lines[-1]
+print(summary['tags_parsed'], sum(summary['tag_parse_ms']), summary['renames'], summary['errors'])
+PY
+  assert_success
+  assert_line --index 0 "start summary"
+  assert_line --index 1 "collect tags plan delete-empty index playlists"
+  assert_line --index 2 "44"
+  assert_line --index 3 --regexp "^32 32 [1-9][0-9]* 0$"
+}
+
+@test "header-only tag reads give the same records as mutagen" {
+  bench="$BATS_TEST_DIRNAME/../scripts/benchmarks/bench_tag_reader.py"
+  run python3 "$bench" --corpus "$TMPDIR/serial/music"
+  assert_success
+  assert_output --partial "Header reader: 32 (100%)"
+  assert_output --partial "Mismatches: 0"
+
+  # ID3v2.3/2.4 in every encoding, Vorbis and iTunes key variants, artwork, truncated files
+  run python3 "$bench" --files 60 --artwork-kb 64
+  assert_success
+  assert_output --partial "Mismatches: 0"
+}
+
+@test "a Mutagen without the header parsers falls back to reading every file with Mutagen" {
+  args=(--music "$TMPDIR/serial/music" --playlist-input "$TMPDIR/serial/playlists"
+        --playlist-output "$TMPDIR/serial/out" --mode dryrun --no-tag-cache)
+
+  run python3 "$SCRIPT_PATH" "${args[@]}"
+  assert_success
+  expected=$(printf '%s\n' "$output" | stable_output)
+
+  run python3 - "$SCRIPT_PATH" "${args[@]}" <<'PY'
+import runpy
+import sys
+
+import mutagen.mp4
+
+del mutagen.mp4.Atoms
+script = sys.argv[1]
+sys.argv = sys.argv[1:]
+runpy.run_path(script, run_name='__main__')
+PY
+  assert_success
+  assert_output --partial "Tag parsing (MP3)"
+  assert_equal "$(printf '%s\n' "$output" | stable_output)" "$expected"
+}
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Benchmark: syntax highlighting a large JSON document
+Generates an indented JSON response of about --size-mb MB and times:
+  - full-document highlighting with the previous JsonHighlighter (every rule
+    recompiled and re-run over every block) and with the precompiled
+    single-pass tokenizer
+  - set_plain_text() into a QPlainTextEdit, which past MAX_HIGHLIGHT_CHARS
+    only highlights the blocks in view, plus a scroll to the middle, against
+    a plain setPlainText() with no highlighter (Qt's own layout cost)
+Also checks that both highlighters color JSON values the same, and that keys
+now get the key color. Runs without a display (QT_QPA_PLATFORM=offscreen).
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtGui import QColor, QFont, QSyntaxHighlighter, QTextCharFormat, QTextDocument
+from PyQt6.QtWidgets import QApplication, QPlainTextEdit
+
+TOOL_PATH = Path(__file__).resolve().parent.parent / 'tool.py'
+
+
+def load_tool():
+    """Import tool.py by path (it is a script, not a package)"""
+    spec = importlib.util.spec_from_file_location('api_testing_tool', TOOL_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class LegacyJsonHighlighter(QSyntaxHighlighter):
+    """JsonHighlighter as it was: one re.compile() per rule per block"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.highlighting_rules = []
+        for pattern, color, bold in [(r'"[^"]*":', (0, 128, 0), False), (r'"[^"]*"', (200, 100, 0), False),
+                                     (r'\b\d+\.?\d*\b', (0, 0, 255), False),
+                                     (r'\b(true|false|null)\b', (128, 0, 128), True)]:
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(*color))
+            if bold:
+                fmt.setFontWeight(QFont.Weight.Bold)
+            self.highlighting_rules.append((pattern, fmt))
+
+    def highlightBlock(self, text):
+        for pattern, format in self.highlighting_rules:
+            expression = re.compile(pattern)
+            for match in expression.finditer(text):
+                self.setFormat(match.start(), match.end() - match.start(), format)
+
+
+def make_document(size_mb: float) -> str:
+    row = {'id': 0, 'name': 'Widget', 'active': True, 'price': 12.5, 'tags': ['a', 'b'],
+           'owner': {'email': 'user@example.com', 'manager': None}}
+    per_row = len(json.dumps([row] * 100, indent=2)) / 100
+    rows = int(size_mb * 2 ** 20 / per_row)
+    return json.dumps([dict(row, id=i) for i in range(rows)], indent=2)
+
+
+def time_full(highlighter_class, text: str) -> float:
+    """Seconds to highlight every block of text"""
+    document = QTextDocument()
+    document.setPlainText(text)
+    highlighter = highlighter_class(document)
+    start = time.perf_counter()
+    highlighter.rehighlight()
+    return time.perf_counter() - start
+
+
+def colors(highlighter_class, text: str):
+    """(block, start, length, color) of every format range the highlighter sets"""
+    document = QTextDocument()
+    document.setPlainText(text)
+    highlighter_class(document).rehighlight()
+    result = []
+    block = document.begin()
+    while block.isValid():
+        for r in block.layout().formats():
+            result.append((block.blockNumber(), r.start, r.length, r.format.foreground().color().name()))
+        block = block.next()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size-mb', type=float, default=10, help='Document size (default: 10)')
+    parser.add_argument('--skip-legacy', action='store_true', help="Don't time the previous highlighter")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    tool = load_tool()
+
+    # On values alone the old rules don't overlap, so both must color them the same
+    values = json.dumps(['name', 3, 12.5, True, None, 'x'] * 3, indent=2)
+    if sorted(colors(LegacyJsonHighlighter, values)) != sorted(colors(tool.JsonHighlighter, values)):
+        print('ERROR: highlighters disagree on JSON values')
+        sys.exit(1)
+    # Keys: the old string rule recolored them as strings, leaving only the colon green
+    keys = json.dumps({'name': 'x', 'count': 3}, indent=2)
+    if [c[3] for c in colors(tool.JsonHighlighter, keys)] != ['#008000', '#c86400', '#008000', '#0000ff']:
+        print('ERROR: keys are not highlighted as keys')
+        sys.exit(1)
+
+    text = make_document(args.size_mb)
+    lines = text.count('\n') + 1
+    print(f"Document: {len(text) / 2 ** 20:.1f} MB, {lines:,} lines")
+
+    results = []
+    if not args.skip_legacy:
+        results.append(('previous JsonHighlighter, full', time_full(LegacyJsonHighlighter, text)))
+    results.append(('precompiled JsonHighlighter, full', time_full(tool.JsonHighlighter, text)))
+
+    editor = QPlainTextEdit()
+    editor.resize(900, 700)
+    editor.show()
+    start = time.perf_counter()
+    editor.setPlainText(text)
+    app.processEvents()
+    results.append(('setPlainText, no highlighter', time.perf_counter() - start))
+
+    editor = QPlainTextEdit()
+    editor.resize(900, 700)
+    editor.show()
+    highlighter = tool.JsonHighlighter(editor.document())
+    start = time.perf_counter()
+    highlighter.set_plain_text(editor, text)
+    app.processEvents()
+    results.append(('set_plain_text + first screen', time.perf_counter() - start))
+
+    start = time.perf_counter()
+    editor.verticalScrollBar().setValue(editor.verticalScrollBar().maximum() // 2)
+    app.processEvents()
+    results.append(('scroll to middle', time.perf_counter() - start))
+    viewport_blocks = len(highlighter.highlighted_blocks)
+
+    print(f"\n{'highlight':<38}{'seconds':>10}")
+    for label, seconds in results:
+        print(f"{label:<38}{seconds:>10.3f}")
+    print(f"\nViewport mode highlighted {viewport_blocks} of {lines:,} blocks "
+          f"(threshold: {tool.RegexHighlighter.MAX_HIGHLIGHT_CHARS:,} characters)")
+    if not args.skip_legacy:
+        print(f"Full-document speedup: {results[0][1] / results[1][1]:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
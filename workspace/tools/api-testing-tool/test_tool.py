@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""Tests for the headless parts of the API testing tool.
+
+Everything here runs against a real HTTP server started on a free local port
+instead of mocked httpx responses: the runner's exit codes, the streamed body
+temp files and the trace-based timing breakdown all depend on what actually
+comes over the socket. The collection runner is driven exactly as users drive
+it, through `tool.py run` in a subprocess.
+
+They need the tool's requirements (PyQt6, httpx) and are run locally with
+`python3 -m pytest test_tool.py`; CI (bats and the systemd unit checks) does not run them.
+"""
+import http.server
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import urllib.parse
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+TOOL_PATH = os.path.join(SCRIPT_DIR, 'tool.py')
+
+try:
+    spec = importlib.util.spec_from_file_location('api_testing_tool', TOOL_PATH)
+    tool = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(tool)
+except ImportError as e:
+    raise unittest.SkipTest(f"tool.py dependencies not installed: {e}")
+
+BIG_BODY = b'[' + b','.join(b'"%06d"' % i for i in range(40000)) + b']'  # ~360 KB, past PREVIEW_BYTES
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    """/ok, /missing (404), /slow?ms=N (sleeps N ms) and /big"""
+    protocol_version = 'HTTP/1.1'  # Keep-alive, so connection reuse can be observed
+
+    def do_GET(self):
+        url = urllib.parse.urlparse(self.path)
+        status, body = 200, b'{"ok": true}'
+        if url.path == '/missing':
+            status, body = 404, b'{"error": "not found"}'
+        elif url.path == '/slow':
+            time.sleep(int(urllib.parse.parse_qs(url.query)['ms'][0]) / 1000)
+        elif url.path == '/big':
+            body = BIG_BODY
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def setUpModule():
+    global server, BASE_URL
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    BASE_URL = f'http://127.0.0.1:{server.server_address[1]}'
+
+
+def tearDownModule():
+    server.shutdown()
+    server.server_close()
+
+
+def request(name, path, tests=(), **fields):
+    """One exported request that hits the test server through the {{base}} variable"""
+    return dict({'name': name, 'method': 'GET', 'url': '{{base}}' + path,
+                 'tests': [{'name': test_name, 'script': script} for test_name, script in tests]}, **fields)
+
+
+class TestRunCli(unittest.TestCase):
+    """`tool.py run` against exported collection and environment files."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+
+    def run_collection(self, collection, *args):
+        """Run collection; returns (exit code, stdout + stderr, JSON summary or None)"""
+        collections = os.path.join(self.tmp, 'collections.json')
+        environments = os.path.join(self.tmp, 'environments.json')
+        output = os.path.join(self.tmp, 'results.json')
+        with open(collections, 'w') as f:
+            json.dump({'collections': [collection]}, f)
+        with open(environments, 'w') as f:
+            json.dump({'environments': {'local': {'base': BASE_URL}}, 'global_variables': {},
+                       'current_environment': 'local'}, f)
+        done = subprocess.run(
+            [sys.executable, TOOL_PATH, 'run', collection['name'], '--collections', collections,
+             '--environments', environments, '--output', output, *args],
+            capture_output=True, text=True, timeout=120)
+        summary = None
+        if os.path.exists(output):
+            with open(output) as f:
+                summary = json.load(f)
+        return done.returncode, done.stdout + done.stderr, summary
+
+    def test_passing_run_exits_zero_with_latency_percentiles(self):
+        collection = {'name': 'Demo', 'requests': [
+            request('ok', '/ok', [('status', 'assert status_code == 200')]),
+            request('slow', '/slow', [('json', "assert json['ok'] is True")], params={'ms': '50'}),
+        ]}
+        code, output, summary = self.run_collection(collection, '--iterations', '4', '--concurrency', '2')
+        self.assertEqual(code, 0, output)
+        self.assertEqual(summary['total'], 8)
+        self.assertEqual((summary['failed'], summary['errors']), (0, 0))
+
+        ok, slow = summary['requests']
+        for result in (ok, slow):
+            self.assertEqual(result['runs'], 4)
+            self.assertLessEqual(result['p50'], result['p95'])
+            self.assertLessEqual(result['p95'], result['p99'])
+        self.assertGreaterEqual(slow['p50'], 50)
+        self.assertIn('8 requests in', output)
+
+    def test_failed_tests_exit_one_and_are_counted_per_request(self):
+        collection = {'name': 'Demo', 'requests': [
+            request('ok', '/ok', [('status', 'assert status_code == 200')]),
+            request('missing', '/missing', [('status', "assert status_code == 200, f'got {status_code}'")]),
+        ]}
+        code, output, summary = self.run_collection(collection, '--iterations', '3')
+        self.assertEqual(code, 1, output)
+        self.assertEqual((summary['failed'], summary['errors']), (3, 0))
+        ok, missing = summary['requests']
+        self.assertEqual(ok['failed'], 0)
+        self.assertEqual(missing['failed'], 3)
+        self.assertEqual(missing['messages'], {'status: got 404': 3})
+        self.assertIn('status: got 404 (x3)', output)
+
+    def test_connection_errors_exit_one(self):
+        collection = {'name': 'Demo', 'requests': [
+            {'name': 'refused', 'method': 'GET', 'url': 'http://127.0.0.1:1/'},
+        ]}
+        code, output, summary = self.run_collection(collection, '--timeout', '5')
+        self.assertEqual(code, 1, output)
+        self.assertEqual(summary['errors'], 1)
+        self.assertEqual(summary['requests'][0]['runs'], 1)
+
+    def test_folder_runs_only_its_requests_and_skips_websockets(self):
+        collection = {'name': 'Demo', 'requests': [request('top', '/missing', [('fails', 'assert False')])],
+                      'folders': [{'name': 'F', 'requests': [
+                          request('inner', '/ok'),
+                          {'name': 'socket', 'method': 'GET', 'url': 'ws://127.0.0.1:1/',
+                           'request_type': 'WebSocket'},
+                      ]}]}
+        code, output, summary = self.run_collection(collection, '--folder', 'F')
+        self.assertEqual(code, 0, output)
+        self.assertEqual([r['name'] for r in summary['requests']], ['inner'])
+        self.assertEqual(summary['skipped'], 1)
+
+    def test_unknown_collection_or_folder_exits_two(self):
+        collection = {'name': 'Demo', 'requests': [request('ok', '/ok')]}
+        code, output, _ = self.run_collection(collection, '--folder', 'Nope')
+        self.assertEqual(code, 2, output)
+        self.assertIn('Not found: Demo / Nope', output)
+
+
+class TestPercentile(unittest.TestCase):
+    """CollectionRunner.percentile is nearest-rank over a sorted list."""
+
+    def test_nearest_rank(self):
+        values = list(range(1, 101))
+        self.assertEqual(tool.CollectionRunner.percentile(values, 50), 50)
+        self.assertEqual(tool.CollectionRunner.percentile(values, 95), 95)
+        self.assertEqual(tool.CollectionRunner.percentile(values, 99), 99)
+        self.assertEqual(tool.CollectionRunner.percentile(values, 100), 100)
+
+    def test_small_and_empty_lists(self):
+        self.assertEqual(tool.CollectionRunner.percentile([7.5], 99), 7.5)
+        self.assertEqual(tool.CollectionRunner.percentile([1, 2], 50), 1)
+        self.assertEqual(tool.CollectionRunner.percentile([], 50), 0.0)
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_percentiles_within_one_percent(self):
+        histogram = tool.LatencyHistogram()
+        values = [0.25 * i for i in range(1, 40001)]  # 0.25 ms .. 10 s
+        for value in values:
+            histogram.record(value)
+        for pct in (50, 90, 95, 99, 99.9):
+            exact = tool.CollectionRunner.percentile(values, pct)
+            self.assertAlmostEqual(histogram.percentile(pct), exact, delta=exact * 0.01, msg=f"p{pct}")
+        self.assertEqual(histogram.total, len(values))
+        self.assertAlmostEqual(histogram.mean(), sum(values) / len(values))
+
+    def test_bounded_memory(self):
+        histogram = tool.LatencyHistogram()
+        for i in range(100000):
+            histogram.record(i % 5000 + 0.5)
+        self.assertLess(len(histogram.counts), 2000)
+        self.assertEqual(sum(count for _, count in histogram.buckets()), 100000)
+
+    def test_percentiles_stay_within_recorded_range(self):
+        histogram = tool.LatencyHistogram()
+        for value in (12.0, 12.0, 12.0):
+            histogram.record(value)
+        self.assertEqual(histogram.percentile(0), 12.0)
+        self.assertEqual(histogram.percentile(100), 12.0)
+        self.assertEqual((histogram.min, histogram.max), (12.0, 12.0))
+
+    def test_empty(self):
+        histogram = tool.LatencyHistogram()
+        self.assertEqual(histogram.percentile(99), 0.0)
+        self.assertEqual(histogram.mean(), 0.0)
+        self.assertEqual(histogram.buckets(), [])
+
+
+class TestIndentJson(unittest.TestCase):
+    """ResponseWidget.indent_json re-indents without parsing."""
+
+    def test_matches_json_dumps_for_valid_documents(self):
+        document = {'name': 'a, "quoted" {brace}', 'items': [1, 2.5, True, None], 'empty': {},
+                    'none': [], 'nested': {'list': [{'k': 'v'}]}}
+        compact = json.dumps(document, separators=(',', ':'))
+        self.assertEqual(tool.ResponseWidget.indent_json(compact), json.dumps(document, indent=2))
+
+    def test_truncated_document_still_indents(self):
+        text = json.dumps({'rows': [{'id': i, 'name': f'row {i}'} for i in range(50)]})
+        cut = text[:len(text) // 2] + '"unterminated str'
+        pretty = tool.ResponseWidget.indent_json(cut)
+        self.assertTrue(pretty.startswith('{\n  "rows": [\n    {\n      "id": 0,'))
+        self.assertTrue(pretty.endswith('"unterminated str'))
+
+    def test_indent_width(self):
+        self.assertEqual(tool.ResponseWidget.indent_json('[1,[2]]', indent=4), '[\n    1,\n    [\n        2\n    ]\n]')
+
+
+class TestRequestTimer(unittest.TestCase):
+
+    def test_breakdown_from_trace_events(self):
+        timer = tool.RequestTimer()
+        timer.events = {
+            'connection.connect_tcp.started': 1.000, 'connection.connect_tcp.complete': 1.010,
+            'connection.start_tls.started': 1.010, 'connection.start_tls.complete': 1.030,
+            'http11.send_request_headers.started': 1.030, 'http11.receive_response_headers.complete': 1.130,
+            'http11.receive_response_body.started': 1.130, 'http11.receive_response_body.complete': 1.180,
+        }
+        breakdown = timer.breakdown()
+        for phase, expected in (('connect', 10), ('tls', 20), ('ttfb', 100), ('download', 50)):
+            self.assertAlmostEqual(breakdown[phase], expected, places=6, msg=phase)
+        self.assertFalse(breakdown['reused'])
+
+    def test_http2_events_and_reused_connection(self):
+        timer = tool.RequestTimer()
+        timer.events = {'http2.send_request_headers.started': 2.0, 'http2.receive_response_headers.complete': 2.25}
+        breakdown = timer.breakdown()
+        self.assertAlmostEqual(breakdown['ttfb'], 250, places=6)
+        self.assertEqual((breakdown['connect'], breakdown['tls']), (0.0, 0.0))
+        self.assertTrue(breakdown['reused'])
+
+
+class TestHttpWorker(unittest.TestCase):
+    """HttpWorker.run on the calling thread, with a pooled client."""
+
+    def setUp(self):
+        self.pool = tool.ConnectionPool()
+        self.addCleanup(self.pool.close)
+
+    def send(self, path, params=None):
+        worker = tool.HttpWorker('GET', BASE_URL + path, {}, params or {}, '', client=self.pool.get_client())
+        results, errors = [], []
+        worker.finished.connect(results.append)
+        worker.error.connect(errors.append)
+        worker.run()
+        self.assertEqual(errors, [])
+        result = results[0]
+        self.addCleanup(os.remove, result['body_file'])
+        return result
+
+    def test_small_body_is_kept_whole(self):
+        result = self.send('/ok')
+        self.assertFalse(result['truncated'])
+        self.assertEqual(result['body'], '{"ok": true}')
+        self.assertEqual(result['size'], len(result['body']))
+        self.assertEqual(tool.HttpWorker.read_full_body(result), result['body'])
+
+    def test_large_body_is_streamed_to_a_file_with_a_preview(self):
+        result = self.send('/big')
+        self.assertTrue(result['truncated'])
+        self.assertEqual(result['size'], len(BIG_BODY))
+        self.assertEqual(result['body'], BIG_BODY[:tool.HttpWorker.PREVIEW_BYTES].decode())
+        with open(result['body_file'], 'rb') as f:
+            self.assertEqual(f.read(), BIG_BODY)
+        self.assertEqual(tool.HttpWorker.read_full_body(result), BIG_BODY.decode())
+
+    def test_timings_show_connection_reuse(self):
+        first = self.send('/ok')['timings']
+        second = self.send('/slow', {'ms': '30'})['timings']
+        self.assertFalse(first['reused'])
+        self.assertGreater(first['connect'], 0)
+        self.assertTrue(second['reused'])
+        self.assertEqual(second['connect'], 0.0)
+        self.assertGreaterEqual(second['ttfb'], 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
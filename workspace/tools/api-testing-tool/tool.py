@@ -4,7 +4,17 @@ import time
 import os
 import uuid
 import base64
+import codecs
+import csv
+import math
+import asyncio
+import argparse
+import getpass
+import shutil
+import tempfile
+import threading
 import urllib.parse
+import http.cookiejar
 from typing import Dict, Any, Optional, List
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
@@ -13,10 +23,10 @@ from PyQt6.QtWidgets import (
     QHeaderView, QMessageBox, QProgressBar, QTreeWidget, QTreeWidgetItem,
     QMenu, QFileDialog, QInputDialog, QDialog, QDialogButtonBox,
     QFormLayout, QCheckBox, QGroupBox, QListWidget, QListWidgetItem,
-    QPlainTextEdit, QTextBrowser
+    QPlainTextEdit, QTextBrowser, QSpinBox, QDoubleSpinBox
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QDateTime, QUrl
-from PyQt6.QtGui import QFont, QSyntaxHighlighter, QTextCharFormat, QColor, QAction, QIcon, QDesktopServices
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QDateTime, QUrl, QPoint
+from PyQt6.QtGui import QFont, QSyntaxHighlighter, QTextCharFormat, QColor, QAction, QIcon, QDesktopServices, QPainter, QPen, QTextLayout
 import httpx
 import re
 import websocket
@@ -26,101 +36,148 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 
-class JsonHighlighter(QSyntaxHighlighter):
+def compile_rules(rules) -> re.Pattern:
+    """One regex of named alternatives; where two could match at the same place, the earlier rule wins"""
+    return re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in rules))
+
+
+class RegexHighlighter(QSyntaxHighlighter):
+    """
+    Base for the syntax highlighters. Subclasses set TOKEN_RE, compiled once when the
+    class is defined, and FORMATS, token name -> (RGB, bold). Each block is tokenized
+    in a single pass, so overlapping rules never re-scan or repaint the same text, and
+    short lines are tokenized once however often they repeat ("},", "\"ok\": true,").
+    
+    Setting a large document through set_plain_text() doesn't highlight it all: past
+    MAX_HIGHLIGHT_CHARS only the blocks scrolled into view of a QPlainTextEdit are
+    colored, as they appear.
+    """
+    
+    TOKEN_RE = None
+    FORMATS = {}
+    MAX_HIGHLIGHT_CHARS = 500_000
+    SPAN_CACHE_SIZE = 10_000
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.highlighting_rules = []
-        
-        # JSON syntax highlighting
-        json_format = QTextCharFormat()
-        json_format.setForeground(QColor(0, 128, 0))
-        self.highlighting_rules.append((r'"[^"]*":', json_format))  # Keys
-        
-        string_format = QTextCharFormat()
-        string_format.setForeground(QColor(200, 100, 0))
-        self.highlighting_rules.append((r'"[^"]*"', string_format))  # Strings
-        
-        number_format = QTextCharFormat()
-        number_format.setForeground(QColor(0, 0, 255))
-        self.highlighting_rules.append((r'\b\d+\.?\d*\b', number_format))  # Numbers
-        
-        keyword_format = QTextCharFormat()
-        keyword_format.setForeground(QColor(128, 0, 128))
-        keyword_format.setFontWeight(QFont.Weight.Bold)
-        self.highlighting_rules.append((r'\b(true|false|null)\b', keyword_format))
-
+        self.formats = {}
+        for name, (rgb, bold) in self.FORMATS.items():
+            token_format = QTextCharFormat()
+            token_format.setForeground(QColor(*rgb))
+            if bold:
+                token_format.setFontWeight(QFont.Weight.Bold)
+            self.formats[name] = token_format
+        
+        self.span_cache = {}
+        
+        # Viewport mode state
+        self.editor = None
+        self.highlighted_blocks = set()
+    
+    def token_spans(self, text: str) -> list:
+        """(start, length, format) of every token in one block of text"""
+        spans = self.span_cache.get(text)
+        if spans is None:
+            spans = [(match.start(), match.end() - match.start(), self.formats[match.lastgroup])
+                     for match in self.TOKEN_RE.finditer(text)]
+            if len(text) <= 200 and len(self.span_cache) < self.SPAN_CACHE_SIZE:
+                self.span_cache[text] = spans
+        return spans
+    
     def highlightBlock(self, text):
-        for pattern, format in self.highlighting_rules:
-            expression = re.compile(pattern)
-            for match in expression.finditer(text):
-                self.setFormat(match.start(), match.end() - match.start(), format)
+        for start, length, token_format in self.token_spans(text):
+            self.setFormat(start, length, token_format)
+    
+    def set_plain_text(self, editor, text: str):
+        """editor.setPlainText(text), highlighting the whole document only up to MAX_HIGHLIGHT_CHARS"""
+        if self.editor:
+            self.editor.updateRequest.disconnect(self.highlight_viewport)
+            self.editor = None
+        
+        # Detached while the text goes in, or the whole document is highlighted right away
+        document = editor.document()
+        self.setDocument(None)
+        editor.setPlainText(text)
+        
+        if len(text) <= self.MAX_HIGHLIGHT_CHARS:
+            self.setDocument(document)
+        elif isinstance(editor, QPlainTextEdit):
+            self.editor = editor
+            self.highlighted_blocks = set()
+            editor.updateRequest.connect(self.highlight_viewport)
+            self.highlight_viewport()
+    
+    def highlight_viewport(self, *args):
+        """Color the visible blocks that haven't been yet, straight on their layouts"""
+        editor = self.editor
+        viewport = editor.viewport()
+        block = editor.cursorForPosition(QPoint(0, 0)).block()
+        last = editor.cursorForPosition(QPoint(viewport.width(), viewport.height())).block().blockNumber()
+        
+        changed = False
+        while block.isValid() and block.blockNumber() <= last:
+            if block.blockNumber() not in self.highlighted_blocks:
+                ranges = []
+                for start, length, token_format in self.token_spans(block.text()):
+                    format_range = QTextLayout.FormatRange()
+                    format_range.start = start
+                    format_range.length = length
+                    format_range.format = token_format
+                    ranges.append(format_range)
+                block.layout().setFormats(ranges)
+                self.highlighted_blocks.add(block.blockNumber())
+                changed = True
+            block = block.next()
+        
+        # Only repaint for new work: the repaint itself emits updateRequest
+        if changed:
+            viewport.update()
 
 
-class GraphQLHighlighter(QSyntaxHighlighter):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.highlighting_rules = []
-        
-        # GraphQL keywords
-        keyword_format = QTextCharFormat()
-        keyword_format.setForeground(QColor(0, 0, 255))
-        keyword_format.setFontWeight(QFont.Weight.Bold)
-        keywords = ['query', 'mutation', 'subscription', 'fragment', 'type', 'interface', 'union', 'enum', 'input']
-        for keyword in keywords:
-            self.highlighting_rules.append((rf'\b{keyword}\b', keyword_format))
-        
-        # Field names
-        field_format = QTextCharFormat()
-        field_format.setForeground(QColor(0, 128, 0))
-        self.highlighting_rules.append((r'\b\w+(?=\s*:)', field_format))
-        
-        # String literals
-        string_format = QTextCharFormat()
-        string_format.setForeground(QColor(200, 100, 0))
-        self.highlighting_rules.append((r'"[^"]*"', string_format))
-        
-        # Comments
-        comment_format = QTextCharFormat()
-        comment_format.setForeground(QColor(128, 128, 128))
-        self.highlighting_rules.append((r'#.*', comment_format))
+class JsonHighlighter(RegexHighlighter):
+    TOKEN_RE = compile_rules([
+        ('key', r'"(?:[^"\\]|\\.)*"(?=\s*:)'),
+        ('string', r'"(?:[^"\\]|\\.)*"'),
+        ('keyword', r'\b(?:true|false|null)\b'),
+        ('number', r'-?\b\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b'),
+    ])
+    FORMATS = {
+        'key': ((0, 128, 0), False),
+        'string': ((200, 100, 0), False),
+        'keyword': ((128, 0, 128), True),
+        'number': ((0, 0, 255), False),
+    }
 
-    def highlightBlock(self, text):
-        for pattern, format in self.highlighting_rules:
-            expression = re.compile(pattern)
-            for match in expression.finditer(text):
-                self.setFormat(match.start(), match.end() - match.start(), format)
 
+class GraphQLHighlighter(RegexHighlighter):
+    KEYWORDS = ['query', 'mutation', 'subscription', 'fragment', 'type', 'interface', 'union', 'enum', 'input']
+    TOKEN_RE = compile_rules([
+        ('comment', r'#.*'),
+        ('string', r'"(?:[^"\\]|\\.)*"'),
+        ('field', r'\b\w+(?=\s*:)'),
+        ('keyword', rf'\b(?:{"|".join(KEYWORDS)})\b'),
+    ])
+    FORMATS = {
+        'comment': ((128, 128, 128), False),
+        'string': ((200, 100, 0), False),
+        'field': ((0, 128, 0), False),
+        'keyword': ((0, 0, 255), True),
+    }
 
-class PythonHighlighter(QSyntaxHighlighter):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.highlighting_rules = []
-        
-        # Python keywords
-        keyword_format = QTextCharFormat()
-        keyword_format.setForeground(QColor(0, 0, 255))
-        keyword_format.setFontWeight(QFont.Weight.Bold)
-        keywords = ['def', 'class', 'if', 'else', 'elif', 'for', 'while', 'try', 'except', 
-                   'import', 'from', 'return', 'and', 'or', 'not', 'in', 'is', 'True', 'False', 'None']
-        for keyword in keywords:
-            self.highlighting_rules.append((rf'\b{keyword}\b', keyword_format))
-        
-        # Strings
-        string_format = QTextCharFormat()
-        string_format.setForeground(QColor(0, 128, 0))
-        self.highlighting_rules.append((r'"[^"]*"', string_format))
-        self.highlighting_rules.append((r"'[^']*'", string_format))
-        
-        # Comments
-        comment_format = QTextCharFormat()
-        comment_format.setForeground(QColor(128, 128, 128))
-        self.highlighting_rules.append((r'#.*', comment_format))
 
-    def highlightBlock(self, text):
-        for pattern, format in self.highlighting_rules:
-            expression = re.compile(pattern)
-            for match in expression.finditer(text):
-                self.setFormat(match.start(), match.end() - match.start(), format)
+class PythonHighlighter(RegexHighlighter):
+    KEYWORDS = ['def', 'class', 'if', 'else', 'elif', 'for', 'while', 'try', 'except',
+                'import', 'from', 'return', 'and', 'or', 'not', 'in', 'is', 'True', 'False', 'None']
+    TOKEN_RE = compile_rules([
+        ('comment', r'#.*'),
+        ('string', r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\''),
+        ('keyword', rf'\b(?:{"|".join(KEYWORDS)})\b'),
+    ])
+    FORMATS = {
+        'comment': ((128, 128, 128), False),
+        'string': ((0, 128, 0), False),
+        'keyword': ((0, 0, 255), True),
+    }
 
 
 class DataEncryption:
@@ -894,6 +951,394 @@ class CollectionManager:
                 json.dump(collection.to_dict(), f, indent=2)
 
 
+class CollectionRunner:
+    """
+    Sends every request of a collection or folder with httpx.AsyncClient on one
+    asyncio loop: up to `concurrency` requests in flight, the whole set repeated
+    `iterations` times, each worker pausing `delay` seconds between requests.
+    Every response goes through the request's test assertions.
+    """
+    
+    def __init__(self, requests, env_manager, concurrency=5, iterations=1, delay=0.0, timeout=30, http2=False):
+        self.env_manager = env_manager
+        self.concurrency = max(1, concurrency)
+        self.iterations = max(1, iterations)
+        self.delay = delay
+        self.timeout = timeout
+        self.http2 = http2
+        self.on_progress = None  # Called with (done, total) after each request
+        self.cancelled = False
+        
+        # WebSocket requests can't be run this way
+        self.requests = [req for req in requests if req.request_type != 'WebSocket']
+        self.skipped = len(requests) - len(self.requests)
+        # Private copies: TestAssertion.run records its result on the test itself
+        self.tests = [[TestAssertion(t.name, t.script, t.enabled) for t in req.tests] for req in self.requests]
+    
+    @staticmethod
+    def collect_requests(node):
+        """Requests of a Collection (folders included) or a Folder, in tree order"""
+        requests = list(node.requests)
+        for folder in getattr(node, 'folders', []):
+            requests.extend(folder.requests)
+        return requests
+    
+    @staticmethod
+    def prepare(request: RequestItem, env_manager) -> dict:
+        """Keyword arguments for client.request(), substituted and authenticated like send_request"""
+        substitute = env_manager.substitute_variables
+        
+        url = substitute(request.url.strip())
+        if not url.startswith(('http://', 'https://')):
+            url = 'https://' + url
+        headers = {key: substitute(value) for key, value in request.headers.items()}
+        request.auth.apply_to_headers(headers)
+        params = {key: substitute(value) for key, value in request.params.items()}
+        method = request.method.upper()
+        body = substitute(request.body)
+        
+        if request.request_type == 'GraphQL':
+            method = 'POST'
+            headers['Content-Type'] = 'application/json'
+            try:
+                variables = json.loads(request.graphql_variables) if request.graphql_variables else {}
+            except json.JSONDecodeError:
+                variables = {}
+            body = json.dumps({'query': request.graphql_query, 'variables': variables})
+        
+        return {
+            'method': method,
+            'url': url,
+            'headers': headers,
+            'params': params,
+            'content': body if method in ('POST', 'PUT', 'PATCH') else None
+        }
+    
+    @staticmethod
+    def percentile(sorted_values, pct):
+        """Nearest-rank percentile of an already sorted list"""
+        if not sorted_values:
+            return 0.0
+        rank = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+        return sorted_values[rank]
+    
+    def cancel(self):
+        self.cancelled = True
+    
+    async def run(self) -> dict:
+        # Substitution happens once: variables don't change during a run
+        self.prepared = [self.prepare(req, self.env_manager) for req in self.requests]
+        self.stats = [{'latencies': [], 'failed': 0, 'errors': 0, 'messages': {}} for _ in self.requests]
+        self.done = 0
+        
+        jobs = asyncio.Queue()
+        for _ in range(self.iterations):
+            for index in range(len(self.requests)):
+                jobs.put_nowait(index)
+        total = jobs.qsize()
+        
+        limits = httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+        start = time.perf_counter()
+        async with httpx.AsyncClient(verify=False, http2=self.http2, limits=limits, timeout=self.timeout) as client:
+            workers = [self.worker(client, jobs, total) for _ in range(min(self.concurrency, total))]
+            await asyncio.gather(*workers)
+        self.duration = time.perf_counter() - start
+        
+        return self.summary()
+    
+    async def worker(self, client, jobs, total):
+        while not self.cancelled:
+            try:
+                index = jobs.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await self.send(client, index)
+            
+            self.done += 1
+            if self.on_progress:
+                self.on_progress(self.done, total)
+            if self.delay and not jobs.empty():
+                await asyncio.sleep(self.delay)
+    
+    async def send(self, client, index):
+        stats = self.stats[index]
+        start = time.perf_counter()
+        try:
+            response = await client.request(**self.prepared[index])
+        except Exception as e:
+            stats['errors'] += 1
+            self.record_message(stats, f"{type(e).__name__}: {e}")
+            return
+        response_time = (time.perf_counter() - start) * 1000
+        stats['latencies'].append(response_time)
+        
+        response_data = {
+            'status_code': response.status_code,
+            'headers': dict(response.headers),
+            'body': response.text,
+            'response_time': response_time,
+            'size': len(response.content)
+        }
+        failed = [test for test in self.tests[index] if not test.run(response_data)]
+        if failed:
+            stats['failed'] += 1
+            for test in failed:
+                self.record_message(stats, f"{test.name}: {test.error}")
+    
+    @staticmethod
+    def record_message(stats, message):
+        # Distinct messages with counts, capped so a failing run doesn't grow without bound
+        if message in stats['messages'] or len(stats['messages']) < 5:
+            stats['messages'][message] = stats['messages'].get(message, 0) + 1
+    
+    def summary(self) -> dict:
+        results = []
+        for request, stats in zip(self.requests, self.stats):
+            latencies = sorted(stats['latencies'])
+            results.append({
+                'name': request.name,
+                'method': request.method,
+                'url': request.url,
+                'runs': len(latencies) + stats['errors'],
+                'failed': stats['failed'],
+                'errors': stats['errors'],
+                'p50': self.percentile(latencies, 50),
+                'p95': self.percentile(latencies, 95),
+                'p99': self.percentile(latencies, 99),
+                'mean': sum(latencies) / len(latencies) if latencies else 0.0,
+                'messages': stats['messages']
+            })
+        
+        return {
+            'requests': results,
+            'total': self.done,
+            'failed': sum(r['failed'] for r in results),
+            'errors': sum(r['errors'] for r in results),
+            'skipped': self.skipped,
+            'duration': self.duration,
+            'throughput': self.done / self.duration if self.duration else 0.0,
+            'cancelled': self.cancelled
+        }
+
+
+class LatencyHistogram:
+    """
+    HDR-style latency histogram: microsecond values go into log-linear buckets,
+    128 per power of two, so every value is kept to within 1% in a few KB no
+    matter how many are recorded.
+    """
+    
+    SUB_BUCKET_BITS = 7
+    
+    def __init__(self):
+        self.counts = {}
+        self.total = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = 0.0
+    
+    def record(self, value_ms: float):
+        micros = int(value_ms * 1000)
+        shift = max(0, micros.bit_length() - self.SUB_BUCKET_BITS)
+        index = (shift << self.SUB_BUCKET_BITS) | (micros >> shift)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.total += 1
+        self.sum += value_ms
+        self.min = value_ms if self.min is None else min(self.min, value_ms)
+        self.max = max(self.max, value_ms)
+    
+    def bucket_value(self, index) -> float:
+        """Middle of a bucket, in milliseconds"""
+        shift = index >> self.SUB_BUCKET_BITS
+        low = (index & ((1 << self.SUB_BUCKET_BITS) - 1)) << shift
+        return (low + ((1 << shift) - 1) / 2) / 1000
+    
+    def percentile(self, pct) -> float:
+        if not self.total:
+            return 0.0
+        target = max(1, math.ceil(pct / 100 * self.total))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(max(self.bucket_value(index), self.min), self.max)
+        return self.max
+    
+    def mean(self) -> float:
+        return self.sum / self.total if self.total else 0.0
+    
+    def buckets(self):
+        """(value in ms, count) for every non-empty bucket, lowest first"""
+        return [(self.bucket_value(index), self.counts[index]) for index in sorted(self.counts)]
+
+
+class LoadTest:
+    """
+    Drives one request with virtual users on an asyncio loop. Each user sends the
+    request, waits `think_time` and repeats. The number of users follows a profile:
+    'constant' starts all of them at once, 'ramp-up' adds them evenly over `ramp_time`
+    seconds, 'step' adds users/steps of them at the start of each of `steps` equal
+    slices of the run. Failed connections and HTTP status 400 and above are errors.
+    """
+    
+    PROFILES = ('constant', 'ramp-up', 'step')
+    
+    def __init__(self, request: RequestItem, env_manager, users=10, duration=30, profile='constant',
+                 ramp_time=10, steps=5, think_time=0.0, timeout=30, http2=False):
+        if profile not in self.PROFILES:
+            raise ValueError(f"Unknown load profile: {profile}")
+        self.request = request
+        self.env_manager = env_manager
+        self.users = max(1, users)
+        self.duration = duration
+        self.profile = profile
+        self.ramp_time = ramp_time
+        self.steps = max(1, steps)
+        self.think_time = think_time
+        self.timeout = timeout
+        self.http2 = http2
+        self.on_second = None  # Called with each finished timeline row
+        self.cancelled = False
+        
+        self.histogram = LatencyHistogram()
+        self.status_codes = {}
+        self.seconds = {}
+        self.timeline = []
+        self.elapsed = 0.0
+    
+    def target_users(self, elapsed: float) -> int:
+        if self.profile == 'ramp-up' and self.ramp_time > 0:
+            return max(1, min(self.users, math.ceil(self.users * elapsed / self.ramp_time)))
+        if self.profile == 'step':
+            step = min(self.steps, int(elapsed / (self.duration / self.steps)) + 1)
+            return max(1, round(self.users * step / self.steps))
+        return self.users
+    
+    def cancel(self):
+        self.cancelled = True
+    
+    async def run(self) -> dict:
+        self.prepared = CollectionRunner.prepare(self.request, self.env_manager)
+        httpx.URL(self.prepared['url'])  # Fail now on a bad URL rather than once per request
+        
+        limits = httpx.Limits(max_connections=self.users, max_keepalive_connections=self.users)
+        async with httpx.AsyncClient(verify=False, http2=self.http2, limits=limits, timeout=self.timeout) as client:
+            self.start = time.perf_counter()
+            users = []
+            second = 0
+            while not self.cancelled:
+                elapsed = time.perf_counter() - self.start
+                if elapsed >= self.duration:
+                    break
+                while elapsed >= second + 1:
+                    self.close_second(second, len(users))
+                    second += 1
+                
+                target = self.target_users(elapsed)
+                while len(users) < target:
+                    users.append(asyncio.create_task(self.user(client)))
+                while len(users) > target:
+                    users.pop().cancel()
+                await asyncio.sleep(0.05)
+            
+            # Requests still in flight are dropped, not counted
+            for task in users:
+                task.cancel()
+            await asyncio.gather(*users, return_exceptions=True)
+            self.elapsed = min(time.perf_counter() - self.start, self.duration)
+            while second < math.ceil(self.elapsed):
+                self.close_second(second, len(users))
+                second += 1
+        
+        return self.summary()
+    
+    async def user(self, client):
+        while True:
+            start = time.perf_counter()
+            try:
+                response = await client.request(**self.prepared)
+                status = response.status_code
+            except Exception as e:
+                status = type(e).__name__
+            self.record(start, time.perf_counter(), status)
+            await asyncio.sleep(self.think_time)  # Yields even with no think time
+    
+    def record(self, start, end, status):
+        if end - self.start >= self.duration:
+            return  # Finished after the run window, while users were being stopped
+        second = self.seconds.setdefault(int(end - self.start), {'requests': 0, 'errors': 0,
+                                                                'histogram': LatencyHistogram()})
+        second['requests'] += 1
+        self.status_codes[str(status)] = self.status_codes.get(str(status), 0) + 1
+        if isinstance(status, int):
+            # Only completed requests have a meaningful latency
+            latency = (end - start) * 1000
+            self.histogram.record(latency)
+            second['histogram'].record(latency)
+            if status < 400:
+                return
+        second['errors'] += 1
+    
+    def close_second(self, second, users):
+        stats = self.seconds.pop(second, None) or {'requests': 0, 'errors': 0, 'histogram': LatencyHistogram()}
+        histogram = stats['histogram']
+        row = {
+            'second': second + 1,
+            'users': users,
+            'requests': stats['requests'],
+            'errors': stats['errors'],
+            'error_rate': stats['errors'] / stats['requests'] if stats['requests'] else 0.0,
+            'p50': histogram.percentile(50),
+            'p95': histogram.percentile(95),
+            'p99': histogram.percentile(99),
+            'max': histogram.max
+        }
+        self.timeline.append(row)
+        if self.on_second:
+            self.on_second(row)
+    
+    def summary(self) -> dict:
+        total = sum(self.status_codes.values())
+        errors = sum(row['errors'] for row in self.timeline)
+        return {
+            'request': self.request.name,
+            'method': self.prepared['method'],
+            'url': self.prepared['url'],
+            'profile': self.profile,
+            'users': self.users,
+            'duration': self.elapsed,
+            'total': total,
+            'errors': errors,
+            'error_rate': errors / total if total else 0.0,
+            'throughput': total / self.elapsed if self.elapsed else 0.0,
+            'latency': {
+                'min': self.histogram.min or 0.0,
+                'mean': self.histogram.mean(),
+                'p50': self.histogram.percentile(50),
+                'p90': self.histogram.percentile(90),
+                'p95': self.histogram.percentile(95),
+                'p99': self.histogram.percentile(99),
+                'max': self.histogram.max
+            },
+            'status_codes': self.status_codes,
+            'cancelled': self.cancelled,
+            'timeline': self.timeline,
+            'histogram': self.histogram.buckets()
+        }
+    
+    def export_json(self, file_path: str):
+        with open(file_path, 'w') as f:
+            json.dump(self.summary(), f, indent=2)
+    
+    def export_csv(self, file_path: str):
+        """The per-second timeline, one row per second"""
+        columns = ['second', 'users', 'requests', 'errors', 'error_rate', 'p50', 'p95', 'p99', 'max']
+        with open(file_path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(self.timeline)
+
+
 class AuthWidget(QWidget):
     def __init__(self):
         super().__init__()
@@ -1558,6 +2003,8 @@ class TestsWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.tests = []
+        self.response_data = None
+        self.body_worker = None
         self.init_ui()
     
     def init_ui(self):
@@ -1571,9 +2018,9 @@ class TestsWidget(QWidget):
         add_test_btn.clicked.connect(self.add_test)
         header_layout.addWidget(add_test_btn)
         
-        run_tests_btn = QPushButton('Run Tests')
-        run_tests_btn.clicked.connect(self.run_tests)
-        header_layout.addWidget(run_tests_btn)
+        self.run_tests_btn = QPushButton('Run Tests')
+        self.run_tests_btn.clicked.connect(self.run_tests)
+        header_layout.addWidget(self.run_tests_btn)
         
         layout.addLayout(header_layout)
         
@@ -1678,6 +2125,31 @@ class TestsWidget(QWidget):
             QMessageBox.warning(self, 'Warning', 'No response data available for testing')
             return
         
+        # Tests see the whole body: past the preview it is read from the temp file off the GUI thread
+        if self.response_data.get('truncated'):
+            if self.body_worker and self.body_worker.isRunning():
+                return
+            self.run_tests_btn.setEnabled(False)
+            self.run_tests_btn.setText('Loading body...')
+            self.body_worker = FullBodyWorker(self.response_data)
+            self.body_worker.finished.connect(self.on_full_body)
+            self.body_worker.error.connect(self.on_full_body_error)
+            self.body_worker.start()
+            return
+        
+        self.run_tests_against(self.response_data)
+    
+    def on_full_body(self, response_data):
+        self.run_tests_btn.setEnabled(True)
+        self.run_tests_btn.setText('Run Tests')
+        self.run_tests_against(response_data)
+    
+    def on_full_body_error(self, error_message):
+        self.run_tests_btn.setEnabled(True)
+        self.run_tests_btn.setText('Run Tests')
+        QMessageBox.critical(self, 'Tests', f'Cannot read the response body: {error_message}')
+    
+    def run_tests_against(self, response_data):
         # Update tests from table first
         self.get_tests()
         
@@ -1686,7 +2158,7 @@ class TestsWidget(QWidget):
         
         for test in self.tests:
             if test.enabled:
-                if test.run(self.response_data):
+                if test.run(response_data):
                     passed += 1
                 else:
                     failed += 1
@@ -2088,12 +2560,530 @@ class EnvironmentDialog(QDialog):
         self.accept()
 
 
+class ConnectionSettingsDialog(QDialog):
+    def __init__(self, connection_pool, parent=None):
+        super().__init__(parent)
+        self.connection_pool = connection_pool
+        self.init_ui()
+    
+    def init_ui(self):
+        self.setWindowTitle('Connection Settings')
+        self.setModal(True)
+        
+        layout = QVBoxLayout()
+        settings = self.connection_pool.settings
+        
+        info = QLabel('Each environment keeps its own pool of keep-alive connections, '
+                      'shared by every request sent in it.')
+        info.setWordWrap(True)
+        layout.addWidget(info)
+        
+        form_layout = QFormLayout()
+        
+        self.http2_check = QCheckBox('Use HTTP/2 where the server supports it')
+        self.http2_check.setChecked(settings['http2'])
+        if not ConnectionPool.http2_available():
+            self.http2_check.setChecked(False)
+            self.http2_check.setEnabled(False)
+            self.http2_check.setToolTip('Requires the h2 package: pip install httpx[http2]')
+        form_layout.addRow('HTTP/2:', self.http2_check)
+        
+        self.max_connections_spin = QSpinBox()
+        self.max_connections_spin.setRange(1, 1000)
+        self.max_connections_spin.setValue(settings['max_connections'])
+        form_layout.addRow('Max connections:', self.max_connections_spin)
+        
+        self.max_keepalive_spin = QSpinBox()
+        self.max_keepalive_spin.setRange(0, 1000)
+        self.max_keepalive_spin.setValue(settings['max_keepalive_connections'])
+        form_layout.addRow('Max keep-alive connections:', self.max_keepalive_spin)
+        
+        self.keepalive_expiry_spin = QDoubleSpinBox()
+        self.keepalive_expiry_spin.setRange(0, 3600)
+        self.keepalive_expiry_spin.setSuffix(' s')
+        self.keepalive_expiry_spin.setValue(settings['keepalive_expiry'])
+        form_layout.addRow('Keep-alive expiry:', self.keepalive_expiry_spin)
+        
+        layout.addLayout(form_layout)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(self.save_and_accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+        
+        self.setLayout(layout)
+    
+    def save_and_accept(self):
+        # Open connections are closed; clients are recreated with the new settings on next send
+        self.connection_pool.configure(
+            http2=self.http2_check.isChecked(),
+            max_connections=self.max_connections_spin.value(),
+            max_keepalive_connections=self.max_keepalive_spin.value(),
+            keepalive_expiry=self.keepalive_expiry_spin.value()
+        )
+        self.accept()
+
+
+class CollectionRunnerDialog(QDialog):
+    def __init__(self, node, env_manager, connection_pool, parent=None):
+        super().__init__(parent)
+        self.node = node  # Collection or Folder
+        self.env_manager = env_manager
+        self.connection_pool = connection_pool
+        self.worker = None
+        self.init_ui()
+    
+    def init_ui(self):
+        self.setWindowTitle(f'Run - {self.node.name}')
+        self.setModal(True)
+        self.resize(800, 500)
+        
+        layout = QVBoxLayout()
+        
+        environment = self.env_manager.current_environment or 'None'
+        info = QLabel(f'{len(CollectionRunner.collect_requests(self.node))} requests, environment: {environment}')
+        layout.addWidget(info)
+        
+        form_layout = QFormLayout()
+        
+        self.concurrency_spin = QSpinBox()
+        self.concurrency_spin.setRange(1, 100)
+        self.concurrency_spin.setValue(5)
+        form_layout.addRow('Concurrency:', self.concurrency_spin)
+        
+        self.iterations_spin = QSpinBox()
+        self.iterations_spin.setRange(1, 100000)
+        self.iterations_spin.setValue(1)
+        form_layout.addRow('Iterations:', self.iterations_spin)
+        
+        self.delay_spin = QDoubleSpinBox()
+        self.delay_spin.setRange(0, 60)
+        self.delay_spin.setSingleStep(0.1)
+        self.delay_spin.setSuffix(' s')
+        form_layout.addRow('Delay between requests:', self.delay_spin)
+        
+        layout.addLayout(form_layout)
+        
+        # Run controls
+        run_layout = QHBoxLayout()
+        self.run_button = QPushButton('Run')
+        self.run_button.clicked.connect(self.toggle_run)
+        run_layout.addWidget(self.run_button)
+        
+        self.progress_bar = QProgressBar()
+        run_layout.addWidget(self.progress_bar)
+        layout.addLayout(run_layout)
+        
+        # Results
+        self.results_table = QTableWidget(0, 8)
+        self.results_table.setHorizontalHeaderLabels(['Request', 'Runs', 'Failed', 'Errors',
+                                                      'p50 (ms)', 'p95 (ms)', 'p99 (ms)', 'Messages'])
+        self.results_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        self.results_table.horizontalHeader().setSectionResizeMode(7, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.results_table)
+        
+        self.summary_label = QLabel('')
+        layout.addWidget(self.summary_label)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+        
+        self.setLayout(layout)
+    
+    def toggle_run(self):
+        if self.worker and self.worker.isRunning():
+            self.worker.runner.cancel()
+            self.run_button.setEnabled(False)
+            return
+        
+        runner = CollectionRunner(
+            CollectionRunner.collect_requests(self.node), self.env_manager,
+            concurrency=self.concurrency_spin.value(),
+            iterations=self.iterations_spin.value(),
+            delay=self.delay_spin.value(),
+            http2=self.connection_pool.settings['http2'] and ConnectionPool.http2_available()
+        )
+        if not runner.requests:
+            QMessageBox.warning(self, 'Warning', 'No HTTP or GraphQL requests to run')
+            return
+        
+        self.results_table.setRowCount(0)
+        self.summary_label.setText('')
+        self.progress_bar.setRange(0, len(runner.requests) * runner.iterations)
+        self.progress_bar.setValue(0)
+        self.run_button.setText('Stop')
+        
+        self.worker = CollectionRunWorker(runner)
+        self.worker.progress.connect(lambda done, total: self.progress_bar.setValue(done))
+        self.worker.finished.connect(self.on_run_finished)
+        self.worker.error.connect(self.on_run_error)
+        self.worker.start()
+    
+    def on_run_finished(self, summary):
+        self.run_button.setText('Run')
+        self.run_button.setEnabled(True)
+        
+        self.results_table.setRowCount(len(summary['requests']))
+        for i, result in enumerate(summary['requests']):
+            values = [f"{result['method']} {result['name']}", str(result['runs']), str(result['failed']),
+                      str(result['errors']), f"{result['p50']:.1f}", f"{result['p95']:.1f}", f"{result['p99']:.1f}",
+                      '; '.join(f"{message} (x{count})" for message, count in result['messages'].items())]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column in (2, 3) and value != '0':
+                    item.setForeground(QColor(128, 0, 0))
+                self.results_table.setItem(i, column, item)
+        
+        text = (f"{summary['total']} requests in {summary['duration']:.2f}s "
+                f"({summary['throughput']:.1f} req/s), {summary['failed']} failed tests, {summary['errors']} errors")
+        if summary['skipped']:
+            text += f", {summary['skipped']} WebSocket requests skipped"
+        if summary['cancelled']:
+            text += ' - stopped'
+        self.summary_label.setText(text)
+    
+    def on_run_error(self, error_message):
+        self.run_button.setText('Run')
+        self.run_button.setEnabled(True)
+        QMessageBox.critical(self, 'Run Error', f'Error: {error_message}')
+    
+    def reject(self):
+        if self.worker and self.worker.isRunning():
+            self.worker.runner.cancel()
+            self.worker.wait()
+        super().reject()
+
+
+class LoadChartWidget(QWidget):
+    """Live line chart of a load test: requests/s and errors/s on the left axis, p95 latency on the right"""
+    
+    SERIES = [('requests', 'req/s', QColor(0, 0, 255)),
+              ('errors', 'errors/s', QColor(200, 0, 0)),
+              ('p95', 'p95 ms', QColor(200, 100, 0))]
+    
+    def __init__(self):
+        super().__init__()
+        self.timeline = []
+        self.setMinimumHeight(220)
+    
+    def set_timeline(self, timeline):
+        self.timeline = timeline
+        self.update()
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillRect(self.rect(), QColor(255, 255, 255))
+        
+        left, top, right, bottom = 50, 25, self.width() - 55, self.height() - 25
+        painter.setPen(QPen(QColor(160, 160, 160)))
+        painter.drawRect(left, top, right - left, bottom - top)
+        
+        # Legend
+        x = left
+        for key, label, color in self.SERIES:
+            painter.setPen(QPen(color, 2))
+            painter.drawLine(x, 12, x + 15, 12)
+            painter.setPen(QPen(QColor(0, 0, 0)))
+            painter.drawText(x + 20, 17, label)
+            x += 100
+        
+        if not self.timeline:
+            painter.end()
+            return
+        
+        count_max = max(max(row['requests'] for row in self.timeline), 1)
+        latency_max = max(max(row['p95'] for row in self.timeline), 1)
+        painter.setPen(QPen(QColor(0, 0, 0)))
+        painter.drawText(5, top + 10, f'{count_max}')
+        painter.drawText(right + 5, top + 10, f'{latency_max:.0f}')
+        painter.drawText(left, bottom + 17, '0s')
+        painter.drawText(right - 30, bottom + 17, f"{self.timeline[-1]['second']}s")
+        
+        step = (right - left) / max(len(self.timeline) - 1, 1)
+        for key, label, color in self.SERIES:
+            scale = latency_max if key == 'p95' else count_max
+            points = [(left + i * step, bottom - row[key] / scale * (bottom - top))
+                      for i, row in enumerate(self.timeline)]
+            painter.setPen(QPen(color, 2))
+            for (x1, y1), (x2, y2) in zip(points, points[1:]):
+                painter.drawLine(int(x1), int(y1), int(x2), int(y2))
+        
+        painter.end()
+
+
+class LoadTestDialog(QDialog):
+    PROFILE_NAMES = {'Constant': 'constant', 'Ramp-up': 'ramp-up', 'Step': 'step'}
+    
+    def __init__(self, request: RequestItem, env_manager, connection_pool, parent=None):
+        super().__init__(parent)
+        self.request = request
+        self.env_manager = env_manager
+        self.connection_pool = connection_pool
+        self.worker = None
+        self.init_ui()
+    
+    def init_ui(self):
+        self.setWindowTitle(f'Load Test - {self.request.method} {self.request.name}')
+        self.setModal(True)
+        self.resize(800, 600)
+        
+        layout = QVBoxLayout()
+        
+        environment = self.env_manager.current_environment or 'None'
+        layout.addWidget(QLabel(f'{self.request.method} {self.request.url} (environment: {environment})'))
+        
+        form_layout = QFormLayout()
+        
+        self.users_spin = QSpinBox()
+        self.users_spin.setRange(1, 10000)
+        self.users_spin.setValue(10)
+        form_layout.addRow('Virtual users:', self.users_spin)
+        
+        self.duration_spin = QSpinBox()
+        self.duration_spin.setRange(1, 86400)
+        self.duration_spin.setValue(30)
+        self.duration_spin.setSuffix(' s')
+        form_layout.addRow('Duration:', self.duration_spin)
+        
+        self.profile_combo = QComboBox()
+        self.profile_combo.addItems(list(self.PROFILE_NAMES))
+        self.profile_combo.currentTextChanged.connect(self.on_profile_changed)
+        form_layout.addRow('Profile:', self.profile_combo)
+        
+        self.ramp_spin = QSpinBox()
+        self.ramp_spin.setRange(1, 86400)
+        self.ramp_spin.setValue(10)
+        self.ramp_spin.setSuffix(' s')
+        form_layout.addRow('Ramp-up time:', self.ramp_spin)
+        
+        self.steps_spin = QSpinBox()
+        self.steps_spin.setRange(1, 100)
+        self.steps_spin.setValue(5)
+        form_layout.addRow('Steps:', self.steps_spin)
+        
+        self.think_spin = QDoubleSpinBox()
+        self.think_spin.setRange(0, 60)
+        self.think_spin.setSingleStep(0.1)
+        self.think_spin.setSuffix(' s')
+        form_layout.addRow('Think time:', self.think_spin)
+        
+        layout.addLayout(form_layout)
+        self.on_profile_changed(self.profile_combo.currentText())
+        
+        # Run controls
+        run_layout = QHBoxLayout()
+        self.run_button = QPushButton('Start')
+        self.run_button.clicked.connect(self.toggle_run)
+        run_layout.addWidget(self.run_button)
+        run_layout.addStretch()
+        
+        self.export_csv_button = QPushButton('Export CSV')
+        self.export_csv_button.clicked.connect(lambda: self.export_results('csv'))
+        self.export_csv_button.setEnabled(False)
+        run_layout.addWidget(self.export_csv_button)
+        
+        self.export_json_button = QPushButton('Export JSON')
+        self.export_json_button.clicked.connect(lambda: self.export_results('json'))
+        self.export_json_button.setEnabled(False)
+        run_layout.addWidget(self.export_json_button)
+        layout.addLayout(run_layout)
+        
+        self.chart = LoadChartWidget()
+        layout.addWidget(self.chart)
+        
+        self.summary_label = QLabel('')
+        self.summary_label.setWordWrap(True)
+        layout.addWidget(self.summary_label)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+        
+        self.setLayout(layout)
+    
+    def on_profile_changed(self, profile_name):
+        self.ramp_spin.setEnabled(profile_name == 'Ramp-up')
+        self.steps_spin.setEnabled(profile_name == 'Step')
+    
+    def toggle_run(self):
+        if self.worker and self.worker.isRunning():
+            self.worker.load_test.cancel()
+            self.run_button.setEnabled(False)
+            return
+        
+        load_test = LoadTest(
+            self.request, self.env_manager,
+            users=self.users_spin.value(),
+            duration=self.duration_spin.value(),
+            profile=self.PROFILE_NAMES[self.profile_combo.currentText()],
+            ramp_time=self.ramp_spin.value(),
+            steps=self.steps_spin.value(),
+            think_time=self.think_spin.value(),
+            http2=self.connection_pool.settings['http2'] and ConnectionPool.http2_available()
+        )
+        
+        self.chart.set_timeline([])
+        self.summary_label.setText('Starting...')
+        self.run_button.setText('Stop')
+        self.export_csv_button.setEnabled(False)
+        self.export_json_button.setEnabled(False)
+        
+        self.worker = LoadTestWorker(load_test)
+        self.worker.second.connect(self.on_second)
+        self.worker.finished.connect(self.on_load_test_finished)
+        self.worker.error.connect(self.on_load_test_error)
+        self.worker.start()
+    
+    def on_second(self, row):
+        self.chart.set_timeline(self.chart.timeline + [row])
+        self.summary_label.setText(f"{row['second']}s: {row['users']} users, {row['requests']} req/s, "
+                                   f"{row['errors']} errors, p95 {row['p95']:.1f}ms")
+    
+    def on_load_test_finished(self, summary):
+        self.run_button.setText('Start')
+        self.run_button.setEnabled(True)
+        self.export_csv_button.setEnabled(True)
+        self.export_json_button.setEnabled(True)
+        self.chart.set_timeline(summary['timeline'])
+        
+        latency = summary['latency']
+        status_codes = ', '.join(f'{code}: {count}' for code, count in sorted(summary['status_codes'].items()))
+        text = (f"{summary['total']} requests in {summary['duration']:.1f}s ({summary['throughput']:.1f} req/s), "
+                f"{summary['errors']} errors ({summary['error_rate']:.1%})\n"
+                f"Latency ms - p50: {latency['p50']:.1f}, p90: {latency['p90']:.1f}, p95: {latency['p95']:.1f}, "
+                f"p99: {latency['p99']:.1f}, max: {latency['max']:.1f}\n"
+                f"Status: {status_codes or '-'}")
+        if summary['cancelled']:
+            text += ' - stopped'
+        self.summary_label.setText(text)
+    
+    def on_load_test_error(self, error_message):
+        self.run_button.setText('Start')
+        self.run_button.setEnabled(True)
+        self.summary_label.setText('')
+        QMessageBox.critical(self, 'Load Test Error', f'Error: {error_message}')
+    
+    def export_results(self, fmt):
+        file_path, _ = QFileDialog.getSaveFileName(self, 'Export Results',
+                                                   f'{self.request.name}-load.{fmt}',
+                                                   f'{fmt.upper()} Files (*.{fmt})')
+        if not file_path:
+            return
+        try:
+            if fmt == 'csv':
+                self.worker.load_test.export_csv(file_path)
+            else:
+                self.worker.load_test.export_json(file_path)
+        except Exception as e:
+            QMessageBox.critical(self, 'Error', f'Failed to export results: {e}')
+    
+    def reject(self):
+        if self.worker and self.worker.isRunning():
+            self.worker.load_test.cancel()
+            self.worker.wait()
+        super().reject()
+
+
+class RequestTimer:
+    """Collects httpx trace events into a per-phase timing breakdown"""
+    
+    def __init__(self):
+        self.events = {}
+    
+    def __call__(self, event_name, info):
+        # e.g. 'connection.connect_tcp.started', 'http11.receive_response_headers.complete'
+        self.events.setdefault(event_name, time.perf_counter())
+    
+    def elapsed(self, first, last):
+        """Milliseconds between two events, under their HTTP/1.1 or HTTP/2 names"""
+        for prefix in ('connection.', 'http11.', 'http2.'):
+            if prefix + first in self.events and prefix + last in self.events:
+                return (self.events[prefix + last] - self.events[prefix + first]) * 1000
+        return 0.0
+    
+    def breakdown(self):
+        # httpcore resolves the host inside connect_tcp, so DNS is part of 'connect'
+        return {
+            'connect': self.elapsed('connect_tcp.started', 'connect_tcp.complete'),
+            'tls': self.elapsed('start_tls.started', 'start_tls.complete'),
+            'ttfb': self.elapsed('send_request_headers.started', 'receive_response_headers.complete'),
+            'download': self.elapsed('receive_response_body.started', 'receive_response_body.complete'),
+            'reused': 'connection.connect_tcp.started' not in self.events
+        }
+
+
+class ConnectionPool:
+    """
+    Long-lived httpx clients, one per environment, shared by all HttpWorkers so that
+    repeat requests reuse keep-alive connections instead of paying for DNS, TCP and
+    TLS every time. httpx clients are safe to share between threads. Only the
+    connections are shared: the clients' cookie jars refuse every cookie, so a
+    Set-Cookie never leaks into later requests.
+    """
+    
+    DEFAULTS = {
+        'http2': False,
+        'max_connections': 100,
+        'max_keepalive_connections': 20,
+        'keepalive_expiry': 30.0
+    }
+    
+    def __init__(self):
+        self.settings = dict(self.DEFAULTS)
+        self.clients = {}
+        self.lock = threading.Lock()
+    
+    @staticmethod
+    def http2_available():
+        try:
+            import h2  # noqa: F401 - httpx needs it for http2=True
+            return True
+        except ImportError:
+            return False
+    
+    def get_client(self, environment=None) -> httpx.Client:
+        with self.lock:
+            client = self.clients.get(environment)
+            if client is None:
+                limits = httpx.Limits(
+                    max_connections=self.settings['max_connections'],
+                    max_keepalive_connections=self.settings['max_keepalive_connections'],
+                    keepalive_expiry=self.settings['keepalive_expiry']
+                )
+                client = httpx.Client(
+                    verify=False,  # Disable SSL verification for testing
+                    http2=self.settings['http2'] and self.http2_available(),
+                    limits=limits,
+                    cookies=http.cookiejar.CookieJar(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+                )
+                self.clients[environment] = client
+            return client
+    
+    def configure(self, **settings):
+        self.settings.update(settings)
+        self.close()
+    
+    def close(self):
+        with self.lock:
+            clients = list(self.clients.values())
+            self.clients = {}
+        for client in clients:
+            client.close()
+
+
 class HttpWorker(QThread):
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
+    progress = pyqtSignal(int, int)  # Bytes received, Content-Length (0 if unknown)
     
-    def __init__(self, method, url, headers, params, body, request_type='HTTP', graphql_query='', graphql_variables='{}', timeout=30):
+    # Bodies are streamed to a temp file; only this much is kept in memory for display
+    PREVIEW_BYTES = 256 * 1024
+    
+    def __init__(self, method, url, headers, params, body, request_type='HTTP', graphql_query='', graphql_variables='{}', timeout=30, client=None):
         super().__init__()
+        self.client = client  # Shared ConnectionPool client; None for a one-off connection
         self.method = method
         self.url = url
         self.headers = headers
@@ -2124,33 +3114,44 @@ class HttpWorker(QThread):
                 }
                 self.body = json.dumps(graphql_body)
             
-            with httpx.Client(timeout=self.timeout, verify=False) as client:  # Disable SSL verification for testing
-                if self.method.upper() == 'GET':
-                    response = client.get(self.url, headers=self.headers, params=self.params)
-                elif self.method.upper() == 'POST':
-                    response = client.post(self.url, headers=self.headers, params=self.params, content=self.body)
-                elif self.method.upper() == 'PUT':
-                    response = client.put(self.url, headers=self.headers, params=self.params, content=self.body)
-                elif self.method.upper() == 'DELETE':
-                    response = client.delete(self.url, headers=self.headers, params=self.params)
-                elif self.method.upper() == 'PATCH':
-                    response = client.patch(self.url, headers=self.headers, params=self.params, content=self.body)
-                elif self.method.upper() == 'HEAD':
-                    response = client.head(self.url, headers=self.headers, params=self.params)
-                elif self.method.upper() == 'OPTIONS':
-                    response = client.options(self.url, headers=self.headers, params=self.params)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {self.method}")
+            method = self.method.upper()
+            if method not in ('GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS'):
+                raise ValueError(f"Unsupported HTTP method: {self.method}")
+            content = self.body if method in ('POST', 'PUT', 'PATCH') else None
+            
+            timer = RequestTimer()
+            client = self.client or httpx.Client(verify=False)  # Disable SSL verification for testing
+            try:
+                with client.stream(method, self.url, headers=self.headers, params=self.params,
+                                   content=content, timeout=self.timeout,
+                                   extensions={'trace': timer}) as response:
+                    body_file, preview, size = self.read_body(response)
+            finally:
+                if client is not self.client:
+                    client.close()
             
             end_time = time.time()
             response_time = (end_time - start_time) * 1000  # Convert to milliseconds
             
+            truncated = size > len(preview)
+            encoding = response.encoding or 'utf-8'
+            try:
+                decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+            except LookupError:
+                encoding = 'utf-8'
+                decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+            
             result = {
                 'status_code': response.status_code,
                 'headers': dict(response.headers),
-                'body': response.text,
+                'body': decoder.decode(preview, final=not truncated),  # Whole body unless truncated
+                'body_file': body_file,
+                'encoding': encoding,
+                'truncated': truncated,
                 'response_time': response_time,
-                'size': len(response.content),
+                'timings': timer.breakdown(),
+                'http_version': response.http_version,
+                'size': size,
                 'url': str(response.url),
                 'request_headers': self.headers,
                 'request_params': self.params,
@@ -2162,6 +3163,98 @@ class HttpWorker(QThread):
             
         except Exception as e:
             self.error.emit(str(e))
+    
+    def read_body(self, response):
+        """Write the body to a temp file as it arrives; returns (path, first PREVIEW_BYTES, size)"""
+        try:
+            total = int(response.headers.get('Content-Length', 0))
+        except ValueError:
+            total = 0
+        preview = bytearray()
+        size = 0
+        last_progress = 0.0
+        
+        body_file = tempfile.NamedTemporaryFile(prefix='api-tool-', suffix='.body', delete=False)
+        try:
+            with body_file:
+                for chunk in response.iter_bytes():
+                    body_file.write(chunk)
+                    size += len(chunk)
+                    if len(preview) < self.PREVIEW_BYTES:
+                        preview += chunk[:self.PREVIEW_BYTES - len(preview)]
+                    
+                    # Throttled: a signal per chunk would flood the GUI thread
+                    now = time.perf_counter()
+                    if now - last_progress >= 0.1:
+                        self.progress.emit(response.num_bytes_downloaded, total)
+                        last_progress = now
+        except BaseException:
+            os.remove(body_file.name)
+            raise
+        
+        return body_file.name, bytes(preview), size
+    
+    @staticmethod
+    def read_full_body(response_data) -> str:
+        """The whole body as text, from the temp file when the in-memory one is only a preview"""
+        if not response_data.get('truncated'):
+            return response_data.get('body', '')
+        with open(response_data['body_file'], 'r', encoding=response_data['encoding'], errors='replace') as f:
+            return f.read()
+
+
+class CollectionRunWorker(QThread):
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(dict)
+    error = pyqtSignal(str)
+    
+    def __init__(self, runner: CollectionRunner):
+        super().__init__()
+        self.runner = runner
+    
+    def run(self):
+        try:
+            # Runs on this thread's own event loop
+            self.runner.on_progress = self.progress.emit
+            summary = asyncio.run(self.runner.run())
+            self.finished.emit(summary)
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class LoadTestWorker(QThread):
+    second = pyqtSignal(dict)
+    finished = pyqtSignal(dict)
+    error = pyqtSignal(str)
+    
+    def __init__(self, load_test: LoadTest):
+        super().__init__()
+        self.load_test = load_test
+    
+    def run(self):
+        try:
+            self.load_test.on_second = self.second.emit
+            summary = asyncio.run(self.load_test.run())
+            self.finished.emit(summary)
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class FullBodyWorker(QThread):
+    """Reads a truncated response body from its temp file, for tests and plugins"""
+    finished = pyqtSignal(dict)
+    error = pyqtSignal(str)
+    
+    def __init__(self, response_data):
+        super().__init__()
+        self.response_data = response_data
+    
+    def run(self):
+        try:
+            body = HttpWorker.read_full_body(self.response_data)
+            self.finished.emit(dict(self.response_data, body=body))
+        except Exception as e:
+            self.error.emit(str(e))
 
 
 class HeadersWidget(QWidget):
@@ -2395,8 +3488,12 @@ class BodyWidget(QWidget):
 
 
 class ResponseWidget(QWidget):
+    # Larger bodies are shown as received; pretty-printing waits for the Pretty Print button
+    AUTO_PRETTY_BYTES = 64 * 1024
+    
     def __init__(self):
         super().__init__()
+        self.response_data = None
         self.init_ui()
     
     def init_ui(self):
@@ -2421,15 +3518,44 @@ class ResponseWidget(QWidget):
         
         layout.addLayout(self.status_bar)
         
+        # Connection timing breakdown
+        self.timing_label = QLabel('')
+        self.timing_label.setStyleSheet("color: gray; font-size: 11px;")
+        layout.addWidget(self.timing_label)
+        
         # Response tabs
         self.response_tabs = QTabWidget()
         
         # Body tab
-        self.body_text = QTextEdit()
+        body_widget = QWidget()
+        body_layout = QVBoxLayout()
+        body_layout.setContentsMargins(0, 0, 0, 0)
+        
+        body_toolbar = QHBoxLayout()
+        self.preview_label = QLabel('')
+        self.preview_label.setStyleSheet("color: gray; font-size: 11px;")
+        body_toolbar.addWidget(self.preview_label)
+        body_toolbar.addStretch()
+        
+        self.pretty_btn = QPushButton('Pretty Print')
+        self.pretty_btn.clicked.connect(self.pretty_print_body)
+        self.pretty_btn.setEnabled(False)
+        body_toolbar.addWidget(self.pretty_btn)
+        
+        self.save_body_btn = QPushButton('Save Body')
+        self.save_body_btn.clicked.connect(self.save_body)
+        self.save_body_btn.setEnabled(False)
+        body_toolbar.addWidget(self.save_body_btn)
+        body_layout.addLayout(body_toolbar)
+        
+        self.body_text = QPlainTextEdit()
         self.body_text.setFont(QFont('Consolas', 10))
         self.body_text.setReadOnly(True)
         self.highlighter = JsonHighlighter(self.body_text.document())
-        self.response_tabs.addTab(self.body_text, 'Body')
+        body_layout.addWidget(self.body_text)
+        
+        body_widget.setLayout(body_layout)
+        self.response_tabs.addTab(body_widget, 'Body')
         
         # Headers tab
         self.headers_table = QTableWidget(0, 2)
@@ -2443,6 +3569,10 @@ class ResponseWidget(QWidget):
         self.current_url = None
     
     def display_response(self, response_data: Dict[str, Any]):
+        # The previous response's temp file is no longer needed
+        self.discard_body_file()
+        self.response_data = response_data
+        
         # Update status bar
         status_code = response_data['status_code']
         status_text = f"Status: {status_code}"
@@ -2458,6 +3588,7 @@ class ResponseWidget(QWidget):
         
         self.time_label.setText(f"Time: {response_data['response_time']:.2f}ms")
         self.size_label.setText(f"Size: {self.format_size(response_data['size'])}")
+        self.timing_label.setText(self.format_timings(response_data))
         
         # Show SSL button for HTTPS URLs
         self.current_url = response_data.get('url', '')
@@ -2468,13 +3599,18 @@ class ResponseWidget(QWidget):
         
         # Display body
         body = response_data['body']
-        try:
-            # Try to format as JSON
-            formatted_body = json.dumps(json.loads(body), indent=2)
-            self.body_text.setPlainText(formatted_body)
-        except (json.JSONDecodeError, TypeError):
-            # Display as plain text
-            self.body_text.setPlainText(body)
+        if response_data.get('truncated'):
+            self.preview_label.setText(f"Showing the first {self.format_size(HttpWorker.PREVIEW_BYTES)} "
+                                       f"of {self.format_size(response_data['size'])}")
+        else:
+            self.preview_label.setText('')
+        self.save_body_btn.setEnabled(bool(response_data.get('body_file')))
+        self.pretty_btn.setEnabled(body.lstrip()[:1] in ('{', '['))
+        
+        if response_data['size'] <= self.AUTO_PRETTY_BYTES:
+            self.pretty_print_body()
+        else:
+            self.highlighter.set_plain_text(self.body_text, body)
         
         # Display headers
         headers = response_data['headers']
@@ -2483,6 +3619,77 @@ class ResponseWidget(QWidget):
             self.headers_table.setItem(i, 0, QTableWidgetItem(key))
             self.headers_table.setItem(i, 1, QTableWidgetItem(value))
     
+    def pretty_print_body(self):
+        if not self.response_data:
+            return
+        body = self.response_data['body']
+        if self.response_data.get('truncated'):
+            # json.loads can't parse a cut-off document, so re-indent token by token
+            if body.lstrip()[:1] in ('{', '['):
+                self.highlighter.set_plain_text(self.body_text, self.indent_json(body))
+            else:
+                self.highlighter.set_plain_text(self.body_text, body)
+        else:
+            try:
+                # Try to format as JSON
+                self.highlighter.set_plain_text(self.body_text, json.dumps(json.loads(body), indent=2))
+            except (json.JSONDecodeError, TypeError):
+                # Display as plain text
+                self.highlighter.set_plain_text(self.body_text, body)
+        self.pretty_btn.setEnabled(False)
+    
+    @staticmethod
+    def indent_json(text: str, indent: int = 2) -> str:
+        """Indent JSON text without parsing it, so a truncated document still comes out readable"""
+        tokens = re.findall(r'"(?:[^"\\]|\\.)*"?|[{}\[\],:]|[^\s{}\[\],:"]+', text)
+        out = []
+        depth = 0
+        for i, token in enumerate(tokens):
+            if token in ('{', '['):
+                depth += 1
+                closing = '}' if token == '{' else ']'
+                if i + 1 < len(tokens) and tokens[i + 1] == closing:
+                    out.append(token)
+                else:
+                    out.append(token + '\n' + ' ' * indent * depth)
+            elif token in ('}', ']'):
+                depth = max(0, depth - 1)
+                if i > 0 and tokens[i - 1] in ('{', '['):
+                    out.append(token)
+                else:
+                    out.append('\n' + ' ' * indent * depth + token)
+            elif token == ',':
+                out.append(',\n' + ' ' * indent * depth)
+            elif token == ':':
+                out.append(': ')
+            else:
+                out.append(token)
+        return ''.join(out)
+    
+    def save_body(self):
+        if not self.response_data or not self.response_data.get('body_file'):
+            return
+        file_path, _ = QFileDialog.getSaveFileName(self, 'Save Response Body', 'response.txt', 'All Files (*)')
+        if file_path:
+            try:
+                shutil.copyfile(self.response_data['body_file'], file_path)
+            except OSError as e:
+                QMessageBox.critical(self, 'Error', f'Failed to save body: {e}')
+    
+    def show_progress(self, received: int, total: int):
+        if total:
+            self.size_label.setText(f"Size: {self.format_size(received)} / {self.format_size(total)}")
+        else:
+            self.size_label.setText(f"Size: {self.format_size(received)}")
+    
+    def discard_body_file(self):
+        if self.response_data and self.response_data.get('body_file'):
+            try:
+                os.remove(self.response_data['body_file'])
+            except OSError:
+                pass
+        self.response_data = None
+    
     def show_ssl_info(self):
         if not self.current_url:
             return
@@ -2512,6 +3719,22 @@ Version: {ssl_info.get('version', 'Unknown')}
             msg.setIcon(QMessageBox.Icon.Information)
             msg.exec()
     
+    def format_timings(self, response_data: Dict[str, Any]) -> str:
+        timings = response_data.get('timings')
+        if not timings:
+            return ''
+        if timings['reused']:
+            parts = ['Reused connection']
+        else:
+            parts = [f"DNS + connect: {timings['connect']:.0f}ms"]
+            if timings['tls']:
+                parts.append(f"TLS: {timings['tls']:.0f}ms")
+        parts.append(f"TTFB: {timings['ttfb']:.0f}ms")
+        parts.append(f"Download: {timings['download']:.0f}ms")
+        if response_data.get('http_version'):
+            parts.append(response_data['http_version'])
+        return '  |  '.join(parts)
+    
     def format_size(self, size_bytes: int) -> str:
         if size_bytes == 0:
             return "0 B"
@@ -2527,10 +3750,15 @@ Version: {ssl_info.get('version', 'Unknown')}
         self.status_label.setStyleSheet('')
         self.time_label.setText('Time: -')
         self.size_label.setText('Size: -')
+        self.timing_label.setText('')
         self.ssl_btn.setVisible(False)
-        self.body_text.setPlainText('')
+        self.highlighter.set_plain_text(self.body_text, '')
+        self.preview_label.setText('')
+        self.pretty_btn.setEnabled(False)
+        self.save_body_btn.setEnabled(False)
         self.headers_table.setRowCount(0)
         self.current_url = None
+        self.discard_body_file()
 
 
 class CollectionTreeWidget(QTreeWidget):
@@ -2595,12 +3823,15 @@ class CollectionTreeWidget(QTreeWidget):
             if data[0] == 'collection':
                 menu.addAction('New Request', lambda: self.add_request(data[1]))
                 menu.addAction('New Folder', lambda: self.add_folder(data[1]))
+                menu.addAction('Run Collection', lambda: self.run_requests(data[1]))
                 menu.addAction('Export Collection', lambda: self.export_collection(data[1]))
                 menu.addAction('Delete Collection', lambda: self.delete_collection(data[1]))
             elif data[0] == 'folder':
                 menu.addAction('New Request', lambda: self.add_request_to_folder(data[1]))
+                menu.addAction('Run Folder', lambda: self.run_requests(data[1]))
                 menu.addAction('Delete Folder', lambda: self.delete_folder(data[1]))
             elif data[0] == 'request':
+                menu.addAction('Load Test', lambda: self.load_test(data[1]))
                 menu.addAction('Duplicate Request', lambda: self.duplicate_request(data[1]))
                 menu.addAction('Delete Request', lambda: self.delete_request(data[1]))
         
@@ -2633,6 +3864,17 @@ class CollectionTreeWidget(QTreeWidget):
                 self.parent_app.save_all_data()
             self.refresh_collections()
     
+    def run_requests(self, node):
+        dialog = CollectionRunnerDialog(node, self.parent_app.env_manager, self.parent_app.connection_pool, self)
+        dialog.exec()
+    
+    def load_test(self, request: RequestItem):
+        if request.request_type == 'WebSocket':
+            QMessageBox.warning(self, 'Warning', 'WebSocket requests cannot be load tested')
+            return
+        dialog = LoadTestDialog(request, self.parent_app.env_manager, self.parent_app.connection_pool, self)
+        dialog.exec()
+    
     def export_collection(self, collection: Collection):
         file_path, _ = QFileDialog.getSaveFileName(self, 'Export Collection', 
                                                  f'{collection.name}.json', 
@@ -2715,6 +3957,8 @@ class ApiTestingTool(QMainWindow):
         self.collection_manager = CollectionManager(self.data_manager)
         self.request_history = RequestHistory(self.data_manager)
         self.plugin_manager = PluginManager()
+        self.connection_pool = ConnectionPool()
+        self.body_worker = None  # Reads truncated bodies for plugins
         self.current_request = None
         
         self.init_ui()
@@ -3123,6 +4367,10 @@ class ApiTestingTool(QMainWindow):
         ssl_info_action.triggered.connect(self.check_ssl_certificate)
         tools_menu.addAction(ssl_info_action)
         
+        connection_settings_action = QAction('Connection Settings', self)
+        connection_settings_action.triggered.connect(self.connection_settings)
+        tools_menu.addAction(connection_settings_action)
+        
         # Plugins menu
         plugins_menu = menubar.addMenu('Plugins')
         
@@ -3389,6 +4637,13 @@ class ApiTestingTool(QMainWindow):
             self.request_history.clear_history()
             self.history_widget.refresh_history()
     
+    def connection_settings(self):
+        if self.http_worker and self.http_worker.isRunning():
+            QMessageBox.warning(self, 'Warning', 'Wait for the current request to finish')
+            return
+        dialog = ConnectionSettingsDialog(self.connection_pool, self)
+        dialog.exec()
+    
     def check_ssl_certificate(self):
         url = self.url_input.text().strip()
         if not url:
@@ -3441,7 +4696,27 @@ Version: {ssl_info.get('version', 'Unknown')}
             'body': self.body_widget.get_body()
         }
         
-        result, error = self.plugin_manager.execute_plugin(plugin_name, request_data, self.last_response_data)
+        # Plugins see the whole body: past the preview it is read from the temp file off the GUI thread
+        if self.last_response_data.get('truncated'):
+            if self.body_worker and self.body_worker.isRunning():
+                return
+            self.statusBar().showMessage(f"Loading the response body for {plugin_name}...")
+            self.body_worker = FullBodyWorker(self.last_response_data)
+            self.body_worker.finished.connect(
+                lambda response_data: self.execute_plugin(plugin_name, request_data, response_data))
+            self.body_worker.error.connect(self.on_full_body_error)
+            self.body_worker.start()
+            return
+        
+        self.execute_plugin(plugin_name, request_data, self.last_response_data)
+    
+    def on_full_body_error(self, error_message):
+        self.statusBar().clearMessage()
+        QMessageBox.critical(self, 'Plugin Error', f'Cannot read the response body: {error_message}')
+    
+    def execute_plugin(self, plugin_name, request_data, response_data):
+        self.statusBar().clearMessage()
+        result, error = self.plugin_manager.execute_plugin(plugin_name, request_data, response_data)
         
         if error:
             QMessageBox.critical(self, 'Plugin Error', f'Plugin execution failed: {error}')
@@ -3572,6 +4847,12 @@ Version: {ssl_info.get('version', 'Unknown')}
             if hasattr(self, 'auto_save_timer'):
                 self.auto_save_timer.stop()
             
+            # Close pooled keep-alive connections
+            self.connection_pool.close()
+            
+            # Remove the last response's temp file
+            self.response_widget.discard_body_file()
+            
             # Perform final save if we have encryption set up
             if self.master_password:
                 # Save without asking - auto-save should handle this gracefully
@@ -3688,11 +4969,20 @@ Version: {ssl_info.get('version', 'Unknown')}
         self.response_widget.clear_response()
         
         # Start HTTP request in worker thread
-        self.http_worker = HttpWorker(method, url, headers, params, body, request_type, graphql_query, graphql_variables)
+        client = self.connection_pool.get_client(self.env_manager.current_environment)
+        self.http_worker = HttpWorker(method, url, headers, params, body, request_type, graphql_query, graphql_variables,
+                                      client=client)
         self.http_worker.finished.connect(self.on_request_finished)
         self.http_worker.error.connect(self.on_request_error)
+        self.http_worker.progress.connect(self.on_request_progress)
         self.http_worker.start()
     
+    def on_request_progress(self, received, total):
+        if total:
+            self.progress_bar.setRange(0, total)
+            self.progress_bar.setValue(min(received, total))
+        self.response_widget.show_progress(received, total)
+    
     def on_request_finished(self, response_data):
         self.progress_bar.setVisible(False)
         self.send_button.setEnabled(True)
@@ -3724,7 +5014,95 @@ Version: {ssl_info.get('version', 'Unknown')}
         QMessageBox.critical(self, 'Request Error', f'Error: {error_message}')
 
 
+def run_collection_cli(argv) -> int:
+    """Headless collection run: python tool.py run COLLECTION [options]"""
+    parser = argparse.ArgumentParser(prog='tool.py run', description='Run a collection or folder without the GUI')
+    parser.add_argument('collection', help='Collection name')
+    parser.add_argument('--folder', help='Run only this folder of the collection')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--data-file', help='Encrypted data file (password from $API_TOOL_PASSWORD or prompted)')
+    source.add_argument('--collections', help='Exported collections.json, or a single exported collection')
+    parser.add_argument('--environments', help='Exported environments.json (with --collections)')
+    parser.add_argument('--environment', help='Environment to use (default: the saved current one)')
+    parser.add_argument('--var', action='append', default=[], metavar='KEY=VALUE', help='Override a variable')
+    parser.add_argument('--concurrency', type=int, default=5, help='Requests in flight (default: 5)')
+    parser.add_argument('--iterations', type=int, default=1, help='Times to run every request (default: 1)')
+    parser.add_argument('--delay', type=float, default=0.0, help='Seconds between requests per worker')
+    parser.add_argument('--timeout', type=float, default=30, help='Request timeout in seconds (default: 30)')
+    parser.add_argument('--http2', action='store_true', help='Use HTTP/2 (needs the h2 package)')
+    parser.add_argument('--output', help='Write the results as JSON to this file')
+    args = parser.parse_args(argv)
+    
+    # Load the same data the GUI would
+    try:
+        if args.data_file:
+            password = os.environ.get('API_TOOL_PASSWORD') or getpass.getpass(f'Password for {args.data_file}: ')
+            all_data = DataManager(DataEncryption(), args.data_file).load_all_data(password)
+        else:
+            with open(args.collections, 'r') as f:
+                data = json.load(f)
+            all_data = {'collections': data if 'collections' in data else {'collections': [data]}}
+            if args.environments:
+                with open(args.environments, 'r') as f:
+                    all_data['environments'] = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Error loading data: {e}", file=sys.stderr)
+        return 2
+    
+    env_manager = EnvironmentManager()
+    env_manager.load_environments(all_data)
+    collection_manager = CollectionManager()
+    collection_manager.load_collections(all_data)
+    
+    if args.environment:
+        if args.environment not in env_manager.environments:
+            print(f"Unknown environment: {args.environment}", file=sys.stderr)
+            return 2
+        env_manager.set_current_environment(args.environment)
+    for assignment in args.var:
+        key, _, value = assignment.partition('=')
+        env_manager.set_variable(key.strip(), value, is_global=not env_manager.current_environment)
+    
+    node = next((col for col in collection_manager.collections if col.name == args.collection), None)
+    if node and args.folder:
+        node = next((folder for folder in node.folders if folder.name == args.folder), None)
+    if not node:
+        print(f"Not found: {args.collection}{' / ' + args.folder if args.folder else ''}", file=sys.stderr)
+        return 2
+    
+    runner = CollectionRunner(CollectionRunner.collect_requests(node), env_manager,
+                              concurrency=args.concurrency, iterations=args.iterations,
+                              delay=args.delay, timeout=args.timeout,
+                              http2=args.http2 and ConnectionPool.http2_available())
+    try:
+        summary = asyncio.run(runner.run())
+    except KeyboardInterrupt:
+        return 130
+    
+    print(f"{'Request':<40}{'Runs':>7}{'Failed':>8}{'Errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for result in summary['requests']:
+        name = f"{result['method']} {result['name']}"[:39]
+        print(f"{name:<40}{result['runs']:>7}{result['failed']:>8}{result['errors']:>8}"
+              f"{result['p50']:>10.1f}{result['p95']:>10.1f}{result['p99']:>10.1f}")
+        for message, count in result['messages'].items():
+            print(f"    {message} (x{count})")
+    print(f"\n{summary['total']} requests in {summary['duration']:.2f}s ({summary['throughput']:.1f} req/s), "
+          f"{summary['failed']} failed tests, {summary['errors']} errors")
+    if summary['skipped']:
+        print(f"{summary['skipped']} WebSocket requests skipped")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(summary, f, indent=2)
+    
+    return 1 if summary['failed'] or summary['errors'] else 0
+
+
 def main():
+    # Headless collection runs skip the GUI entirely
+    if len(sys.argv) > 1 and sys.argv[1] == 'run':
+        sys.exit(run_collection_cli(sys.argv[2:]))
+    
     app = QApplication(sys.argv)
     
     # Create plugins directory if it doesn't exist